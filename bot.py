@@ -37,6 +37,7 @@ from services.rss_reader import RSSReader
 from services.run_state import RunStateStore
 from services.runtime_paths import bootstrap_runtime_paths
 from services.sender import ResendSender
+from services.slack_poster import SlackPoster
 from services.slack_reader import SlackReader
 from services.writer import NewsletterWriter
 
@@ -111,7 +112,7 @@ def _build_runtime(config: AppConfig) -> BotRuntime:
         renderer=renderer,
         formatter=formatter,
         sender=sender,
-        slack_client=app.client,
+        slack_client=SlackPoster(config.slack_bot_token),
         logger=logger,
     )
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, StrEnum
@@ -44,7 +45,7 @@ class RunStage(StrEnum):
     BRAIN_UPDATED = "brain_updated"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StoryCandidate:
     """Candidate story assembled from RSS/Perplexity sources."""
 
@@ -57,6 +58,30 @@ class StoryCandidate:
     summary: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def with_updates(
+        self,
+        metadata_updates: Mapping[str, Any],
+        *,
+        source_url: str | None = None,
+        source_tier: SourceTier | None = None,
+        confidence: Confidence | None = None,
+    ) -> StoryCandidate:
+        """Return a copy with merged metadata and any overridden trust fields.
+
+        Calls the constructor directly; ``dataclasses.replace`` re-reads the
+        field list on every call, which adds up across per-story quality passes.
+        """
+        return StoryCandidate(
+            title=self.title,
+            source_url=self.source_url if source_url is None else source_url,
+            source_name=self.source_name,
+            published_at=self.published_at,
+            confidence=self.confidence if confidence is None else confidence,
+            source_tier=self.source_tier if source_tier is None else source_tier,
+            summary=self.summary,
+            metadata={**self.metadata, **metadata_updates},
+        )
+
 
 @dataclass(frozen=True)
 class TeamUpdate:
@@ -105,7 +130,7 @@ class FeedbackEvent:
     draft_version: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunLedgerRecord:
     """Persistent run state row from SQLite ledger."""
 
@@ -117,7 +142,7 @@ class RunLedgerRecord:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DraftStateRecord:
     """Persistent draft state row from SQLite ledger."""
 
@@ -7,15 +7,26 @@ from datetime import UTC, datetime
 from pathlib import Path
 
 from config import AppConfig
+from services.run_state import RunStateStore
 
 
-def backup_run_state_db(config: AppConfig) -> Path | None:
-    """Create/refresh run_state.db.bak when DB exists."""
+def backup_run_state_db(config: AppConfig, store: RunStateStore) -> Path | None:
+    """Create/refresh run_state.db.bak when DB exists.
+
+    Goes through the store's open connection: a plain file copy would miss
+    writes still sitting in the WAL file. The store holds its connection lock
+    for the whole copy, so a backup running on a worker thread sees one
+    consistent snapshot; it is written beside the target and renamed into
+    place so the previous ``.bak`` survives a failed copy.
+    """
     db_path = config.run_state_db_path
     if not db_path.exists():
         return None
     backup_path = db_path.with_suffix(db_path.suffix + ".bak")
-    shutil.copy2(db_path, backup_path)
+    partial_path = backup_path.with_suffix(backup_path.suffix + ".tmp")
+    partial_path.unlink(missing_ok=True)
+    store.backup(partial_path)
+    partial_path.replace(backup_path)
     return backup_path
 
 
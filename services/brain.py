@@ -7,6 +7,7 @@ import tempfile
 from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -67,12 +68,28 @@ def append_published_stories(
 
 def read_published_stories(path: Path) -> list[PublishedStory]:
     """Parse published stories from the markdown memory file."""
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
         return []
 
+    # Writes go through os.replace, so inode/mtime/size change on every append.
+    return list(_read_published_cached(str(path), stat.st_ino, stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=4)
+def _read_published_cached(
+    path: str,
+    inode: int,
+    mtime_ns: int,
+    size: int,
+) -> tuple[PublishedStory, ...]:
+    """Parse the brain file once per on-disk version."""
+    del inode, mtime_ns, size  # cache key only
+
     entries: list[PublishedStory] = []
     current_date: str | None = None
-    for raw_line in path.read_text(encoding="utf-8").splitlines():
+    for raw_line in Path(path).read_text(encoding="utf-8").splitlines():
         line = raw_line.strip()
         if line.startswith("## "):
             current_date = line.removeprefix("## ").strip()
@@ -92,7 +109,7 @@ def read_published_stories(path: Path) -> list[PublishedStory]:
             )
         )
 
-    return entries
+    return tuple(entries)
 
 
 @contextmanager
@@ -8,6 +8,8 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 
 @dataclass(frozen=True)
 class CompositionFailure(RuntimeError):
@@ -31,27 +33,61 @@ class CompositionFailure(RuntimeError):
         )
 
 
+def compact_json(payload: dict[str, Any]) -> str:
+    """Serialize prompt input with sorted keys and no whitespace.
+
+    Indentation only helps human readers but is billed as input tokens, and
+    sorted keys keep the text stable across runs for caching.
+    """
+    return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode()
+
+
+def repair_followups(*, invalid_output: str, error_message: str) -> list[dict[str, str]]:
+    """Return chat turns asking the model to fix its last invalid reply.
+
+    Sent after the unchanged original prompt, so retries reuse it as a cached
+    prefix rather than paying for it again inside a combined repair prompt.
+    """
+    return [
+        {"role": "assistant", "content": invalid_output},
+        {
+            "role": "user",
+            "content": (
+                "Your previous output was invalid. Repair and return only valid JSON.\n"
+                f"Validation error: {error_message}"
+            ),
+        },
+    ]
+
+
 def save_composition_dead_letter(
     *,
     failure_dir: Path,
     stage: str,
     attempts: int,
     error_summary: str,
-    input_payload: dict[str, Any],
+    input_payload_json: str,
     last_model_output: str | None,
 ) -> Path:
-    """Persist composition failure payload for later replay/debug."""
+    """Persist composition failure payload for later replay/debug.
+
+    ``input_payload_json`` is the already-serialized prompt input; it is
+    embedded as the ``input_payload`` value verbatim instead of being parsed
+    and encoded again.
+    """
     failure_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
     path = failure_dir / f"composition_{stage}_{timestamp}.json"
 
-    payload = {
-        "stage": stage,
-        "attempts": attempts,
-        "error_summary": error_summary,
-        "input_payload": input_payload,
-        "last_model_output": last_model_output,
-        "created_at": datetime.now(UTC).isoformat(),
+    # Every value is a JSON fragment, so the record is joined directly.
+    fields = {
+        "stage": json.dumps(stage),
+        "attempts": json.dumps(attempts),
+        "error_summary": json.dumps(error_summary),
+        "input_payload": input_payload_json,
+        "last_model_output": json.dumps(last_model_output),
+        "created_at": json.dumps(datetime.now(UTC).isoformat()),
     }
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    body = ",\n".join(f"  {json.dumps(key)}: {value}" for key, value in sorted(fields.items()))
+    path.write_text(f"{{\n{body}\n}}", encoding="utf-8")
     return path
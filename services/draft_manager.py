@@ -4,8 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import cached_property
 from typing import Any
 
+import orjson
+
 from config import AppConfig
 from models import DraftStatus
 from services.run_state import RunStateStore
@@ -23,6 +26,20 @@ class DraftContext:
     draft_html: str | None
     updated_at: datetime
 
+    @cached_property
+    def draft_dict(self) -> dict[str, Any]:
+        """Return ``draft_json`` parsed once per context.
+
+        The dict is shared by every caller of this context; copy it before
+        mutating if the original draft must remain intact.
+        """
+        if self.draft_json is None:
+            raise ValueError("Draft JSON missing")
+        data = orjson.loads(self.draft_json)
+        if not isinstance(data, dict):
+            raise ValueError("Expected JSON object payload")
+        return data
+
 
 class DraftManager:
     """Manage persisted draft lifecycle state."""
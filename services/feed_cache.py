@@ -0,0 +1,68 @@
+"""Persistent cache of RSS feed bodies for conditional GET requests."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+from services.sqlite_cache import SqliteCache
+
+FEED_CACHE_FILE_NAME = "rss_feeds.sqlite"
+
+
+@dataclass(frozen=True)
+class CachedFeed:
+    """Last successful feed body with the validators the server sent for it."""
+
+    etag: str | None
+    last_modified: str | None
+    content: bytes
+
+
+class FeedResponseCache(SqliteCache):
+    """SQLite-backed store of feed bodies keyed by feed URL.
+
+    Only responses carrying an ``ETag`` or ``Last-Modified`` header are worth
+    keeping: those are replayed as ``If-None-Match`` / ``If-Modified-Since`` so
+    an unchanged feed answers ``304`` with no body.
+    """
+
+    _LABEL = "RSS feed"
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS feed_responses (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            content BLOB NOT NULL,
+            fetched_at INTEGER NOT NULL
+        )
+    """
+
+    def get(self, url: str) -> CachedFeed | None:
+        """Return the cached body for ``url``, or ``None`` on a miss."""
+        with self._errors_as_misses("read"), self._connect() as conn:
+            row = conn.execute(
+                "SELECT etag, last_modified, content FROM feed_responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            etag, last_modified, content = row
+            return CachedFeed(etag=etag, last_modified=last_modified, content=bytes(content))
+        return None
+
+    def put(self, url: str, feed: CachedFeed) -> None:
+        """Store the latest body and validators for ``url``."""
+        with self._errors_as_misses("write"), self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO feed_responses (url, etag, last_modified, content, fetched_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    content = excluded.content,
+                    fetched_at = excluded.fetched_at
+                """,
+                (url, feed.etag, feed.last_modified, feed.content, int(time.time())),
+            )
@@ -0,0 +1,95 @@
+"""Persistent cache of resolved Google News article URLs."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Collection, Mapping
+from pathlib import Path
+
+from services.sqlite_cache import SqliteCache
+
+GOOGLE_NEWS_CACHE_FILE_NAME = "google_news_urls.sqlite"
+
+_RESOLVED_TTL_SECONDS = 30 * 24 * 60 * 60
+_UNRESOLVED_TTL_SECONDS = 24 * 60 * 60
+
+# Stay well under SQLite's default host-parameter limit for IN (...) lookups.
+_MAX_QUERY_PARAMS = 500
+
+
+class GoogleNewsUrlCache(SqliteCache):
+    """SQLite-backed map of Google News RSS URLs to their publisher URLs.
+
+    Article paths are stable, so a resolved URL is kept for 30 days. Failed
+    resolutions are stored as ``NULL`` for a day so a dead link is not retried
+    on every run but still gets another chance later.
+    """
+
+    _LABEL = "Google News URL"
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS google_news_urls (
+            rss_url TEXT PRIMARY KEY,
+            resolved_url TEXT,
+            resolved_at INTEGER NOT NULL
+        )
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        resolved_ttl_seconds: int = _RESOLVED_TTL_SECONDS,
+        unresolved_ttl_seconds: int = _UNRESOLVED_TTL_SECONDS,
+    ) -> None:
+        super().__init__(db_path)
+        self._resolved_ttl_seconds = resolved_ttl_seconds
+        self._unresolved_ttl_seconds = unresolved_ttl_seconds
+
+    def get_many(self, urls: Collection[str], *, now: float | None = None) -> dict[str, str | None]:
+        """Return fresh cached results for ``urls``; misses are omitted."""
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return {}
+
+        current = time.time() if now is None else now
+        hits: dict[str, str | None] = {}
+        with self._errors_as_misses("read"), self._connect() as conn:
+            for start in range(0, len(unique_urls), _MAX_QUERY_PARAMS):
+                batch = unique_urls[start : start + _MAX_QUERY_PARAMS]
+                placeholders = ", ".join("?" for _ in batch)
+                rows = conn.execute(
+                    f"""
+                    SELECT rss_url, resolved_url, resolved_at
+                    FROM google_news_urls
+                    WHERE rss_url IN ({placeholders})
+                    """,
+                    batch,
+                ).fetchall()
+                for rss_url, resolved_url, resolved_at in rows:
+                    ttl = (
+                        self._resolved_ttl_seconds
+                        if resolved_url is not None
+                        else self._unresolved_ttl_seconds
+                    )
+                    if current - resolved_at < ttl:
+                        hits[rss_url] = resolved_url
+            return hits
+        return {}
+
+    def put_many(self, resolved: Mapping[str, str | None], *, now: float | None = None) -> None:
+        """Store resolution results, including ``None`` for failures."""
+        if not resolved:
+            return
+
+        resolved_at = int(time.time() if now is None else now)
+        with self._errors_as_misses("write"), self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO google_news_urls (rss_url, resolved_url, resolved_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(rss_url) DO UPDATE SET
+                    resolved_url = excluded.resolved_url,
+                    resolved_at = excluded.resolved_at
+                """,
+                [(rss_url, url, resolved_at) for rss_url, url in resolved.items()],
+            )
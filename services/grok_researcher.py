@@ -8,7 +8,6 @@ from datetime import UTC, datetime
 from models import Confidence, SourceTier, StoryCandidate
 from services.llm import OpenRouterClient
 from services.research_utils import (
-    dedupe_by_url,
     extract_markdown_link_titles,
     extract_urls,
     fallback_title,
@@ -92,17 +91,29 @@ class GrokResearcher:
         return results
 
     def to_story_candidates(
-        self, results: list[GrokResearchResult]
+        self,
+        results: list[GrokResearchResult],
+        *,
+        now: datetime | None = None,
     ) -> list[StoryCandidate]:
-        """Convert Grok results into normalized story candidates."""
-        now = datetime.now(UTC)
+        """Convert Grok results into normalized story candidates.
+
+        ``now`` is stamped as every story's ``published_at``; defaults to the
+        current time.
+        """
+        now = now or datetime.now(UTC)
+        seen: set[str] = set()
         stories: list[StoryCandidate] = []
         for result in results:
             titles_by_url = extract_markdown_link_titles(result.content)
-            for url in result.urls:
-                url = url.strip()
+            for raw_url in result.urls:
+                url = raw_url.strip()
                 if not url:
                     continue
+                key = url.rstrip("/")
+                if key in seen:
+                    continue
+                seen.add(key)
                 title = titles_by_url.get(url) or fallback_title(url)
                 source_name = source_name_from_url(url)
                 stories.append(
@@ -117,4 +128,4 @@ class GrokResearcher:
                         metadata={"query": result.query, "source_type": "grok"},
                     )
                 )
-        return dedupe_by_url(stories)
+        return stories
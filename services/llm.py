@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, cast
 
 from openai import OpenAI
 
 from config import AppConfig
-from services.resilience import ResiliencePolicy
+from services.resilience import CircuitBreaker, ResiliencePolicy
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +21,10 @@ DEFAULT_CLAUDE_MODEL = "anthropic/claude-sonnet-4.6"
 DEFAULT_PERPLEXITY_MODEL = "perplexity/sonar"
 DEFAULT_GROK_MODEL = "x-ai/grok-3"
 
+# Consecutive failures before a model is short-circuited, and for how long.
+_MODEL_FAILURE_THRESHOLD = 3
+_MODEL_RECOVERY_SECONDS = 60.0
+
 
 @dataclass(frozen=True)
 class LLMResult:
@@ -35,15 +41,16 @@ class OpenRouterClient:
 
     def __init__(self, config: AppConfig, *, timeout_seconds: float = 45.0) -> None:
         self._config = config
-        self._client = OpenAI(
-            api_key=config.openrouter_api_key,
-            base_url=OPENROUTER_BASE_URL,
-            timeout=timeout_seconds,
+        self._client = _shared_openai_client(
+            config.openrouter_api_key,
+            OPENROUTER_BASE_URL,
+            timeout_seconds,
         )
         self._resilience = ResiliencePolicy(
             name="openrouter_chat",
             max_attempts=config.max_external_retries,
         )
+        self._model_breakers: dict[str, CircuitBreaker] = {}
 
     def chat(
         self,
@@ -53,14 +60,44 @@ class OpenRouterClient:
         user_prompt: str,
         temperature: float = 0.2,
         max_tokens: int = 1800,
+        cached_prefix: str | None = None,
+        followup_messages: Sequence[dict[str, str]] = (),
     ) -> LLMResult:
-        """Execute a chat completion request and normalize output."""
+        """Execute a chat completion request and normalize output.
+
+        ``system_prompt`` leads every request, so callers keep it a constant
+        and put per-request text in ``user_prompt``; a byte-identical prefix is
+        what provider-side prompt caching can reuse.
+
+        ``cached_prefix`` is sent as a separate leading user block marked with
+        ``cache_control`` so providers that support prompt caching (Anthropic
+        via OpenRouter) bill the stable instructions at the cached rate.
+        ``followup_messages`` are appended after the user prompt, e.g. a prior
+        assistant reply and a correction, so the original turn stays a cacheable
+        prefix instead of being re-embedded in a new prompt.
+        """
 
         def _operation() -> Any:
-            messages: list[dict[str, str]] = []
+            messages: list[dict[str, Any]] = []
             if system_prompt:
                 messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": user_prompt})
+            if cached_prefix:
+                messages.append(
+                    {
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": cached_prefix,
+                                "cache_control": {"type": "ephemeral"},
+                            },
+                            {"type": "text", "text": user_prompt},
+                        ],
+                    }
+                )
+            else:
+                messages.append({"role": "user", "content": user_prompt})
+            messages.extend(followup_messages)
             messages_payload = cast(Any, messages)
 
             return self._client.chat.completions.create(
@@ -70,7 +107,17 @@ class OpenRouterClient:
                 max_tokens=max_tokens,
             )
 
-        response = self._resilience.execute(_operation)
+        # Fail fast for a model that keeps erroring (e.g. Grok unavailable on
+        # OpenRouter) instead of paying the full retry budget per query.
+        breaker = self._model_breaker(model)
+        breaker.before_call()
+        try:
+            response = self._resilience.execute(_operation)
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+
         result = _normalize_response(model=model, response=response)
         if not result.content:
             logger.warning(
@@ -80,6 +127,19 @@ class OpenRouterClient:
             )
         return result
 
+    def _model_breaker(self, model: str) -> CircuitBreaker:
+        breaker = self._model_breakers.get(model)
+        if breaker is None:
+            breaker = self._model_breakers.setdefault(
+                model,
+                CircuitBreaker(
+                    name=f"openrouter_model:{model}",
+                    failure_threshold=_MODEL_FAILURE_THRESHOLD,
+                    recovery_timeout_seconds=_MODEL_RECOVERY_SECONDS,
+                ),
+            )
+        return breaker
+
     def ask_claude(
         self,
         *,
@@ -87,6 +147,8 @@ class OpenRouterClient:
         system_prompt: str | None = None,
         temperature: float = 0.2,
         max_tokens: int = 1800,
+        cached_prefix: str | None = None,
+        followup_messages: Sequence[dict[str, str]] = (),
     ) -> LLMResult:
         """Convenience wrapper for Claude model requests."""
         return self.chat(
@@ -95,6 +157,8 @@ class OpenRouterClient:
             user_prompt=user_prompt,
             temperature=temperature,
             max_tokens=max_tokens,
+            cached_prefix=cached_prefix,
+            followup_messages=followup_messages,
         )
 
     def ask_perplexity(
@@ -132,6 +196,12 @@ class OpenRouterClient:
         )
 
 
+@lru_cache(maxsize=8)
+def _shared_openai_client(api_key: str, base_url: str, timeout_seconds: float) -> OpenAI:
+    """Return a process-wide OpenAI client so pooled connections survive across runs."""
+    return OpenAI(api_key=api_key, base_url=base_url, timeout=timeout_seconds)
+
+
 def _normalize_response(*, model: str, response: Any) -> LLMResult:
     raw_dict = (
         response.model_dump() if hasattr(response, "model_dump") else _coerce_to_dict(response)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from urllib.parse import urlparse
 
 from models import Confidence, SourceTier, StoryCandidate
@@ -57,9 +58,19 @@ class NewsResearcher:
                 continue
         return results
 
-    def to_story_candidates(self, results: list[QueryResearchResult]) -> list[StoryCandidate]:
-        """Convert query results and citations into normalized candidate stories."""
-        now = datetime.now(UTC)
+    def to_story_candidates(
+        self,
+        results: list[QueryResearchResult],
+        *,
+        now: datetime | None = None,
+    ) -> list[StoryCandidate]:
+        """Convert query results and citations into normalized candidate stories.
+
+        ``now`` is stamped as every story's ``published_at``; defaults to the
+        current time.
+        """
+        now = now or datetime.now(UTC)
+        seen: set[str] = set()
         stories: list[StoryCandidate] = []
         for result in results:
             titles_by_url = _extract_markdown_link_titles(result.content)
@@ -67,6 +78,10 @@ class NewsResearcher:
                 url = citation.strip()
                 if not url:
                     continue
+                key = url.rstrip("/")
+                if key in seen:
+                    continue
+                seen.add(key)
                 title = titles_by_url.get(url) or _fallback_title(url)
                 source_name = _source_name_from_url(url)
                 stories.append(
@@ -81,7 +96,7 @@ class NewsResearcher:
                         metadata={"query": result.query},
                     )
                 )
-        return _dedupe(stories)
+        return stories
 
 
 def _extract_markdown_link_titles(content: str) -> dict[str, str]:
@@ -90,6 +105,7 @@ def _extract_markdown_link_titles(content: str) -> dict[str, str]:
     return {url.strip(): title.strip() for title, url in matches}
 
 
+@lru_cache(maxsize=2048)
 def _source_name_from_url(url: str) -> str:
     parsed = urlparse(url)
     host = parsed.netloc.lower()
@@ -98,6 +114,7 @@ def _source_name_from_url(url: str) -> str:
     return host or "external-source"
 
 
+@lru_cache(maxsize=2048)
 def _fallback_title(url: str) -> str:
     parsed = urlparse(url)
     path = parsed.path.strip("/")
@@ -105,15 +122,3 @@ def _fallback_title(url: str) -> str:
         return _source_name_from_url(url)
     last = path.split("/")[-1].replace("-", " ").replace("_", " ").strip()
     return last.title() if last else _source_name_from_url(url)
-
-
-def _dedupe(stories: list[StoryCandidate]) -> list[StoryCandidate]:
-    seen: set[str] = set()
-    deduped: list[StoryCandidate] = []
-    for story in stories:
-        url = story.source_url.rstrip("/")
-        if url in seen:
-            continue
-        seen.add(url)
-        deduped.append(story)
-    return deduped
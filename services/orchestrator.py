@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
-import json
 import re
+import threading
 import time
-from dataclasses import dataclass
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from pathlib import Path
+from typing import Any, Final
 from zoneinfo import ZoneInfo
 
+import orjson
+
 from config import AppConfig
-from models import DraftStatus, RunStage
+from models import DraftStateRecord, DraftStatus, RunLedgerRecord, RunStage
 from services.backups import backup_brain_snapshot, backup_run_state_db
 from services.brain import append_published_stories, read_published_stories
 from services.context_state import ConversationState
@@ -27,6 +33,14 @@ from services.sender import ResendSender
 from services.validator import validate_https_links, validate_rendered_html
 from services.writer import NewsletterWriter
 
+_TRIGGER_SANITIZER = re.compile(r"[^a-z0-9_-]+")
+
+# Shared, never mutated: Slack only serializes block dicts.
+_DIVIDER_BLOCK: Final[dict[str, Any]] = {"type": "divider"}
+
+# Flush batched status lines early once they approach Slack's text comfort limit.
+_STATUS_BATCH_MAX_CHARS = 3000
+
 
 @dataclass(frozen=True)
 class OrchestrationOutcome:
@@ -38,6 +52,28 @@ class OrchestrationOutcome:
     draft_version: int | None = None
 
 
+@dataclass
+class _SendSnapshot:
+    """In-memory run/draft view carried across one send-pipeline pass."""
+
+    run: RunLedgerRecord
+    draft: DraftStateRecord | None
+    _payload: dict[str, Any] | None = field(default=None, repr=False)
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        """Run payload, parsed on first access."""
+        if self._payload is None:
+            self._payload = _parse_json_dict(self.run.payload_json)
+        return self._payload
+
+    def advance(self, run: RunLedgerRecord, payload_patch: dict[str, Any] | None = None) -> None:
+        """Adopt a transitioned run, merging any payload patch in memory."""
+        self.run = run
+        if payload_patch and self._payload is not None:
+            self._payload.update(payload_patch)
+
+
 class NewsletterOrchestrator:
     """Coordinate weekly runs, redrafts, sends, and recovery."""
 
@@ -69,6 +105,10 @@ class NewsletterOrchestrator:
         self._sender = sender
         self._slack_client = slack_client
         self._logger = logger or get_logger()
+        self._tz = ZoneInfo(config.timezone)
+        self._status_batch = threading.local()
+        # Single worker keeps backups ordered and off the send critical path.
+        self._backup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="backup")
 
     def trigger_run(self, *, trigger: str, requested_by: str | None = None) -> OrchestrationOutcome:
         """Run research and draft generation if run lock is available."""
@@ -125,7 +165,7 @@ class NewsletterOrchestrator:
         if current is None or current.draft_json is None:
             raise ValueError("No current draft available")
 
-        current_payload = _parse_json_dict(current.draft_json)
+        current_payload = current.draft_dict
         revised_payload = self._writer.revise_newsletter(
             current_draft=current_payload,
             feedback_text=feedback_text,
@@ -164,21 +204,23 @@ class NewsletterOrchestrator:
         if late_text is None:
             return OrchestrationOutcome(accepted=False, reason="no_late_update")
 
-        payload = _parse_json_dict(current.draft_json)
-        team_updates = payload.get("team_updates")
-        if not isinstance(team_updates, list):
-            team_updates = []
+        # draft_dict is shared by every reader of this context; edit a copy.
+        payload = dict(current.draft_dict)
+        existing_updates = payload.get("team_updates")
+        team_updates = list(existing_updates) if isinstance(existing_updates, list) else []
 
-        summary = _squash_text(late_text, max_chars=280)
-        team_updates.append(
-            {
-                "title": "Late Team Update",
-                "summary": summary,
-            }
-        )
+        late_update = {
+            "title": "Late Team Update",
+            "summary": _squash_text(late_text, max_chars=280),
+        }
+        team_updates.append(late_update)
         payload["team_updates"] = team_updates
 
-        html = self._renderer.render(payload)
+        html = self._renderer.render_with_team_update(
+            payload,
+            existing_html=current.draft_html,
+            update=late_update,
+        )
         draft_ts = self._post_draft_preview(
             newsletter_payload=payload,
             header=(
@@ -227,14 +269,16 @@ class NewsletterOrchestrator:
     def resume_incomplete_runs(self) -> list[OrchestrationOutcome]:
         """Resume incomplete runs at startup where safe to do so."""
         outcomes: list[OrchestrationOutcome] = []
-        for run in self._run_state.list_incomplete_runs():
-            draft = self._run_state.get_draft_state(run.run_id)
-            if run.stage == RunStage.DRAFT_READY:
+        runs = self._run_state.list_incomplete_run_ids()
+        drafts = self._run_state.get_draft_states(run_id for run_id, _ in runs)
+        for run_id, stage in runs:
+            draft = drafts.get(run_id)
+            if stage == RunStage.DRAFT_READY:
                 if draft is None:
                     continue
                 if draft.draft_status != DraftStatus.APPROVED:
                     continue
-            outcomes.append(self.replay_run(run_id=run.run_id))
+            outcomes.append(self.replay_run(run_id=run_id))
         return outcomes
 
     def post_heartbeat(self, *, next_run_at: datetime | None) -> None:
@@ -268,7 +312,7 @@ class NewsletterOrchestrator:
             industry_story_inputs=list(bundle.planning_inputs),
         )
 
-        issue_date = now.astimezone(ZoneInfo(self._config.timezone)).date().isoformat()
+        issue_date = now.astimezone(self._tz).date().isoformat()
         newsletter_payload = self._writer.write_newsletter(
             newsletter_plan=plan,
             issue_date=issue_date,
@@ -325,6 +369,11 @@ class NewsletterOrchestrator:
         )
 
     def _resume_send_pipeline(self, run_id: str) -> OrchestrationOutcome:
+        # Stage progress for one send pass is posted as a single Slack message.
+        with self._batched_status():
+            return self._execute_send_pipeline(run_id)
+
+    def _execute_send_pipeline(self, run_id: str) -> OrchestrationOutcome:
         run = self._run_state.get_run(run_id)
         if run is None:
             return OrchestrationOutcome(accepted=False, reason="run_not_found", run_id=run_id)
@@ -334,16 +383,17 @@ class NewsletterOrchestrator:
         context = LogContext(run_id=run_id)
 
         try:
-            run = self._ensure_send_requested(run)
-            if run is None:
+            # Load run + draft once and carry them across stage transitions.
+            snapshot = _SendSnapshot(run=run, draft=self._run_state.get_draft_state(run_id))
+            if not self._ensure_send_requested(snapshot):
                 return OrchestrationOutcome(
                     accepted=False,
                     reason="send_not_allowed",
                     run_id=run_id,
                 )
 
-            if run.stage == RunStage.SEND_REQUESTED:
-                validation_errors = self._validate_current_draft_for_send(run_id)
+            if snapshot.run.stage == RunStage.SEND_REQUESTED:
+                validation_errors = self._validate_current_draft_for_send(snapshot.draft)
                 if validation_errors:
                     message = "; ".join(validation_errors)
                     self._run_state.set_run_error(run_id, message)
@@ -355,6 +405,7 @@ class NewsletterOrchestrator:
                     )
                     self._post_status(
                         f"Run `{run_id}` validation failed after approval: {message}",
+                        immediate=True,
                     )
                     return OrchestrationOutcome(
                         accepted=False,
@@ -362,95 +413,97 @@ class NewsletterOrchestrator:
                         run_id=run_id,
                     )
 
-                run = self._run_state.transition_run(run_id, RunStage.RENDER_VALIDATED)
+                snapshot.advance(self._run_state.transition_run(run_id, RunStage.RENDER_VALIDATED))
                 self._post_status(f"Run `{run_id}`: render validated.")
 
-            if run.stage == RunStage.RENDER_VALIDATED:
-                payload = _parse_json_dict(run.payload_json)
-                draft = self._run_state.get_draft_state(run_id)
+            if snapshot.run.stage == RunStage.RENDER_VALIDATED:
+                draft = snapshot.draft
                 if draft is None or draft.draft_html is None:
                     raise RunStateError("Draft HTML missing for broadcast creation")
 
                 created = self._sender.create_broadcast(
                     audience_id=self._config.resend_audience_id,
                     from_email=self._config.newsletter_from_email,
-                    subject=str(payload.get("subject_line") or "The Ruh Digest"),
+                    subject=str(snapshot.payload.get("subject_line") or "The Ruh Digest"),
                     html=draft.draft_html,
                     reply_to=self._config.newsletter_reply_to_email,
                 )
-                run = self._run_state.transition_run(
-                    run_id,
-                    RunStage.BROADCAST_CREATED,
-                    payload_patch={
-                        "broadcast_id": created.broadcast_id,
-                        "broadcast_created_response": created.raw_response,
-                    },
+                created_patch = {
+                    "broadcast_id": created.broadcast_id,
+                    "broadcast_created_response": created.raw_response,
+                }
+                snapshot.advance(
+                    self._run_state.transition_run(
+                        run_id,
+                        RunStage.BROADCAST_CREATED,
+                        payload_patch=created_patch,
+                    ),
+                    payload_patch=created_patch,
                 )
                 self._post_status(f"Run `{run_id}`: broadcast created ({created.broadcast_id}).")
 
-            if run.stage == RunStage.BROADCAST_CREATED:
-                payload = _parse_json_dict(run.payload_json)
-                broadcast_id = str(payload.get("broadcast_id", "")).strip()
+            if snapshot.run.stage == RunStage.BROADCAST_CREATED:
+                broadcast_id = str(snapshot.payload.get("broadcast_id", "")).strip()
                 if not broadcast_id:
                     raise RunStateError("Missing broadcast_id in run payload")
 
                 send_result = self._sender.send_broadcast(broadcast_id=broadcast_id)
-                run = self._run_state.transition_run(
-                    run_id,
-                    RunStage.BROADCAST_SENT,
-                    payload_patch={"broadcast_send_result": send_result},
+                sent_patch = {"broadcast_send_result": send_result}
+                snapshot.advance(
+                    self._run_state.transition_run(
+                        run_id,
+                        RunStage.BROADCAST_SENT,
+                        payload_patch=sent_patch,
+                    ),
+                    payload_patch=sent_patch,
                 )
                 self._post_status(f"Run `{run_id}`: broadcast sent.")
 
-            if run.stage == RunStage.BROADCAST_SENT:
-                self._append_brain_entries(run_id)
-                run = self._run_state.transition_run(run_id, RunStage.BRAIN_UPDATED)
+            if snapshot.run.stage == RunStage.BROADCAST_SENT:
+                fallback_issue_date = datetime.now(UTC).date().isoformat()
+                self._append_brain_entries(snapshot.draft, fallback_issue_date=fallback_issue_date)
+                snapshot.advance(self._run_state.transition_run(run_id, RunStage.BRAIN_UPDATED))
 
                 self._draft_manager.mark_status(status=DraftStatus.SENT)
                 self._context_state.mark_sent()
 
-                payload = _parse_json_dict(run.payload_json)
-                issue_date = str(payload.get("issue_date") or datetime.now(UTC).date().isoformat())
-                db_backup = backup_run_state_db(self._config)
-                brain_backup = backup_brain_snapshot(self._config, issue_date=issue_date)
+                issue_date = str(snapshot.payload.get("issue_date") or fallback_issue_date)
                 self._post_status(
                     f"Run `{run_id}` complete. Newsletter sent and brain updated.",
                 )
-                self._logger.info(
-                    "run_completed",
-                    context=context,
-                    db_backup=str(db_backup) if db_backup else None,
-                    brain_backup=str(brain_backup) if brain_backup else None,
-                )
+                self._logger.info("run_completed", context=context)
+                self._schedule_backups(run_id=run_id, issue_date=issue_date)
 
             return OrchestrationOutcome(accepted=True, reason="sent", run_id=run_id)
         except Exception as exc:  # noqa: BLE001
             self._run_state.set_run_error(run_id, str(exc))
             self._record_failure(run_id=run_id, stage="send", error=str(exc), payload={})
             self._logger.error("send_failed", context=context, error=str(exc))
-            self._post_status(f"Run `{run_id}` send failed: {exc}")
+            self._post_status(f"Run `{run_id}` send failed: {exc}", immediate=True)
             return OrchestrationOutcome(accepted=False, reason="send_failed", run_id=run_id)
 
-    def _ensure_send_requested(self, run: Any) -> Any | None:
-        if run.stage != RunStage.DRAFT_READY:
-            return run
+    def _ensure_send_requested(self, snapshot: _SendSnapshot) -> bool:
+        run_id = snapshot.run.run_id
+        if snapshot.run.stage != RunStage.DRAFT_READY:
+            return True
 
-        draft = self._run_state.get_draft_state(run.run_id)
+        draft = snapshot.draft
         if draft is None:
-            self._run_state.set_run_error(run.run_id, "No draft found for run")
-            return None
+            self._run_state.set_run_error(run_id, "No draft found for run")
+            return False
         if draft.draft_status != DraftStatus.APPROVED:
-            return None
+            return False
 
-        run = self._run_state.transition_run(run.run_id, RunStage.SEND_REQUESTED)
-        self._post_status(f"Run `{run.run_id}`: send requested after approval.")
-        return run
+        snapshot.advance(self._run_state.transition_run(run_id, RunStage.SEND_REQUESTED))
+        self._post_status(f"Run `{run_id}`: send requested after approval.")
+        return True
 
-    def _validate_current_draft_for_send(self, run_id: str) -> list[str]:
-        draft = self._run_state.get_draft_state(run_id)
+    def _validate_current_draft_for_send(self, draft: DraftStateRecord | None) -> list[str]:
         if draft is None:
             return ["Draft state missing"]
 
+        # Both checks are CPU-bound and local, so they run inline; a worker
+        # thread would only contend for the GIL.
         errors: list[str] = []
         if not draft.draft_html:
             errors.append("Draft HTML missing")
@@ -460,28 +513,30 @@ class NewsletterOrchestrator:
         if not draft.draft_json:
             errors.append("Draft JSON missing")
         else:
-            payload = _parse_json_dict(draft.draft_json)
-            errors.extend(validate_https_links(payload))
-
+            errors.extend(validate_https_links(_parse_json_dict(draft.draft_json)))
         return errors
 
-    def _append_brain_entries(self, run_id: str) -> None:
-        draft = self._run_state.get_draft_state(run_id)
+    def _append_brain_entries(
+        self, draft: DraftStateRecord | None, *, fallback_issue_date: str
+    ) -> None:
         if draft is None or draft.draft_json is None:
             raise RunStateError("No draft JSON available for brain update")
 
         payload = _parse_json_dict(draft.draft_json)
-        issue_date = str(payload.get("issue_date") or datetime.now(UTC).date().isoformat())
+        issue_date = str(payload.get("issue_date") or fallback_issue_date)
         stories = payload.get("industry_stories")
-        entries: list[tuple[str, str]] = []
-        if isinstance(stories, list):
-            for story in stories:
-                if not isinstance(story, dict):
-                    continue
-                title = str(story.get("headline", "")).strip()
-                url = str(story.get("source_url", "")).strip()
-                if title and url:
-                    entries.append((title, url))
+        if not isinstance(stories, list):
+            stories = []
+        # Schema-valid drafts carry string fields, so strip them without str() copies.
+        entries: list[tuple[str, str]] = [
+            (title, url)
+            for story in stories
+            if isinstance(story, dict)
+            and isinstance(title := story.get("headline"), str)
+            and isinstance(url := story.get("source_url"), str)
+            and (title := title.strip())
+            and (url := url.strip())
+        ]
 
         append_published_stories(self._config.brain_file_path, issue_date, entries)
 
@@ -493,29 +548,27 @@ class NewsletterOrchestrator:
         footer: str,
     ) -> str:
         preview = self._formatter.format_preview(newsletter_payload)
-        header_block = {
+        header_block: dict[str, Any] = {
             "type": "section",
             "text": {"type": "mrkdwn", "text": f"*{header}*"},
         }
-        footer_block = {
+        footer_block: dict[str, Any] = {
             "type": "section",
             "text": {"type": "mrkdwn", "text": footer},
         }
 
+        continued_text = f"{header} (continued)"
+
         first_ts = ""
         for index, message_blocks in enumerate(preview.messages):
-            blocks = list(message_blocks)
-            if index == 0:
-                blocks = [
-                    header_block,
-                    {"type": "divider"},
-                    *blocks,
-                    {"type": "divider"},
-                    footer_block,
-                ]
+            blocks = (
+                [header_block, _DIVIDER_BLOCK, *message_blocks, _DIVIDER_BLOCK, footer_block]
+                if index == 0
+                else list(message_blocks)
+            )
             response = self._send_message(
                 channel=self._config.newsletter_channel_id,
-                text=header if index == 0 else f"{header} (continued)",
+                text=header if index == 0 else continued_text,
                 blocks=blocks,
                 thread_ts=first_ts or None,
             )
@@ -529,16 +582,16 @@ class NewsletterOrchestrator:
     def _post_full_draft_snippet(self, *, thread_ts: str, markdown: str) -> None:
         heading = "View full draft (canonical markdown preview):"
         chunks = _chunk_text(markdown, max_chars=2800)
-        self._send_message(
-            channel=self._config.newsletter_channel_id,
-            thread_ts=thread_ts,
-            text=heading,
-        )
-        for chunk in chunks:
+        # Thread replies must stay in order, so posts remain sequential; the
+        # heading rides along with the first chunk to save a round-trip.
+        for index, chunk in enumerate(chunks):
+            text = f"```\n{chunk}\n```"
+            if index == 0:
+                text = f"{heading}\n{text}"
             self._send_message(
                 channel=self._config.newsletter_channel_id,
                 thread_ts=thread_ts,
-                text=f"```\n{chunk}\n```",
+                text=text,
             )
 
     def _record_failure(
@@ -557,7 +610,68 @@ class NewsletterOrchestrator:
             payload=payload,
         )
 
-    def _post_status(self, text: str) -> None:
+    def wait_for_backups(self, timeout: float | None = None) -> None:
+        """Block until every backup scheduled so far has finished."""
+        self._backup_executor.submit(lambda: None).result(timeout=timeout)
+
+    def _schedule_backups(self, *, run_id: str, issue_date: str) -> None:
+        future = self._backup_executor.submit(self._write_backups, issue_date)
+        future.add_done_callback(
+            lambda done: self._report_backups(run_id=run_id, future=done),
+        )
+
+    def _write_backups(self, issue_date: str) -> tuple[Path | None, Path | None]:
+        db_backup = backup_run_state_db(self._config, self._run_state)
+        brain_backup = backup_brain_snapshot(self._config, issue_date=issue_date)
+        return db_backup, brain_backup
+
+    def _report_backups(
+        self,
+        *,
+        run_id: str,
+        future: Future[tuple[Path | None, Path | None]],
+    ) -> None:
+        context = LogContext(run_id=run_id)
+        try:
+            db_backup, brain_backup = future.result()
+        except Exception as exc:  # noqa: BLE001
+            self._logger.error("run_backups_failed", context=context, error=str(exc))
+            self._post_status(f"Run `{run_id}`: backups failed: {exc}")
+            return
+
+        self._logger.info(
+            "run_backups_written",
+            context=context,
+            db_backup=str(db_backup) if db_backup else None,
+            brain_backup=str(brain_backup) if brain_backup else None,
+        )
+        self._post_status(f"Run `{run_id}`: backups written.")
+
+    def _post_status(self, text: str, *, immediate: bool = False) -> None:
+        lines: list[str] | None = getattr(self._status_batch, "lines", None)
+        if lines is None:
+            self._send_message(channel=self._config.newsletter_channel_id, text=text)
+            return
+
+        lines.append(text)
+        if immediate or sum(len(line) + 1 for line in lines) > _STATUS_BATCH_MAX_CHARS:
+            self._flush_status()
+
+    @contextmanager
+    def _batched_status(self) -> Iterator[None]:
+        self._status_batch.lines = []
+        try:
+            yield
+        finally:
+            self._flush_status()
+            self._status_batch.lines = None
+
+    def _flush_status(self) -> None:
+        lines: list[str] | None = getattr(self._status_batch, "lines", None)
+        if not lines:
+            return
+        text = "\n".join(lines)
+        lines.clear()
         self._send_message(channel=self._config.newsletter_channel_id, text=text)
 
     def _send_message(
@@ -590,12 +704,12 @@ class NewsletterOrchestrator:
     @staticmethod
     def _generate_run_id(trigger: str) -> str:
         now = datetime.now(UTC)
-        safe_trigger = re.sub(r"[^a-z0-9_-]+", "-", trigger.lower()).strip("-") or "run"
+        safe_trigger = _TRIGGER_SANITIZER.sub("-", trigger.lower()).strip("-") or "run"
         return f"{now.strftime('%Y-%m-%d')}-{safe_trigger}-{now.strftime('%H%M%S')}"
 
 
 def _parse_json_dict(raw: str) -> dict[str, Any]:
-    data = json.loads(raw)
+    data = orjson.loads(raw)
     if not isinstance(data, dict):
         raise ValueError("Expected JSON object payload")
     return data
@@ -605,16 +719,23 @@ def _chunk_text(text: str, *, max_chars: int) -> list[str]:
     if len(text) <= max_chars:
         return [text]
 
+    # Walk offsets over the original string rather than re-slicing the tail.
     chunks: list[str] = []
-    remaining = text
-    while len(remaining) > max_chars:
-        split_at = remaining.rfind("\n", 0, max_chars)
+    start = 0
+    end = len(text)
+    stripped_end = len(text.rstrip())
+    while end - start > max_chars:
+        split_at = text.rfind("\n", start, start + max_chars)
         if split_at < 0:
-            split_at = max_chars
-        chunk = remaining[:split_at].strip()
+            split_at = start + max_chars
+        chunk = text[start:split_at].strip()
         if chunk:
             chunks.append(chunk)
-        remaining = remaining[split_at:].strip()
+        start = split_at
+        while start < end and text[start].isspace():
+            start += 1
+        end = stripped_end
+    remaining = text[start:end].strip()
     if remaining:
         chunks.append(remaining)
     return chunks
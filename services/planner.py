@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
-from typing import Any
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Final
+
+import orjson
 
 from config import AppConfig
 from models import TeamUpdate
-from services.composition import CompositionFailure, save_composition_dead_letter
+from services.composition import (
+    CompositionFailure,
+    compact_json,
+    repair_followups,
+    save_composition_dead_letter,
+)
 from services.llm import OpenRouterClient
 from services.schemas import PLANNER_SCHEMA
 from services.validator import ContentValidationError, extract_json_payload, validate_json_payload
@@ -22,6 +32,11 @@ _MAX_PLANNER_STORIES = 10
 # Truncate individual story summaries beyond this length (characters).
 _MAX_SUMMARY_CHARS = 300
 
+# Successful plans are cached on disk by input hash so replays and resets over
+# an unchanged research bundle skip the LLM call.  Oldest entries are evicted.
+_PLAN_CACHE_DIR_NAME = "planner_cache"
+_PLAN_CACHE_MAX_ENTRIES = 32
+
 PLANNER_SYSTEM_PROMPT = (
     "You are the newsletter planning assistant for The Ruh Digest, "
     "the weekly AI industry newsletter published by Ruh.ai. "
@@ -47,6 +62,60 @@ PLANNER_STYLE_GUIDANCE = (
     "ecosystem, groundbreaking, revolutionize, game-changer.\n"
 )
 
+_PLANNER_RULES: Final[str] = (
+    "Plan this week's newsletter using the provided inputs.\n"
+    "RULES:\n"
+    "- Numeric claims require confidence high; otherwise avoid hard "
+    "numbers or label as reportedly.\n"
+    "- Only include stories in the current issue window unless "
+    "explicitly marked unavoidable.\n"
+    "- Include confidence for each industry item.\n"
+    "- Make planned hooks and summaries support a very human, witty tone.\n"
+    "- Prioritize stories most relevant to our audience: AI agents, digital labor, "
+    "enterprise automation, human emulation, and AI employee developments.\n"
+    "- Select exactly 6 to 8 stories. Do NOT include all input stories. "
+    "Pick only the most relevant to digital labor, AI workforce, "
+    "and enterprise automation.\n"
+    "- Frame stories through the lens of business impact and investment opportunity.\n\n"
+    f"{PLANNER_STYLE_GUIDANCE}\n"
+    "Return a JSON object with this exact structure (no extra keys):\n"
+    "{\n"
+    '  "team_section": {\n'
+    '    "include": true,\n'
+    '    "items": [{"title": "...", "summary": "..."}]\n'
+    "  },\n"
+    '  "industry_section": {\n'
+    '    "items": [{\n'
+    '      "headline": "...",\n'
+    '      "hook": "...",\n'
+    '      "why_it_matters": "...",\n'
+    '      "source_url": "https://...",\n'
+    '      "source_name": "...",\n'
+    '      "published_at": "2026-02-28",\n'
+    '      "confidence": "high|medium|low"\n'
+    "    }]\n"
+    "  },\n"
+    '  "cta": {"text": "..."}\n'
+    "}\n"
+)
+
+_PLANNER_RESPONSE_REMINDER: Final[str] = (
+    "IMPORTANT: Respond ONLY with the JSON object. "
+    "Do not include any explanation, commentary, or markdown formatting. "
+    "Start your response with { and end with }."
+)
+
+
+# Seeds every cache key: a deploy that edits the prompts or the schema must
+# not keep serving plans built under the old instructions.
+_PLAN_CACHE_FINGERPRINT: Final[bytes] = hashlib.blake2b(
+    orjson.dumps(
+        [PLANNER_SYSTEM_PROMPT, _PLANNER_RULES, _PLANNER_RESPONSE_REMINDER, PLANNER_SCHEMA],
+        option=orjson.OPT_SORT_KEYS,
+    ),
+    digest_size=16,
+).digest()
+
 
 class NewsletterPlanner:
     """Generate newsletter outline JSON from team updates and story inputs."""
@@ -54,6 +123,7 @@ class NewsletterPlanner:
     def __init__(self, config: AppConfig, llm_client: OpenRouterClient) -> None:
         self._config = config
         self._llm_client = llm_client
+        self._cache_dir = config.failure_log_dir.parent / _PLAN_CACHE_DIR_NAME
 
     def create_plan(
         self,
@@ -87,8 +157,16 @@ class NewsletterPlanner:
             "industry_stories": trimmed_stories,
         }
 
-        initial_prompt = self._build_prompt(input_payload)
-        prompt = initial_prompt
+        # Serialize once; every repair attempt reuses the same string.
+        payload_json = compact_json(input_payload)
+        cache_key = _plan_cache_key(payload_json)
+        cached = self._load_cached_plan(cache_key)
+        if cached is not None:
+            logger.info("Planner cache hit for input %s", cache_key)
+            return cached
+
+        prompt = self._build_prompt(payload_json)
+        followups: list[dict[str, str]] = []
         attempts = self._config.max_external_retries
         last_error = "unknown"
         last_output: str | None = None
@@ -96,7 +174,11 @@ class NewsletterPlanner:
         for attempt_num in range(1, attempts + 1):
             result = self._llm_client.ask_claude(
                 system_prompt=PLANNER_SYSTEM_PROMPT,
+                # Rules, style guidance and schema are identical every run;
+                # only the INPUT block varies, so keep them in a cacheable prefix.
+                cached_prefix=_PLANNER_RULES,
                 user_prompt=prompt,
+                followup_messages=followups,
                 temperature=0.1,
                 max_tokens=16384,
             )
@@ -111,6 +193,7 @@ class NewsletterPlanner:
             try:
                 payload = extract_json_payload(result.content)
                 validate_json_payload(payload, PLANNER_SCHEMA)
+                self._store_cached_plan(cache_key, payload)
                 return payload
             except ContentValidationError as exc:
                 last_error = str(exc)
@@ -120,8 +203,7 @@ class NewsletterPlanner:
                     attempts,
                     last_error,
                 )
-                prompt = self._build_repair_prompt(
-                    original_prompt=initial_prompt,
+                followups = repair_followups(
                     invalid_output=result.content,
                     error_message=last_error,
                 )
@@ -131,7 +213,7 @@ class NewsletterPlanner:
             stage="planner",
             attempts=attempts,
             error_summary=last_error,
-            input_payload=input_payload,
+            input_payload_json=payload_json,
             last_model_output=last_output,
         )
         raise CompositionFailure(
@@ -141,67 +223,52 @@ class NewsletterPlanner:
             dead_letter_path=dead_letter,
         )
 
-    def _build_prompt(self, payload: dict[str, Any]) -> str:
-        return (
-            "Plan this week's newsletter using the provided inputs.\n"
-            "RULES:\n"
-            "- Numeric claims require confidence high; otherwise avoid hard "
-            "numbers or label as reportedly.\n"
-            "- Only include stories in the current issue window unless "
-            "explicitly marked unavoidable.\n"
-            "- Include confidence for each industry item.\n"
-            "- Make planned hooks and summaries support a very human, witty tone.\n"
-            "- Prioritize stories most relevant to our audience: AI agents, digital labor, "
-            "enterprise automation, human emulation, and AI employee developments.\n"
-            "- Select exactly 6 to 8 stories. Do NOT include all input stories. "
-            "Pick only the most relevant to digital labor, AI workforce, and enterprise automation.\n"
-            "- Frame stories through the lens of business impact and investment opportunity.\n\n"
-            f"{PLANNER_STYLE_GUIDANCE}\n"
-            "Return a JSON object with this exact structure (no extra keys):\n"
-            "{\n"
-            '  "team_section": {\n'
-            '    "include": true,\n'
-            '    "items": [{"title": "...", "summary": "..."}]\n'
-            "  },\n"
-            '  "industry_section": {\n'
-            '    "items": [{\n'
-            '      "headline": "...",\n'
-            '      "hook": "...",\n'
-            '      "why_it_matters": "...",\n'
-            '      "source_url": "https://...",\n'
-            '      "source_name": "...",\n'
-            '      "published_at": "2026-02-28",\n'
-            '      "confidence": "high|medium|low"\n'
-            "    }]\n"
-            "  },\n"
-            '  "cta": {"text": "..."}\n'
-            "}\n\n"
-            f"INPUT:\n{json.dumps(payload, indent=2, sort_keys=True)}\n\n"
-            "IMPORTANT: Respond ONLY with the JSON object. "
-            "Do not include any explanation, commentary, or markdown formatting. "
-            "Start your response with { and end with }."
-        )
+    def _load_cached_plan(self, cache_key: str) -> dict[str, Any] | None:
+        path = self._cache_dir / f"{cache_key}.json"
+        try:
+            cached = orjson.loads(path.read_bytes())
+            if not isinstance(cached, dict):
+                return None
+            validate_json_payload(cached, PLANNER_SCHEMA)
+            # Refresh mtime so eviction drops the least recently used entries.
+            os.utime(path)
+        except (OSError, orjson.JSONDecodeError, ContentValidationError):
+            return None
+        return cached
 
+    def _store_cached_plan(self, cache_key: str, plan: dict[str, Any]) -> None:
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "wb", delete=False, dir=self._cache_dir, suffix=".tmp"
+            ) as temp_file:
+                temp_file.write(orjson.dumps(plan))
+            os.replace(temp_file.name, self._cache_dir / f"{cache_key}.json")
+            _evict_oldest(self._cache_dir, keep=_PLAN_CACHE_MAX_ENTRIES)
+        except OSError:
+            logger.warning("Failed to write planner cache entry %s", cache_key, exc_info=True)
 
     @staticmethod
-    def _build_repair_prompt(
-        *,
-        original_prompt: str,
-        invalid_output: str,
-        error_message: str,
-    ) -> str:
-        return (
-            "Your previous output was invalid. Repair and return only valid JSON.\n"
-            f"Validation error: {error_message}\n\n"
-            "Original task:\n"
-            f"{original_prompt}\n\n"
-            "Invalid output:\n"
-            f"{invalid_output}"
-        )
+    def _build_prompt(payload_json: str) -> str:
+        return f"INPUT:\n{payload_json}\n\n{_PLANNER_RESPONSE_REMINDER}"
+
+
+def _plan_cache_key(text: str) -> str:
+    hasher = hashlib.blake2b(_PLAN_CACHE_FINGERPRINT, digest_size=16)
+    hasher.update(text.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _evict_oldest(cache_dir: Path, *, keep: int) -> None:
+    entries = sorted(cache_dir.glob("*.json"), key=lambda path: path.stat().st_mtime)
+    for path in entries[: max(0, len(entries) - keep)]:
+        path.unlink(missing_ok=True)
 
 
 def _truncate(value: str | int | None, max_chars: int) -> str | int | None:
     """Truncate a string value to *max_chars*, appending '…' when clipped."""
-    if not isinstance(value, str) or len(value) <= max_chars:
+    if not value or not isinstance(value, str) or len(value) <= max_chars:
         return value
-    return value[:max_chars].rsplit(" ", 1)[0] + "…"
+    head = value[:max_chars]
+    space = head.rfind(" ")
+    return (head if space < 0 else head[:space]) + "…"
@@ -4,75 +4,105 @@ from __future__ import annotations
 
 import logging
 import re
-from dataclasses import replace
+from collections.abc import Collection, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from models import Confidence, SourceTier, StoryCandidate
+from services.google_news_cache import GoogleNewsUrlCache
 
 logger = logging.getLogger(__name__)
 
 _TRACKING_QUERY_PREFIXES = ("utm_",)
-_TRACKING_QUERY_KEYS = {
-    "ref",
-    "fbclid",
-    "gclid",
-    "mc_cid",
-    "mc_eid",
-    "igshid",
-    "mkt_tok",
-}
+_TRACKING_QUERY_KEYS = frozenset(
+    {
+        "ref",
+        "fbclid",
+        "gclid",
+        "mc_cid",
+        "mc_eid",
+        "igshid",
+        "mkt_tok",
+    }
+)
 
+_REDIRECT_HOSTS = frozenset({"t.co", "l.facebook.com", "news.google.com"})
+# Ordered by precedence when a redirect URL carries more than one of these keys.
 _REDIRECT_QUERY_KEYS = ("url", "u", "redirect", "target")
 
-_TIER_1_DOMAINS = {
-    "openai.com",
-    "anthropic.com",
-    "blog.google",
-    "ai.google",
-    "microsoft.com",
-    "meta.com",
-}
-
-_TIER_2_DOMAINS = {
-    "techcrunch.com",
-    "venturebeat.com",
-    "news.crunchbase.com",
-    "crunchbase.com",
-    "wsj.com",
-    "bloomberg.com",
-    "reuters.com",
-    "theverge.com",
-}
-
-_NUMERIC_CLAIM_PATTERN = re.compile(
-    r"(?:\$\s?\d[\d,.]*(?:\s?[MBKmbk])?|\d[\d,.]*%|\d[\d,.]*(?:\s?[MBKmbk])?)"
+_TIER_1_DOMAINS = frozenset(
+    {
+        "openai.com",
+        "anthropic.com",
+        "blog.google",
+        "ai.google",
+        "microsoft.com",
+        "meta.com",
+    }
+)
+
+_TIER_2_DOMAINS = frozenset(
+    {
+        "techcrunch.com",
+        "venturebeat.com",
+        "news.crunchbase.com",
+        "crunchbase.com",
+        "wsj.com",
+        "bloomberg.com",
+        "reuters.com",
+        "theverge.com",
+    }
+)
+
+_MULTISLASH_PATTERN = re.compile(r"//+")
+
+_GOOGLE_NEWS_MAX_WORKERS = 16
+# Shared keep-alive pool so batched HEAD requests reuse connections.
+_GOOGLE_NEWS_SESSION = requests.Session()
+_GOOGLE_NEWS_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=_GOOGLE_NEWS_MAX_WORKERS, pool_maxsize=_GOOGLE_NEWS_MAX_WORKERS),
 )
 
+# Dollar amounts, then bare numbers with an optional percent or magnitude
+# suffix; the bare-number branches share one prefix so it is scanned once.
+_NUMERIC_CLAIM_PATTERN = re.compile(r"\$\s?\d[\d,.]*(?:\s?[MBKmbk])?|\d[\d,.]*(?:%|\s?[MBKmbk])?")
+
+
+def canonicalize_url(
+    url: str,
+    *,
+    resolved_google_news: Mapping[str, str | None] | None = None,
+) -> str:
+    """Normalize URLs by removing tracking parameters and wrappers.
 
-def canonicalize_url(url: str) -> str:
-    """Normalize URLs by removing tracking parameters and wrappers."""
+    ``resolved_google_news`` maps Google News article URLs to results already
+    fetched by :func:`_resolve_google_news_urls`, skipping the per-URL HEAD.
+    """
     raw = url.strip()
     if not raw:
         return raw
 
-    parsed = urlparse(raw)
-    query_params = parse_qs(parsed.query, keep_blank_values=False)
+    redirected = _unwrap_redirect(urlparse(raw), resolved_google_news)
+    return _normalize_url(redirected if redirected is not None else raw)
 
-    redirected = _unwrap_redirect(parsed, query_params)
-    if redirected is not None:
-        parsed = urlparse(redirected)
-        query_params = parse_qs(parsed.query, keep_blank_values=False)
 
+# Pure string transform; the same URLs recur across ingest, dedupe, and tiering.
+@lru_cache(maxsize=4096)
+def _normalize_url(url: str) -> str:
+    parsed = urlparse(url)
     clean_query: dict[str, list[str]] = {}
-    for key, value in query_params.items():
+    for key, value in parse_qs(parsed.query, keep_blank_values=False).items():
         lowered = key.lower()
         if lowered in _TRACKING_QUERY_KEYS:
             continue
-        if any(lowered.startswith(prefix) for prefix in _TRACKING_QUERY_PREFIXES):
+        if lowered.startswith(_TRACKING_QUERY_PREFIXES):
             continue
         clean_query[key] = value
 
@@ -80,7 +110,7 @@ def canonicalize_url(url: str) -> str:
     if host.startswith("www."):
         host = host[4:]
 
-    path = re.sub(r"//+", "/", parsed.path or "/")
+    path = _MULTISLASH_PATTERN.sub("/", parsed.path or "/")
     if path != "/":
         path = path.rstrip("/")
 
@@ -98,33 +128,36 @@ def canonicalize_url(url: str) -> str:
 
 def assign_source_tier(url: str) -> SourceTier:
     """Assign source tier from canonical URL domain."""
-    host = urlparse(canonicalize_url(url)).netloc
-
-    if host in _TIER_1_DOMAINS:
-        return SourceTier.TIER_1
-    if host in _TIER_2_DOMAINS:
-        return SourceTier.TIER_2
-    return SourceTier.TIER_3
+    return _tier_for_host(urlparse(canonicalize_url(url)).netloc)
 
 
-def apply_canonicalization_and_tiering(stories: list[StoryCandidate]) -> list[StoryCandidate]:
+def apply_canonicalization_and_tiering(
+    stories: list[StoryCandidate],
+    *,
+    url_cache: GoogleNewsUrlCache | None = None,
+) -> list[StoryCandidate]:
     """Canonicalize URLs and align source trust tiers and base confidence."""
+    # Google News links each need a network round-trip; resolve them together.
+    google_news_urls = {
+        article_url
+        for story in stories
+        if (article_url := _google_news_article_url(urlparse(story.source_url.strip())))
+    }
+    resolved = _resolve_google_news_urls(google_news_urls, cache=url_cache)
+
     normalized: list[StoryCandidate] = []
     for story in stories:
-        canonical_url = canonicalize_url(story.source_url)
-        tier = assign_source_tier(canonical_url)
+        canonical_url = canonicalize_url(story.source_url, resolved_google_news=resolved)
+        # Already canonical: skip the second canonicalize pass (and any
+        # Google News HEAD it could trigger) inside assign_source_tier.
+        tier = _tier_for_host(urlparse(canonical_url).netloc)
         confidence = _max_confidence(story.confidence, _default_confidence_for_tier(tier))
         normalized.append(
-            replace(
-                story,
+            story.with_updates(
+                {"canonical_url": canonical_url, "source_tier": tier.value},
                 source_url=canonical_url,
                 source_tier=tier,
                 confidence=confidence,
-                metadata={
-                    **story.metadata,
-                    "canonical_url": canonical_url,
-                    "source_tier": tier.value,
-                },
             )
         )
     return normalized
@@ -132,54 +165,51 @@ def apply_canonicalization_and_tiering(stories: list[StoryCandidate]) -> list[St
 
 def enforce_numeric_claim_verification(stories: list[StoryCandidate]) -> list[StoryCandidate]:
     """Promote or demote confidence for stories with numeric claims."""
-    grouped_by_claim: dict[str, list[StoryCandidate]] = {}
-    for story in stories:
-        claims = extract_numeric_claims(f"{story.title} {story.summary or ''}")
-        if not claims:
-            continue
-        for claim in claims:
-            grouped_by_claim.setdefault(claim, []).append(story)
-
     verified: list[StoryCandidate] = []
-    for story in stories:
-        claims = extract_numeric_claims(f"{story.title} {story.summary or ''}")
-        if not claims:
+    for story, verdict in zip(stories, _numeric_claim_verdicts(stories), strict=True):
+        if verdict is None:
             verified.append(story)
             continue
+        confidence, updates = _numeric_claim_updates(verdict)
+        verified.append(story.with_updates(updates, confidence=confidence))
+    return verified
 
-        is_verified = False
-        if story.source_tier == SourceTier.TIER_1:
-            is_verified = True
-        else:
-            domains = {
-                urlparse(other.source_url).netloc
-                for claim in claims
-                for other in grouped_by_claim.get(claim, [])
-            }
-            is_verified = len(domains) >= 2
-
-        if is_verified:
-            verified.append(
-                replace(
-                    story,
-                    confidence=Confidence.HIGH,
-                    metadata={**story.metadata, "numeric_claims_verified": True},
-                )
-            )
-        else:
-            verified.append(
-                replace(
-                    story,
-                    confidence=Confidence.LOW,
-                    metadata={
-                        **story.metadata,
-                        "numeric_claims_verified": False,
-                        "verification_note": "numeric claims unverified",
-                    },
-                )
-            )
 
-    return verified
+def enforce_numeric_claims_and_recency(
+    stories: list[StoryCandidate],
+    *,
+    start_at: datetime,
+    end_at: datetime,
+) -> list[StoryCandidate]:
+    """Apply numeric claim verification then recency rules in a single pass.
+
+    Same result as ``enforce_recency(enforce_numeric_claim_verification(...))``
+    but each surviving story is copied at most once. Claims are still grouped
+    across every input story, including ones the recency window drops.
+    """
+    normalized_start = start_at.astimezone(UTC)
+    normalized_end = end_at.astimezone(UTC)
+
+    filtered: list[StoryCandidate] = []
+    for story, verdict in zip(stories, _numeric_claim_verdicts(stories), strict=True):
+        recency_updates = _recency_updates(story, start_at=normalized_start, end_at=normalized_end)
+        if recency_updates is None:
+            continue
+
+        confidence = story.confidence
+        updates: dict[str, Any] = {}
+        if verdict is not None:
+            confidence, updates = _numeric_claim_updates(verdict)
+        if recency_updates:
+            confidence = Confidence.LOW
+            updates.update(recency_updates)
+
+        if not updates:
+            filtered.append(story)
+            continue
+        filtered.append(story.with_updates(updates, confidence=confidence))
+
+    return filtered
 
 
 def enforce_recency(
@@ -194,30 +224,37 @@ def enforce_recency(
 
     filtered: list[StoryCandidate] = []
     for story in stories:
-        published_at = story.published_at
-        if published_at is None:
-            filtered.append(
-                replace(
-                    story,
-                    confidence=Confidence.LOW,
-                    metadata={
-                        **story.metadata,
-                        "missing_timestamp": True,
-                        "verification_note": "missing published_at",
-                    },
-                )
-            )
+        updates = _recency_updates(story, start_at=normalized_start, end_at=normalized_end)
+        if updates is None:
             continue
-
-        ts = published_at.astimezone(UTC)
-        if ts < normalized_start or ts > normalized_end:
+        if not updates:
+            filtered.append(story)
             continue
-
-        filtered.append(story)
+        filtered.append(story.with_updates(updates, confidence=Confidence.LOW))
 
     return filtered
 
 
+def _recency_updates(
+    story: StoryCandidate,
+    *,
+    start_at: datetime,
+    end_at: datetime,
+) -> dict[str, Any] | None:
+    """Return the recency metadata for one story, or ``None`` to drop it.
+
+    ``start_at`` and ``end_at`` must already be in UTC. A non-empty result
+    means the story has no timestamp and is downgraded to low confidence.
+    """
+    published_at = story.published_at
+    if published_at is None:
+        return {"missing_timestamp": True, "verification_note": "missing published_at"}
+    ts = published_at.astimezone(UTC)
+    if ts < start_at or ts > end_at:
+        return None
+    return {}
+
+
 def validate_citation_fields(stories: list[StoryCandidate]) -> list[str]:
     """Validate required citation fields for planning and rendering stages."""
     errors: list[str] = []
@@ -235,24 +272,83 @@ def validate_citation_fields(stories: list[StoryCandidate]) -> list[str]:
 
 def to_planning_inputs(stories: list[StoryCandidate]) -> list[dict[str, str | int | None]]:
     """Convert stories into planner-ready dictionaries with trust metadata."""
-    planning_items: list[dict[str, str | int | None]] = []
-    for story in stories:
-        planning_items.append(
-            {
-                "title": story.title,
-                "source_url": story.source_url,
-                "source_name": story.source_name,
-                "published_at": (
-                    story.published_at.astimezone(UTC).isoformat()
-                    if story.published_at is not None
-                    else None
-                ),
-                "confidence": story.confidence.value,
-                "source_tier": story.source_tier.value,
-                "summary": story.summary,
-            }
-        )
-    return planning_items
+    return [
+        {
+            "title": story.title,
+            "source_url": story.source_url,
+            "source_name": story.source_name,
+            "published_at": (
+                story.published_at.astimezone(UTC).isoformat()
+                if story.published_at is not None
+                else None
+            ),
+            "confidence": story.confidence.value,
+            "source_tier": story.source_tier.value,
+            "summary": story.summary,
+        }
+        for story in stories
+    ]
+
+
+def _numeric_claim_verdicts(stories: list[StoryCandidate]) -> list[bool | None]:
+    """Return per-story claim verification: ``None`` when a story has no claims."""
+    # Extract claims and parse each URL once; the verification pass reuses both.
+    story_claims = [
+        extract_numeric_claims(f"{story.title} {story.summary or ''}") for story in stories
+    ]
+    domains_by_claim: dict[str, set[str]] = {}
+    for story, claims in zip(stories, story_claims, strict=True):
+        if not claims:
+            continue
+        netloc = urlparse(story.source_url).netloc
+        for claim in claims:
+            domains_by_claim.setdefault(claim, set()).add(netloc)
+
+    verdicts: list[bool | None] = []
+    for story, claims in zip(stories, story_claims, strict=True):
+        if not claims:
+            verdicts.append(None)
+        elif story.source_tier == SourceTier.TIER_1:
+            verdicts.append(True)
+        else:
+            verdicts.append(_spans_two_domains(domains_by_claim[claim] for claim in claims))
+    return verdicts
+
+
+def _spans_two_domains(domain_sets: Iterable[set[str]]) -> bool:
+    # Stop as soon as two distinct domains are seen instead of building the
+    # full union; most corroborated claims settle on the first set.
+    seen: set[str] = set()
+    for domains in domain_sets:
+        if len(domains) >= 2:
+            return True
+        seen |= domains
+        if len(seen) >= 2:
+            return True
+    return False
+
+
+def _numeric_claim_updates(verified: bool) -> tuple[Confidence, dict[str, Any]]:
+    if verified:
+        return Confidence.HIGH, {"numeric_claims_verified": True}
+    return Confidence.LOW, {
+        "numeric_claims_verified": False,
+        "verification_note": "numeric claims unverified",
+    }
+
+
+@lru_cache(maxsize=1024)
+def _tier_for_host(host: str) -> SourceTier:
+    # Walk from the full host down to its registrable suffix so subdomains
+    # (e.g. platform.openai.com) inherit their parent domain's tier.
+    labels = host.split(".")
+    for index in range(len(labels) - 1):
+        suffix = ".".join(labels[index:])
+        if suffix in _TIER_1_DOMAINS:
+            return SourceTier.TIER_1
+        if suffix in _TIER_2_DOMAINS:
+            return SourceTier.TIER_2
+    return SourceTier.TIER_3
 
 
 def _default_confidence_for_tier(tier: SourceTier) -> Confidence:
@@ -283,7 +379,7 @@ def _resolve_google_news_url(url: str) -> str | None:
     Returns the resolved URL, or ``None`` if resolution fails.
     """
     try:
-        response = requests.head(
+        response = _GOOGLE_NEWS_SESSION.head(
             url,
             allow_redirects=True,
             timeout=5,
@@ -297,25 +393,62 @@ def _resolve_google_news_url(url: str) -> str | None:
     return None
 
 
-def _unwrap_redirect(parsed: Any, query_params: dict[str, list[str]]) -> str | None:
-    if not parsed.netloc:
-        return None
-    host = parsed.netloc.lower()
-    if host not in {"t.co", "l.facebook.com", "news.google.com"}:
+def _resolve_google_news_urls(
+    urls: Collection[str],
+    *,
+    cache: GoogleNewsUrlCache | None = None,
+) -> dict[str, str | None]:
+    """Resolve several Google News URLs concurrently over the shared session."""
+    if not urls:
+        return {}
+    resolved = cache.get_many(urls) if cache is not None else {}
+    pending = [url for url in urls if url not in resolved]
+    if not pending:
+        return resolved
+
+    with ThreadPoolExecutor(
+        max_workers=min(_GOOGLE_NEWS_MAX_WORKERS, len(pending)),
+    ) as executor:
+        fetched = dict(zip(pending, executor.map(_resolve_google_news_url, pending), strict=True))
+    if cache is not None:
+        cache.put_many(fetched)
+    return {**resolved, **fetched}
+
+
+def _google_news_article_url(parsed: Any) -> str | None:
+    """Return the resolvable URL when ``parsed`` is a Google News RSS article."""
+    if parsed.netloc.lower() != "news.google.com" or "/rss/articles/" not in (parsed.path or ""):
         return None
-
-    # Google News RSS article URLs use path-encoded protobuf, not query params.
-    if host == "news.google.com" and "/rss/articles/" in (parsed.path or ""):
-        original_url = urlunparse((
+    return urlunparse(
+        (
             parsed.scheme or "https",
             parsed.netloc,
             parsed.path,
             parsed.params,
             parsed.query,
             parsed.fragment,
-        ))
+        )
+    )
+
+
+def _unwrap_redirect(
+    parsed: Any,
+    resolved_google_news: Mapping[str, str | None] | None = None,
+) -> str | None:
+    if not parsed.netloc:
+        return None
+    host = parsed.netloc.lower()
+    if host not in _REDIRECT_HOSTS:
+        return None
+
+    # Google News RSS article URLs use path-encoded protobuf, not query params.
+    original_url = _google_news_article_url(parsed)
+    if original_url is not None:
+        if resolved_google_news is not None and original_url in resolved_google_news:
+            return resolved_google_news[original_url]
         return _resolve_google_news_url(original_url)
 
+    query_params = parse_qs(parsed.query, keep_blank_values=False)
     for key in _REDIRECT_QUERY_KEYS:
         values = query_params.get(key)
         if values:
@@ -323,5 +456,7 @@ def _unwrap_redirect(parsed: Any, query_params: dict[str, list[str]]) -> str | N
     return None
 
 
+# Pairwise dedupe in research_pipeline re-extracts the same story text many times.
+@lru_cache(maxsize=4096)
 def extract_numeric_claims(text: str) -> tuple[str, ...]:
     return tuple(match.group(0).replace(" ", "") for match in _NUMERIC_CLAIM_PATTERN.finditer(text))
@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, StrictUndefined, select_autoescape
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, Template
 
 from services.schemas import NEWSLETTER_SCHEMA
 from services.validator import (
     ContentValidationError,
     validate_https_links,
     validate_json_payload,
-    validate_rendered_html,
+    validate_rendered_html_stream,
 )
 
+_TEAM_UPDATE_TEMPLATE = "_team_update.html"
+_TEAM_UPDATES_ANCHOR = "<!-- /team-updates -->"
+
 
 class NewsletterRenderer:
     """Render canonical newsletter JSON via Jinja template."""
@@ -23,7 +27,9 @@ class NewsletterRenderer:
         self._template_path = template_path
         self._environment = Environment(
             loader=FileSystemLoader(str(template_path.parent)),
-            autoescape=select_autoescape(enabled_extensions=("html", "xml")),
+            # Only HTML templates live here, and they do not change while running.
+            autoescape=True,
+            auto_reload=False,
             undefined=StrictUndefined,
             trim_blocks=True,
             lstrip_blocks=True,
@@ -32,14 +38,45 @@ class NewsletterRenderer:
     def render(self, newsletter_payload: dict[str, Any]) -> str:
         """Render validated newsletter JSON into deterministic HTML."""
         self._validate_payload(newsletter_payload)
-        template = self._environment.get_template(self._template_path.name)
-        html = template.render(**newsletter_payload)
-
-        html_errors = validate_rendered_html(html)
+        # Stream template output straight into the HTML checks: one pass, no re-parse.
+        html, html_errors = validate_rendered_html_stream(
+            self._template.generate(**newsletter_payload)
+        )
         if html_errors:
             raise ContentValidationError("; ".join(html_errors))
         return html
 
+    def render_with_team_update(
+        self,
+        newsletter_payload: dict[str, Any],
+        *,
+        existing_html: str | None,
+        update: dict[str, Any],
+    ) -> str:
+        """Splice one appended team update into previously rendered HTML.
+
+        ``newsletter_payload`` must already include ``update`` as its last team
+        update. Falls back to a full render when there is no prior HTML or the
+        team-updates anchor is missing (e.g. the section was empty).
+        """
+        if not existing_html or _TEAM_UPDATES_ANCHOR not in existing_html:
+            return self.render(newsletter_payload)
+
+        self._validate_payload(newsletter_payload)
+        row = str(self._team_update_row(update))
+        # The HTML gate runs again before send, so only the payload is revalidated here.
+        return existing_html.replace(_TEAM_UPDATES_ANCHOR, row + _TEAM_UPDATES_ANCHOR, 1)
+
+    @cached_property
+    def _template(self) -> Template:
+        # Loaded on first render so a bad template path fails where it is used.
+        return self._environment.get_template(self._template_path.name)
+
+    @cached_property
+    def _team_update_row(self) -> Any:
+        module = self._environment.get_template(_TEAM_UPDATE_TEMPLATE).module
+        return module.team_update_row  # type: ignore[attr-defined]
+
     def _validate_payload(self, payload: dict[str, Any]) -> None:
         validate_json_payload(payload, NEWSLETTER_SCHEMA)
         link_errors = validate_https_links(payload)
@@ -2,22 +2,28 @@
 
 from __future__ import annotations
 
+import math
 import re
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 from difflib import SequenceMatcher
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Final
 from urllib.parse import urlparse
 
 from config import AppConfig
-from models import StoryCandidate, TeamUpdate
+from models import Confidence, SourceTier, StoryCandidate, TeamUpdate
 from services.brain import PublishedStory
+from services.google_news_cache import GOOGLE_NEWS_CACHE_FILE_NAME, GoogleNewsUrlCache
 from services.hacker_news import HackerNewsReader
 from services.news_researcher import NewsResearcher, QueryResearchResult
 from services.quality import (
     apply_canonicalization_and_tiering,
-    enforce_numeric_claim_verification,
-    enforce_recency,
+    enforce_numeric_claims_and_recency,
     extract_numeric_claims,
     to_planning_inputs,
 )
@@ -70,6 +76,9 @@ class ResearchPipeline:
         self._hacker_news_reader = hacker_news_reader
         self._news_researcher = news_researcher
         self._grok_researcher = grok_researcher
+        self._google_news_cache = GoogleNewsUrlCache(
+            config.run_state_db_path.parent / GOOGLE_NEWS_CACHE_FILE_NAME
+        )
 
     def collect_sources(
         self, *, start_at: datetime, end_at: datetime
@@ -85,11 +94,13 @@ class ResearchPipeline:
             now=end_at,
         )
         hn_stories = self._hacker_news_reader.fetch_top_stories(max_items=30)
+        # Undated items pass through on purpose: the recency pass later keeps
+        # them but marks them low-confidence. A linear scan beats sort+bisect
+        # for one unsorted page of results.
         hn_recent = [
             story
             for story in hn_stories
-            if story.published_at is None
-            or (story.published_at >= start_at and story.published_at <= end_at)
+            if story.published_at is None or start_at <= story.published_at <= end_at
         ]
 
         combined = merge_primary_dedupe([*rss_stories, *hn_recent])
@@ -102,18 +113,25 @@ class ResearchPipeline:
         updates, source_stories = self.collect_sources(start_at=start_at, end_at=end_at)
 
         perplexity_results = self._news_researcher.run_weekly_research()
-        perplexity_stories = self._news_researcher.to_story_candidates(perplexity_results)
+        # Stamp LLM-derived stories with the window end: they carry no publish
+        # date of their own, and the clock may already be past end_at (late or
+        # replayed runs), which the recency filter would reject.
+        perplexity_stories = self._news_researcher.to_story_candidates(
+            perplexity_results, now=end_at
+        )
 
         grok_stories: list[StoryCandidate] = []
         if self._grok_researcher is not None and self._grok_researcher.enabled:
             grok_results = self._grok_researcher.run_research()
-            grok_stories = self._grok_researcher.to_story_candidates(grok_results)
+            grok_stories = self._grok_researcher.to_story_candidates(grok_results, now=end_at)
 
         merged = merge_primary_dedupe([*source_stories, *perplexity_stories, *grok_stories])
-        canonicalized = apply_canonicalization_and_tiering(merged)
+        canonicalized = apply_canonicalization_and_tiering(
+            merged,
+            url_cache=self._google_news_cache,
+        )
         secondary = secondary_dedupe(canonicalized)
-        verified = enforce_numeric_claim_verification(secondary)
-        recent = enforce_recency(verified, start_at=start_at, end_at=end_at)
+        recent = enforce_numeric_claims_and_recency(secondary, start_at=start_at, end_at=end_at)
         unpublished = filter_previously_published(
             candidates=recent,
             published=published_stories,
@@ -136,22 +154,27 @@ class ResearchPipeline:
 
 
 def merge_primary_dedupe(stories: list[StoryCandidate]) -> list[StoryCandidate]:
-    """Dedupe candidates by canonical URL and exact normalized title."""
+    """Dedupe candidates by canonical URL and title word set.
+
+    Titles match when they contain the same words regardless of order or
+    punctuation ("Anthropic, OpenAI sign pact" / "OpenAI, Anthropic sign
+    pact"), an exact check that keeps those pairs out of the fuzzy stage.
+    """
     seen_urls: set[str] = set()
     seen_titles: set[str] = set()
     deduped: list[StoryCandidate] = []
 
     for story in stories:
         normalized_url = _normalize_url(story.source_url)
-        normalized_title = _normalize_title(story.title)
+        title_key = _title_word_key(story.title)
 
         if normalized_url in seen_urls:
             continue
-        if normalized_title in seen_titles:
+        if title_key in seen_titles:
             continue
 
         seen_urls.add(normalized_url)
-        seen_titles.add(normalized_title)
+        seen_titles.add(title_key)
         deduped.append(story)
 
     return deduped
@@ -161,15 +184,22 @@ def secondary_dedupe(
     stories: list[StoryCandidate], *, similarity_threshold: float = 0.86
 ) -> list[StoryCandidate]:
     """Dedupe near-duplicates and obvious follow-up rehash stories."""
-    deduped: list[StoryCandidate] = []
-    for candidate in stories:
-        if any(
+    # Normalize, extract entities/claims and index each story once; the
+    # pairwise checks below then only compare precomputed values.
+    # Each decision depends on the stories kept so far, so the scan stays
+    # sequential; a set answers the URL rule without touching every pair.
+    deduped: list[_PreparedStory] = []
+    kept_urls: set[str] = set()
+    for story in stories:
+        candidate = _PreparedStory.from_story(story)
+        if candidate.url in kept_urls or any(
             _is_probable_duplicate(candidate, existing, similarity_threshold)
             for existing in deduped
         ):
             continue
         deduped.append(candidate)
-    return deduped
+        kept_urls.add(candidate.url)
+    return [prepared.story for prepared in deduped]
 
 
 def filter_previously_published(
@@ -187,6 +217,7 @@ def filter_previously_published(
     ]
     published_urls = {_normalize_url(entry.url) for entry in relevant_published}
     published_titles = {_normalize_title(entry.title) for entry in relevant_published}
+    fuzzy_titles = _FuzzyTitleIndex(published_titles, threshold=0.82)
 
     filtered: list[StoryCandidate] = []
     for candidate in candidates:
@@ -195,17 +226,9 @@ def filter_previously_published(
 
         if normalized_url in published_urls:
             continue
-        if normalized_title in published_titles:
-            continue
 
         # Fuzzy title match against published history for cross-outlet dedup.
-        is_fuzzy_dup = False
-        for pub in relevant_published:
-            pub_title = _normalize_title(pub.title)
-            if SequenceMatcher(None, normalized_title, pub_title).ratio() >= 0.82:
-                is_fuzzy_dup = True
-                break
-        if is_fuzzy_dup:
+        if fuzzy_titles.matches(normalized_title):
             continue
 
         filtered.append(candidate)
@@ -215,67 +238,139 @@ def filter_previously_published(
 
 def rank_stories_by_relevance(stories: list[StoryCandidate]) -> list[RankedStory]:
     """Compute relevance score and return stories sorted highest-first."""
-    ranked = [
-        RankedStory(story=story, score=score, reasons=tuple(reasons))
-        for story in stories
-        for score, reasons in [_compute_relevance(story)]
-    ]
-    ranked.sort(key=lambda item: item.score, reverse=True)
+    ranked: list[RankedStory] = []
+    for story in stories:
+        score, reasons = _compute_relevance(story)
+        ranked.append(RankedStory(story=story, score=score, reasons=reasons))
+    ranked.sort(key=attrgetter("score"), reverse=True)
     return ranked
 
 
-def _compute_relevance(story: StoryCandidate) -> tuple[float, list[str]]:
+# Matched as plain substrings: C-level ``in`` over a short title+summary beats
+# a combined regex scan for a table this size.
+_RELEVANCE_KEYWORDS: Final[tuple[tuple[str, float, str], ...]] = (
+    ("human emulator", 2.5, "human_emulators"),
+    ("digital employee", 2.5, "digital_employees"),
+    ("ai employee", 2.5, "ai_employees"),
+    ("agent", 2.0, "ai_agents"),
+    ("digital labor", 2.0, "digital_labor"),
+    ("funding", 1.8, "funding"),
+    ("raised", 1.2, "funding_signal"),
+    ("enterprise", 1.5, "enterprise"),
+    ("automation", 1.3, "automation"),
+    ("model", 1.0, "model_release"),
+)
+
+_CONFIDENCE_SCORES: Final[dict[Confidence, float]] = {
+    Confidence.HIGH: 1.0,
+    Confidence.MEDIUM: 0.4,
+    Confidence.LOW: 0.0,
+}
+
+
+def _compute_relevance(story: StoryCandidate) -> tuple[float, tuple[str, ...]]:
     text = f"{story.title} {story.summary or ''}".lower()
     score = 0.0
     reasons: list[str] = []
 
-    keyword_weights: tuple[tuple[str, float, str], ...] = (
-        ("human emulator", 2.5, "human_emulators"),
-        ("digital employee", 2.5, "digital_employees"),
-        ("ai employee", 2.5, "ai_employees"),
-        ("agent", 2.0, "ai_agents"),
-        ("digital labor", 2.0, "digital_labor"),
-        ("funding", 1.8, "funding"),
-        ("raised", 1.2, "funding_signal"),
-        ("enterprise", 1.5, "enterprise"),
-        ("automation", 1.3, "automation"),
-        ("model", 1.0, "model_release"),
-    )
-
-    for keyword, weight, reason in keyword_weights:
+    for keyword, weight, reason in _RELEVANCE_KEYWORDS:
         if keyword in text:
             score += weight
             reasons.append(reason)
 
-    if story.source_tier.value == 1:
+    if story.source_tier == SourceTier.TIER_1:
         score += 1.0
         reasons.append("tier1_source")
-    elif story.source_tier.value == 2:
+    elif story.source_tier == SourceTier.TIER_2:
         score += 0.5
         reasons.append("tier2_source")
 
-    score += {
-        "high": 1.0,
-        "medium": 0.4,
-        "low": 0.0,
-    }[story.confidence.value]
+    score += _CONFIDENCE_SCORES[story.confidence]
+
+    return score, tuple(reasons)
 
-    return score, reasons
 
+# Splits "scheme://netloc/path" the way urlparse does for plain http(s) URLs.
+# Anything urlparse treats specially (non-ASCII netloc checks, stripped
+# control characters, ";params", bracketed hosts) takes the urlparse route.
+_URL_SPLIT_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://([^/?#]*)([^?#]*)")
+_URL_SLOW_PATH_PATTERN = re.compile(r"[\t\r\n;\[\]]")
 
+
+# Called for every story in each dedupe pass and against the published history.
+@lru_cache(maxsize=4096)
 def _normalize_url(url: str) -> str:
     stripped = url.strip().rstrip("/")
-    parsed = urlparse(stripped)
-    host = parsed.netloc.lower()
+    match = _URL_SPLIT_PATTERN.match(stripped)
+    if match is None or not stripped.isascii() or _URL_SLOW_PATH_PATTERN.search(stripped):
+        parsed = urlparse(stripped)
+        netloc, path = parsed.netloc, parsed.path
+    else:
+        netloc, path = match.groups()
+    host = netloc.lower()
     if host.startswith("www."):
         host = host[4:]
-    return f"{host}{parsed.path}".lower()
+    return f"{host}{path}".lower()
 
 
+@lru_cache(maxsize=4096)
 def _normalize_title(title: str) -> str:
     return " ".join(title.strip().lower().split())
 
 
+class _FuzzyTitleIndex:
+    """Titles bucketed by length for ``SequenceMatcher`` threshold lookups.
+
+    ``ratio()`` can never exceed ``2 * min(a, b) / (a + b)`` for lengths a and
+    b, so only titles in a narrow length window around the query can match.
+    Sorting by length turns the scan over the whole published history into a
+    bisected slice; the matches found are exactly those of a full scan.
+    """
+
+    def __init__(self, titles: Iterable[str], *, threshold: float) -> None:
+        ordered = sorted(titles, key=len)
+        self._threshold = threshold
+        self._lengths = [len(title) for title in ordered]
+        # SequenceMatcher caches its index of the second sequence, so keep one
+        # matcher per title and only swap in each query.
+        self._matchers = [SequenceMatcher(None, "", title) for title in ordered]
+
+    def matches(self, title: str) -> bool:
+        """Return whether any indexed title scores at least the threshold."""
+        size = len(title)
+        threshold = self._threshold
+        # Widen by one character on each side to absorb float rounding.
+        low = bisect_left(self._lengths, math.floor(size * threshold / (2 - threshold)) - 1)
+        high = bisect_right(self._lengths, math.ceil(size * (2 - threshold) / threshold) + 1)
+        return any(
+            _ratio_at_least(matcher, title, threshold) for matcher in self._matchers[low:high]
+        )
+
+
+_TITLE_WORD_PATTERN = re.compile(r"\w+")
+
+
+def _title_word_key(title: str) -> str:
+    return " ".join(sorted(_TITLE_WORD_PATTERN.findall(title.lower())))
+
+
+def _ratio_at_least(matcher: SequenceMatcher[str], value: str, threshold: float) -> bool:
+    """Return whether ``value`` vs the matcher's second sequence scores >= threshold.
+
+    ``real_quick_ratio`` and ``quick_ratio`` are upper bounds on ``ratio``, so
+    checking them first rejects most pairs without the quadratic match search.
+    """
+    matcher.set_seq1(value)
+    return (
+        matcher.real_quick_ratio() >= threshold
+        and matcher.quick_ratio() >= threshold
+        and matcher.ratio() >= threshold
+    )
+
+
+# Every run re-scans the whole brain history, but issue dates repeat once per
+# story and only one new date is added per week, so nearly all are cache hits.
+@lru_cache(maxsize=1024)
 def _parse_issue_date(raw: str) -> date:
     try:
         return datetime.strptime(raw, "%Y-%m-%d").date()
@@ -283,70 +378,122 @@ def _parse_issue_date(raw: str) -> date:
         return datetime(1970, 1, 1, tzinfo=UTC).date()
 
 
-# Multi-word entities: "Microsoft Azure", "Google Cloud", "Open AI"
-_MULTI_WORD_ENTITY = re.compile(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\b")
-# Mixed-case proper nouns: OpenAI, DeepMind, iPhone, etc.
-_MIXED_CASE_NOUN = re.compile(r"\b[A-Z][a-zA-Z]*[A-Z][a-zA-Z]*\b")
+# One pass for both entity shapes. The branches never overlap: multi-word
+# matches are whole words with a single capital each, while mixed-case matches
+# are single words with two or more capitals. Letter runs use possessive
+# quantifiers: a match can only end at a word boundary, so giving letters back
+# never helps, and skipping that backtracking keeps long tokens linear.
+_ENTITY_PATTERN = re.compile(
+    # Multi-word entities: "Microsoft Azure", "Google Cloud", "Open AI"
+    r"(?P<multi>\b[A-Z][a-z]++(?:\s++[A-Z][a-z]++)+\b)"
+    # Mixed-case proper nouns: OpenAI, DeepMind, iPhone, etc.
+    r"|(?P<mixed>\b[A-Z][a-z]*+[A-Z][a-zA-Z]*+\b)"
+)
 _ENTITY_STOP = frozenset({"the", "this", "that", "with", "from", "new", "how", "who"})
 
 
-def _extract_key_entities(text: str) -> set[str]:
+def _extract_key_entities(text: str) -> frozenset[str]:
     """Extract proper nouns and multi-word entity names from text."""
     entities: set[str] = set()
-    for m in _MULTI_WORD_ENTITY.finditer(text):
-        entities.add(m.group(0).lower())
-    for m in _MIXED_CASE_NOUN.finditer(text):
-        word = m.group(0)
-        if len(word) >= 3 and word.lower() not in _ENTITY_STOP:
-            entities.add(word.lower())
-    return entities
-
-
-def _is_probable_duplicate(
-    candidate: StoryCandidate, existing: StoryCandidate, threshold: float
-) -> bool:
-    if _normalize_url(candidate.source_url) == _normalize_url(existing.source_url):
-        return True
+    for m in _ENTITY_PATTERN.finditer(text):
+        entity = m.group(0).lower()
+        if m.lastgroup == "multi" or (len(entity) >= 3 and entity not in _ENTITY_STOP):
+            entities.add(entity)
+    return frozenset(entities)
 
-    cand_title = _normalize_title(candidate.title)
-    exist_title = _normalize_title(existing.title)
 
-    similarity = SequenceMatcher(None, cand_title, exist_title).ratio()
-    if similarity >= threshold:
-        return True
+@dataclass(frozen=True, slots=True)
+class _PreparedStory:
+    """Per-story values compared by ``_is_probable_duplicate``."""
 
-    # Cross-outlet dedup: compare title+summary combined text.
-    cand_summary = (candidate.summary or "").lower().strip()
-    exist_summary = (existing.summary or "").lower().strip()
-    if cand_summary and exist_summary:
-        cand_combined = f"{cand_title} {cand_summary}"
-        exist_combined = f"{exist_title} {exist_summary}"
-        if SequenceMatcher(None, cand_combined, exist_combined).ratio() >= 0.55:
-            return True
+    story: StoryCandidate
+    url: str
+    title: str
+    title_tokens: frozenset[str]
+    entities: frozenset[str]
+    claims: frozenset[str]
+    # Matchers index this story as the second sequence so each comparison
+    # only swaps in the candidate's text.
+    title_matcher: SequenceMatcher[str]
+    combined: str | None
+    combined_matcher: SequenceMatcher[str] | None
+    combined_chars: Counter[str] | None
+
+    @classmethod
+    def from_story(cls, story: StoryCandidate) -> _PreparedStory:
+        title = _normalize_title(story.title)
+        summary = (story.summary or "").lower().strip()
+        combined = f"{title} {summary}" if summary else None
+        text = f"{story.title} {story.summary or ''}"
+        entities = _extract_key_entities(text)
+        return cls(
+            story=story,
+            url=_normalize_url(story.source_url),
+            title=title,
+            title_tokens=frozenset(title.split()),
+            entities=entities,
+            # Claims only count alongside a shared entity, so stories without
+            # entities never need them extracted.
+            claims=frozenset(extract_numeric_claims(text)) if entities else frozenset(),
+            title_matcher=SequenceMatcher(None, "", title),
+            combined=combined,
+            combined_matcher=(
+                SequenceMatcher(None, "", combined) if combined is not None else None
+            ),
+            combined_chars=Counter(combined) if combined is not None else None,
+        )
 
-    # Entity-based matching: shared company/product names + moderate title overlap.
-    cand_text = f"{candidate.title} {candidate.summary or ''}"
-    exist_text = f"{existing.title} {existing.summary or ''}"
-    shared_entities = _extract_key_entities(cand_text) & _extract_key_entities(exist_text)
-    if len(shared_entities) >= 1 and similarity >= 0.55:
-        return True
 
+def _is_probable_duplicate(
+    candidate: _PreparedStory, existing: _PreparedStory, threshold: float
+) -> bool:
+    # Matching URLs are caught by secondary_dedupe before any pair is compared.
+    # Every rule below independently marks a duplicate, so run the set and
+    # arithmetic checks first and leave the SequenceMatcher scores for last.
     # Numeric claim + entity dedup: same dollar amount AND shared entity
     # strongly implies same event from different outlets.
-    cand_claims = set(extract_numeric_claims(cand_text))
-    exist_claims = set(extract_numeric_claims(exist_text))
-    if (cand_claims & exist_claims) and shared_entities:
+    shared_entities = candidate.entities & existing.entities
+    if shared_entities and (candidate.claims & existing.claims):
         return True
 
     # Follow-up heuristic: same source and high token overlap.
-    if candidate.source_name == existing.source_name:
-        candidate_tokens = set(cand_title.split())
-        existing_tokens = set(exist_title.split())
+    if candidate.story.source_name == existing.story.source_name:
+        candidate_tokens = candidate.title_tokens
+        existing_tokens = existing.title_tokens
         if candidate_tokens and existing_tokens:
-            overlap = len(candidate_tokens & existing_tokens) / len(
-                candidate_tokens | existing_tokens
-            )
+            # Jaccard from sizes: |A | B| = |A| + |B| - |A & B|, no union set built.
+            shared = len(candidate_tokens & existing_tokens)
+            overlap = shared / (len(candidate_tokens) + len(existing_tokens) - shared)
             if overlap >= 0.8:
                 return True
 
-    return False
+    # Title similarity; with a shared entity (company/product name) a moderate
+    # 0.55 overlap is enough. Skip ratio() when its cheap upper bounds fail.
+    floor = min(threshold, 0.55) if shared_entities else threshold
+    matcher = existing.title_matcher
+    matcher.set_seq1(candidate.title)
+    if matcher.real_quick_ratio() >= floor and matcher.quick_ratio() >= floor:
+        if matcher.ratio() >= floor:
+            return True
+
+    # Cross-outlet dedup: compare title+summary combined text. quick_ratio()
+    # walks every character of these long strings, so its bound (shared
+    # character count) is taken from per-story counts instead.
+    combined = candidate.combined
+    combined_chars = candidate.combined_chars
+    existing_chars = existing.combined_chars
+    combined_matcher = existing.combined_matcher
+    if (
+        combined is None
+        or combined_chars is None
+        or existing_chars is None
+        or combined_matcher is None
+    ):
+        return False
+    combined_matcher.set_seq1(combined)
+    if combined_matcher.real_quick_ratio() < 0.55:
+        return False
+    total_chars = combined_chars.total() + existing_chars.total()
+    if 2.0 * (combined_chars & existing_chars).total() / total_chars < 0.55:
+        return False
+    return combined_matcher.ratio() >= 0.55
@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from urllib.parse import urlparse
 
-from models import StoryCandidate
-
 _MARKDOWN_LINK = re.compile(r"\[([^\]]+)\]\((https?://[^)]+)\)")
 _URL_PATTERN = re.compile(r"https?://[^\s)\"'>]+")
 
@@ -24,6 +23,7 @@ def extract_urls(content: str) -> list[str]:
     return list(dict.fromkeys(cleaned))
 
 
+@lru_cache(maxsize=2048)
 def source_name_from_url(url: str) -> str:
     """Derive a short source label from a URL host."""
     parsed = urlparse(url)
@@ -33,6 +33,7 @@ def source_name_from_url(url: str) -> str:
     return host or "external-source"
 
 
+@lru_cache(maxsize=2048)
 def fallback_title(url: str) -> str:
     """Best-effort title from the URL path when no title is available."""
     parsed = urlparse(url)
@@ -41,16 +42,3 @@ def fallback_title(url: str) -> str:
         return source_name_from_url(url)
     last = path.split("/")[-1].replace("-", " ").replace("_", " ").strip()
     return last.title() if last else source_name_from_url(url)
-
-
-def dedupe_by_url(stories: list[StoryCandidate]) -> list[StoryCandidate]:
-    """Simple URL-based dedup within a single source adapter."""
-    seen: set[str] = set()
-    deduped: list[StoryCandidate] = []
-    for story in stories:
-        url = story.source_url.rstrip("/")
-        if url in seen:
-            continue
-        seen.add(url)
-        deduped.append(story)
-    return deduped
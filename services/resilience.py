@@ -61,6 +61,10 @@ class CircuitBreaker:
 
     def before_call(self) -> None:
         """Validate whether a call is allowed in the current state."""
+        # Lock-free fast path: an attribute read is atomic, and a call racing a
+        # concurrent trip is indistinguishable from one that started just before.
+        if self._state == CircuitBreakerState.CLOSED:
+            return
         now = time.monotonic()
         with self._lock:
             if self._state == CircuitBreakerState.OPEN:
@@ -73,6 +77,9 @@ class CircuitBreaker:
 
     def record_success(self) -> None:
         """Reset breaker state on successful call."""
+        # Steady state has nothing to reset; skip the lock entirely.
+        if self._state == CircuitBreakerState.CLOSED and self._failure_count == 0:
+            return
         with self._lock:
             self._failure_count = 0
             self._state = CircuitBreakerState.CLOSED
@@ -114,20 +121,27 @@ class ResiliencePolicy:
             failure_threshold=failure_threshold,
             recovery_timeout_seconds=recovery_timeout_seconds,
         )
+        # Built once: tenacity (>= 8.4.2, see requirements.txt) keeps per-call
+        # retry state in a thread-local, so one instance is safe to share
+        # across calls and threads.
+        self._retryer: Retrying | None = (
+            Retrying(
+                stop=stop_after_attempt(max_attempts),
+                wait=wait_exponential_jitter(initial=0.25, max=8.0),
+                retry=retry_if_exception_type(_RETRYABLE_EXCEPTIONS),
+                reraise=True,
+            )
+            if max_attempts > 1
+            else None
+        )
 
     def execute(self, operation: Callable[[], T]) -> T:
         """Execute operation with retry and breaker behavior."""
         self.breaker.before_call()
 
-        retryer = Retrying(
-            stop=stop_after_attempt(self.max_attempts),
-            wait=wait_exponential_jitter(initial=0.25, max=8.0),
-            retry=retry_if_exception_type(_RETRYABLE_EXCEPTIONS),
-            reraise=True,
-        )
-
         try:
-            result = retryer(operation)
+            # A single-attempt policy has nothing to retry; call straight through.
+            result = operation() if self._retryer is None else self._retryer(operation)
         except CircuitBreakerOpenError:
             raise
         except RetryError as exc:  # pragma: no cover
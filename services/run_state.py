@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
-import json
 import sqlite3
-from collections.abc import Iterator
+import threading
+import zlib
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from models import DraftStateRecord, DraftStatus, RunLedgerRecord, RunStage
 
 
@@ -17,6 +21,52 @@ class RunStateError(RuntimeError):
     """Raised when run state operations fail or violate transitions."""
 
 
+# Stay well under SQLite's default host-parameter limit for IN (...) lookups.
+_MAX_QUERY_PARAMS = 500
+
+# Plain dict lookups for row materialization; Enum.__call__ is far slower.
+_STAGE_BY_VALUE: dict[str, RunStage] = {stage.value: stage for stage in RunStage}
+_DRAFT_STATUS_BY_VALUE: dict[str, DraftStatus] = {status.value: status for status in DraftStatus}
+
+_RUN_COLUMNS = "run_id, stage, payload_json, last_error, created_at, updated_at"
+
+# Built once so every call passes the identical string that sqlite3's
+# per-connection statement cache is keyed on.
+_SQL_SELECT_RUN = f"SELECT {_RUN_COLUMNS} FROM run_ledger WHERE run_id = ?"
+_SQL_UPDATE_RUN_ERROR = f"""
+    UPDATE run_ledger
+    SET last_error = ?, updated_at = ?
+    WHERE run_id = ?
+    RETURNING {_RUN_COLUMNS}
+"""
+_SQL_UPDATE_RUN_PAYLOAD = f"""
+    UPDATE run_ledger
+    SET payload_json = merge_payload(payload_json, ?), updated_at = ?
+    WHERE run_id = ?
+    RETURNING {_RUN_COLUMNS}
+"""
+
+# Keyset pages for iter_runs(): (created_at, rowid) is the order the
+# created_at index already stores, so each page is an index range search.
+_RUN_PAGE_SIZE = 100
+_SQL_RUN_PAGE = f"""
+    SELECT rowid, {_RUN_COLUMNS}
+    FROM run_ledger
+    WHERE (created_at, rowid) > (?, ?)
+    ORDER BY created_at, rowid
+    LIMIT {_RUN_PAGE_SIZE}
+"""
+_SQL_INCOMPLETE_RUN_PAGE = f"""
+    SELECT rowid, {_RUN_COLUMNS}
+    FROM run_ledger
+    WHERE (created_at, rowid) > (?, ?) AND stage != ?
+    ORDER BY created_at, rowid
+    LIMIT {_RUN_PAGE_SIZE}
+"""
+
+# Distinct statements this store runs, with headroom for batched IN (...) sizes.
+_CACHED_STATEMENTS = 256
+
 ALLOWED_TRANSITIONS: dict[RunStage, set[RunStage]] = {
     RunStage.DRAFT_READY: {RunStage.SEND_REQUESTED},
     RunStage.SEND_REQUESTED: {RunStage.RENDER_VALIDATED},
@@ -26,16 +76,56 @@ ALLOWED_TRANSITIONS: dict[RunStage, set[RunStage]] = {
     RunStage.BRAIN_UPDATED: set(),
 }
 
+# Stages a run may be in to move to the key stage; the UPDATE only matches a
+# row whose current stage is one of these, so validation needs no prior read.
+_PREVIOUS_STAGES: dict[RunStage, tuple[str, ...]] = {
+    stage: tuple(prev.value for prev, nexts in ALLOWED_TRANSITIONS.items() if stage in nexts)
+    for stage in RunStage
+}
+_SQL_TRANSITION_RUN: dict[RunStage, str] = {
+    stage: f"""
+    UPDATE run_ledger
+    SET stage = ?, payload_json = merge_payload(payload_json, ?), last_error = ?, updated_at = ?
+    WHERE run_id = ? AND stage IN ({", ".join("?" for _ in previous)})
+    RETURNING {_RUN_COLUMNS}
+    """
+    for stage, previous in _PREVIOUS_STAGES.items()
+}
+
 
 class RunStateStore:
     """SQLite-backed store for run ledger and draft state."""
 
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
+        # One connection for the store's lifetime keeps SQLite's page cache warm
+        # between ledger calls; Slack handlers run on worker threads, so access
+        # is serialized by the lock rather than bound to the creating thread.
+        self._conn: sqlite3.Connection | None = None
+        self._conn_lock = threading.RLock()
+
+    def close(self) -> None:
+        """Close the shared connection; the next call reopens it."""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def backup(self, dest: Path) -> None:
+        """Copy the database, including WAL frames not yet checkpointed, to ``dest``."""
+        with self._conn_lock:
+            conn = self._shared_connection()
+            target = sqlite3.connect(dest)
+            try:
+                conn.backup(target)
+            finally:
+                target.close()
 
     def initialize(self) -> None:
         """Initialize SQLite tables if they do not exist."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Schema setup and stale-lock recovery commit together: one journal
+        # sync at startup instead of one per statement.
         with self._connect() as conn:
             conn.execute(
                 """
@@ -85,15 +175,26 @@ class RunStateStore:
                 )
                 """
             )
-        self.clear_stale_lock()
+            # Let the run listings (ORDER BY created_at, with or without the
+            # stage != filter) and the latest-draft lookup walk an index
+            # instead of sorting the whole table. The ledger index also covers
+            # list_incomplete_run_ids, which reads stage and run_id from the
+            # index entries alone.
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_run_ledger_created_stage_id
+                ON run_ledger(created_at, stage, run_id)
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_draft_state_updated_at ON draft_state(updated_at)"
+            )
+            _delete_stale_lock(conn, max_age_minutes=30)
 
     def clear_stale_lock(self, max_age_minutes: int = 30) -> None:
         """Remove run lock if it's older than max_age_minutes (crash recovery)."""
         with self._connect() as conn:
-            conn.execute(
-                "DELETE FROM run_lock WHERE lock_id = 1 AND acquired_at < ?",
-                ((datetime.now(UTC) - timedelta(minutes=max_age_minutes)).isoformat(),),
-            )
+            _delete_stale_lock(conn, max_age_minutes=max_age_minutes)
 
     def create_run(
         self,
@@ -103,7 +204,7 @@ class RunStateStore:
     ) -> RunLedgerRecord:
         """Create a new run ledger row."""
         now = _now_iso()
-        payload_json = json.dumps(payload or {}, sort_keys=True)
+        payload_json = _dumps_sorted(payload or {})
         try:
             with self._connect() as conn:
                 conn.execute(
@@ -123,34 +224,25 @@ class RunStateStore:
         except sqlite3.IntegrityError as exc:
             raise RunStateError(f"Run already exists: {run_id}") from exc
 
-        record = self.get_run(run_id)
-        if record is None:
-            raise RunStateError(f"Failed to create run: {run_id}")
-        return record
+        # The committed row holds exactly these values; no read-back needed.
+        created_at = _parse_iso(now)
+        return RunLedgerRecord(
+            run_id=run_id,
+            stage=initial_stage,
+            payload_json=payload_json,
+            last_error=None,
+            created_at=created_at,
+            updated_at=created_at,
+        )
 
     def get_run(self, run_id: str) -> RunLedgerRecord | None:
         """Return run ledger record by run ID."""
         with self._connect() as conn:
-            row = conn.execute(
-                """
-                SELECT run_id, stage, payload_json, last_error, created_at, updated_at
-                FROM run_ledger
-                WHERE run_id = ?
-                """,
-                (run_id,),
-            ).fetchone()
+            row = _select_run_row(conn, run_id)
 
         if row is None:
             return None
-
-        return RunLedgerRecord(
-            run_id=row["run_id"],
-            stage=RunStage(row["stage"]),
-            payload_json=row["payload_json"],
-            last_error=row["last_error"],
-            created_at=_parse_iso(row["created_at"]),
-            updated_at=_parse_iso(row["updated_at"]),
-        )
+        return _run_record(row)
 
     def transition_run(
         self,
@@ -160,33 +252,70 @@ class RunStateStore:
         last_error: str | None = None,
     ) -> RunLedgerRecord:
         """Transition a run to its next stage with transition validation."""
-        current = self.get_run(run_id)
-        if current is None:
-            raise RunStateError(f"Run not found: {run_id}")
+        # One statement on success: the stage guard, payload merge and read of
+        # the updated row all happen inside the UPDATE. Only a miss reads the
+        # row to tell "not found" from an invalid transition.
+        with self._connect() as conn:
+            row = conn.execute(
+                _SQL_TRANSITION_RUN[next_stage],
+                (
+                    next_stage.value,
+                    _patch_json(payload_patch),
+                    last_error,
+                    _now_iso(),
+                    run_id,
+                    *_PREVIOUS_STAGES[next_stage],
+                ),
+            ).fetchone()
+            if row is None:
+                current = _select_run_row(conn, run_id)
 
-        allowed = ALLOWED_TRANSITIONS[current.stage]
-        if next_stage not in allowed:
+        if row is None:
+            if current is None:
+                raise RunStateError(f"Run not found: {run_id}")
+            current_stage = _STAGE_BY_VALUE[current["stage"]]
             raise RunStateError(
-                f"Invalid transition for {run_id}: {current.stage.value} -> {next_stage.value}"
+                f"Invalid transition for {run_id}: {current_stage.value} -> {next_stage.value}"
             )
+        return _run_record(row)
 
-        merged_payload = self._merge_payload(current.payload_json, payload_patch)
-        now = _now_iso()
+    def iter_runs(self) -> Iterator[RunLedgerRecord]:
+        """Yield all run ledger records ordered by creation time, page by page."""
+        return self._iter_run_pages(_SQL_RUN_PAGE, ())
 
+    def iter_incomplete_runs(self) -> Iterator[RunLedgerRecord]:
+        """Yield runs that have not reached the terminal stage, page by page."""
+        return self._iter_run_pages(_SQL_INCOMPLETE_RUN_PAGE, (RunStage.BRAIN_UPDATED.value,))
+
+    def _iter_run_pages(self, sql: str, extra_params: tuple[str, ...]) -> Iterator[RunLedgerRecord]:
+        # Each page is its own short transaction, so the shared connection is
+        # free while the caller works through records (or calls the store).
+        after: tuple[str, int] = ("", 0)
+        while True:
+            with self._connect() as conn:
+                rows = conn.execute(sql, (*after, *extra_params)).fetchall()
+            for row in rows:
+                yield _run_record(row)
+            if len(rows) < _RUN_PAGE_SIZE:
+                return
+            after = (rows[-1]["created_at"], rows[-1]["rowid"])
+
+    def list_incomplete_run_ids(self) -> list[tuple[str, RunStage]]:
+        """Return ``(run_id, stage)`` for unfinished runs, oldest first.
+
+        Answered from the covering index alone, without reading row payloads.
+        """
         with self._connect() as conn:
-            conn.execute(
+            rows = conn.execute(
                 """
-                UPDATE run_ledger
-                SET stage = ?, payload_json = ?, last_error = ?, updated_at = ?
-                WHERE run_id = ?
+                SELECT run_id, stage
+                FROM run_ledger
+                WHERE stage != ?
+                ORDER BY created_at ASC
                 """,
-                (next_stage.value, merged_payload, last_error, now, run_id),
-            )
-
-        updated = self.get_run(run_id)
-        if updated is None:
-            raise RunStateError(f"Failed to read transitioned run: {run_id}")
-        return updated
+                (RunStage.BRAIN_UPDATED.value,),
+            ).fetchall()
+        return [(row["run_id"], _STAGE_BY_VALUE[row["stage"]]) for row in rows]
 
     def list_incomplete_runs(self) -> list[RunLedgerRecord]:
         """Return all runs that have not reached the terminal stage."""
@@ -201,17 +330,7 @@ class RunStateStore:
                 (RunStage.BRAIN_UPDATED.value,),
             ).fetchall()
 
-        return [
-            RunLedgerRecord(
-                run_id=row["run_id"],
-                stage=RunStage(row["stage"]),
-                payload_json=row["payload_json"],
-                last_error=row["last_error"],
-                created_at=_parse_iso(row["created_at"]),
-                updated_at=_parse_iso(row["updated_at"]),
-            )
-            for row in rows
-        ]
+        return [_run_record(row) for row in rows]
 
     def list_runs(self) -> list[RunLedgerRecord]:
         """Return all run ledger records ordered by creation time."""
@@ -224,58 +343,31 @@ class RunStateStore:
                 """
             ).fetchall()
 
-        return [
-            RunLedgerRecord(
-                run_id=row["run_id"],
-                stage=RunStage(row["stage"]),
-                payload_json=row["payload_json"],
-                last_error=row["last_error"],
-                created_at=_parse_iso(row["created_at"]),
-                updated_at=_parse_iso(row["updated_at"]),
-            )
-            for row in rows
-        ]
+        return [_run_record(row) for row in rows]
 
     def set_run_error(self, run_id: str, error_message: str) -> RunLedgerRecord:
         """Persist the latest error message for a run without changing stage."""
-        current = self.get_run(run_id)
-        if current is None:
-            raise RunStateError(f"Run not found: {run_id}")
-
         with self._connect() as conn:
-            conn.execute(
-                """
-                UPDATE run_ledger
-                SET last_error = ?, updated_at = ?
-                WHERE run_id = ?
-                """,
+            row = conn.execute(
+                _SQL_UPDATE_RUN_ERROR,
                 (error_message, _now_iso(), run_id),
-            )
+            ).fetchone()
 
-        updated = self.get_run(run_id)
-        if updated is None:
-            raise RunStateError(f"Failed to update run error for {run_id}")
-        return updated
+        if row is None:
+            raise RunStateError(f"Run not found: {run_id}")
+        return _run_record(row)
 
     def patch_run_payload(self, run_id: str, payload_patch: dict[str, Any]) -> RunLedgerRecord:
         """Merge payload keys for a run without changing stage."""
-        current = self.get_run(run_id)
-        if current is None:
-            raise RunStateError(f"Run not found: {run_id}")
-        merged_payload = self._merge_payload(current.payload_json, payload_patch)
         with self._connect() as conn:
-            conn.execute(
-                """
-                UPDATE run_ledger
-                SET payload_json = ?, updated_at = ?
-                WHERE run_id = ?
-                """,
-                (merged_payload, _now_iso(), run_id),
-            )
-        updated = self.get_run(run_id)
-        if updated is None:
-            raise RunStateError(f"Failed to patch payload for run {run_id}")
-        return updated
+            row = conn.execute(
+                _SQL_UPDATE_RUN_PAYLOAD,
+                (_patch_json(payload_patch), _now_iso(), run_id),
+            ).fetchone()
+
+        if row is None:
+            raise RunStateError(f"Run not found: {run_id}")
+        return _run_record(row)
 
     def upsert_draft_state(
         self,
@@ -317,16 +409,22 @@ class RunStateStore:
                     draft_version,
                     draft_status.value,
                     draft_ts,
-                    draft_json,
-                    draft_html,
+                    _compress_text(draft_json),
+                    _compress_text(draft_html),
                     now,
                 ),
             )
 
-        record = self.get_draft_state(run_id)
-        if record is None:
-            raise RunStateError(f"Failed to persist draft state for run {run_id}")
-        return record
+        # The committed row holds exactly these values; no read-back needed.
+        return DraftStateRecord(
+            run_id=run_id,
+            draft_version=draft_version,
+            draft_status=draft_status,
+            draft_ts=draft_ts,
+            draft_json=draft_json,
+            draft_html=draft_html,
+            updated_at=_parse_iso(now),
+        )
 
     def get_draft_state(self, run_id: str) -> DraftStateRecord | None:
         """Get draft state by run ID."""
@@ -353,13 +451,52 @@ class RunStateStore:
         return DraftStateRecord(
             run_id=row["run_id"],
             draft_version=row["draft_version"],
-            draft_status=DraftStatus(row["draft_status"]),
+            draft_status=_DRAFT_STATUS_BY_VALUE[row["draft_status"]],
             draft_ts=row["draft_ts"],
-            draft_json=row["draft_json"],
-            draft_html=row["draft_html"],
+            draft_json=_decompress_text(row["draft_json"]),
+            draft_html=_decompress_text(row["draft_html"]),
             updated_at=_parse_iso(row["updated_at"]),
         )
 
+    def get_draft_states(self, run_ids: Iterable[str]) -> dict[str, DraftStateRecord]:
+        """Get draft states for several runs keyed by run ID, skipping missing ones."""
+        unique_ids = list(dict.fromkeys(run_ids))
+        rows: list[sqlite3.Row] = []
+        with self._connect() as conn:
+            for start in range(0, len(unique_ids), _MAX_QUERY_PARAMS):
+                batch = unique_ids[start : start + _MAX_QUERY_PARAMS]
+                placeholders = ", ".join("?" for _ in batch)
+                rows.extend(
+                    conn.execute(
+                        f"""
+                        SELECT
+                            run_id,
+                            draft_version,
+                            draft_status,
+                            draft_ts,
+                            draft_json,
+                            draft_html,
+                            updated_at
+                        FROM draft_state
+                        WHERE run_id IN ({placeholders})
+                        """,
+                        batch,
+                    ).fetchall()
+                )
+
+        return {
+            row["run_id"]: DraftStateRecord(
+                run_id=row["run_id"],
+                draft_version=row["draft_version"],
+                draft_status=_DRAFT_STATUS_BY_VALUE[row["draft_status"]],
+                draft_ts=row["draft_ts"],
+                draft_json=_decompress_text(row["draft_json"]),
+                draft_html=_decompress_text(row["draft_html"]),
+                updated_at=_parse_iso(row["updated_at"]),
+            )
+            for row in rows
+        }
+
     def get_latest_draft_state(self) -> DraftStateRecord | None:
         """Get the most recently updated draft state across runs."""
         with self._connect() as conn:
@@ -385,10 +522,10 @@ class RunStateStore:
         return DraftStateRecord(
             run_id=row["run_id"],
             draft_version=row["draft_version"],
-            draft_status=DraftStatus(row["draft_status"]),
+            draft_status=_DRAFT_STATUS_BY_VALUE[row["draft_status"]],
             draft_ts=row["draft_ts"],
-            draft_json=row["draft_json"],
-            draft_html=row["draft_html"],
+            draft_json=_decompress_text(row["draft_json"]),
+            draft_html=_decompress_text(row["draft_html"]),
             updated_at=_parse_iso(row["updated_at"]),
         )
 
@@ -399,21 +536,18 @@ class RunStateStore:
 
     def try_acquire_run_lock(self, run_id: str) -> bool:
         """Acquire singleton run lock for this run ID."""
-        try:
-            with self._connect() as conn:
-                existing = conn.execute("SELECT run_id FROM run_lock WHERE lock_id = 1").fetchone()
-                if existing is not None:
-                    return False
-                conn.execute(
-                    """
-                    INSERT INTO run_lock(lock_id, run_id, acquired_at)
-                    VALUES (1, ?, ?)
-                    """,
-                    (run_id, _now_iso()),
-                )
-        except sqlite3.IntegrityError:
-            return False
-        return True
+        # A single conditional insert: the primary key makes it the atomic
+        # check-and-set, and rowcount says whether this call won.
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO run_lock(lock_id, run_id, acquired_at)
+                VALUES (1, ?, ?)
+                ON CONFLICT(lock_id) DO NOTHING
+                """,
+                (run_id, _now_iso()),
+            )
+        return cursor.rowcount == 1
 
     def release_run_lock(self, run_id: str) -> None:
         """Release singleton run lock if held by the supplied run ID."""
@@ -434,9 +568,7 @@ class RunStateStore:
     def load_context_state(self) -> dict[str, Any]:
         """Load persisted conversation state or return defaults."""
         with self._connect() as conn:
-            row = conn.execute(
-                "SELECT * FROM context_state WHERE id = 1"
-            ).fetchone()
+            row = conn.execute("SELECT * FROM context_state WHERE id = 1").fetchone()
         if row is None:
             return {
                 "collection_cutoff_at": None,
@@ -448,9 +580,9 @@ class RunStateStore:
         return {
             "collection_cutoff_at": row["collection_cutoff_at"],
             "newsletter_sent": bool(row["newsletter_sent"]),
-            "pending_late_include_threads": json.loads(row["pending_late_include_threads"]),
-            "team_update_thread_roots": json.loads(row["team_update_thread_roots"]),
-            "team_update_bodies": json.loads(row["team_update_bodies"]),
+            "pending_late_include_threads": orjson.loads(row["pending_late_include_threads"]),
+            "team_update_thread_roots": orjson.loads(row["team_update_thread_roots"]),
+            "team_update_bodies": orjson.loads(row["team_update_bodies"]),
         }
 
     def save_context_state(self, state: dict[str, Any]) -> None:
@@ -474,39 +606,118 @@ class RunStateStore:
                 (
                     state.get("collection_cutoff_at"),
                     int(state.get("newsletter_sent", False)),
-                    json.dumps(sorted(state.get("pending_late_include_threads", []))),
-                    json.dumps(sorted(state.get("team_update_thread_roots", []))),
-                    json.dumps(state.get("team_update_bodies", {}), sort_keys=True),
+                    _dumps_sorted(sorted(state.get("pending_late_include_threads", []))),
+                    _dumps_sorted(sorted(state.get("team_update_thread_roots", []))),
+                    _dumps_sorted(state.get("team_update_bodies", {})),
                     _now_iso(),
                 ),
             )
 
     @contextmanager
     def _connect(self) -> Iterator[sqlite3.Connection]:
-        conn = sqlite3.connect(self.db_path)
+        with self._conn_lock:
+            conn = self._shared_connection()
+            conn.execute("BEGIN")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                # SQLite already rolls back on some errors (e.g. SQLITE_FULL).
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+
+    def _shared_connection(self) -> sqlite3.Connection:
+        # Callers hold _conn_lock.
+        if self._conn is None:
+            self._conn = self._open_connection()
+        return self._conn
+
+    def _open_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+        )
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA foreign_keys=ON")
-        try:
-            yield conn
-            conn.commit()
-        except BaseException:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
-
-    @staticmethod
-    def _merge_payload(existing_payload_json: str, payload_patch: dict[str, Any] | None) -> str:
-        payload = json.loads(existing_payload_json)
-        if payload_patch:
-            payload.update(payload_patch)
-        return json.dumps(payload, sort_keys=True)
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        # Read pages straight from a memory map instead of copying via pread().
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.create_function("merge_payload", 2, _merge_payload, deterministic=True)
+        return conn
+
+
+def _delete_stale_lock(conn: sqlite3.Connection, *, max_age_minutes: int) -> None:
+    conn.execute(
+        "DELETE FROM run_lock WHERE lock_id = 1 AND acquired_at < ?",
+        ((datetime.now(UTC) - timedelta(minutes=max_age_minutes)).isoformat(),),
+    )
+
+
+def _select_run_row(conn: sqlite3.Connection, run_id: str) -> sqlite3.Row | None:
+    row: sqlite3.Row | None = conn.execute(
+        _SQL_SELECT_RUN,
+        (run_id,),
+    ).fetchone()
+    return row
+
+
+def _run_record(row: sqlite3.Row) -> RunLedgerRecord:
+    return RunLedgerRecord(
+        run_id=row["run_id"],
+        stage=_STAGE_BY_VALUE[row["stage"]],
+        payload_json=row["payload_json"],
+        last_error=row["last_error"],
+        created_at=_parse_iso(row["created_at"]),
+        updated_at=_parse_iso(row["updated_at"]),
+    )
+
+
+def _patch_json(payload_patch: dict[str, Any] | None) -> str | None:
+    return _dumps_sorted(payload_patch) if payload_patch else None
+
+
+def _merge_payload(existing_payload_json: str, patch_json: str | None) -> str:
+    """SQL function: shallow-merge a JSON patch into a stored payload.
+
+    Registered on the connection so the merge runs inside the UPDATE with
+    dict.update semantics; SQLite's json_patch would merge nested objects
+    and drop null-valued keys.
+    """
+    payload = orjson.loads(existing_payload_json)
+    if patch_json is not None:
+        payload.update(orjson.loads(patch_json))
+    return _dumps_sorted(payload)
+
+
+def _dumps_sorted(value: Any) -> str:
+    # Columns stay TEXT so rows written by earlier versions read back unchanged.
+    return orjson.dumps(value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode()
 
 
 def _now_iso() -> str:
     return datetime.now(UTC).isoformat()
 
 
+# Listings re-read the same rows on every poll, so their timestamps repeat.
+@lru_cache(maxsize=4096)
 def _parse_iso(value: str) -> datetime:
     return datetime.fromisoformat(value)
+
+
+def _compress_text(value: str | None) -> bytes | None:
+    """Store large draft blobs zlib-compressed to cut SQLite page reads."""
+    if value is None:
+        return None
+    return zlib.compress(value.encode("utf-8"))
+
+
+def _decompress_text(value: str | bytes | None) -> str | None:
+    # Rows written before compression was introduced hold plain TEXT.
+    if value is None or isinstance(value, str):
+        return value
+    return zlib.decompress(value).decode("utf-8")
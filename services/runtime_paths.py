@@ -14,16 +14,18 @@ ARCHIVE_DIR_NAME = "archive"
 def bootstrap_runtime_paths(config: AppConfig) -> None:
     """Create runtime directories/files and initialize persistent state storage."""
     data_root = _resolve_data_root(config.brain_file_path, config.run_state_db_path)
-    data_root.mkdir(parents=True, exist_ok=True)
-
     archive_dir = data_root / ARCHIVE_DIR_NAME
-    archive_dir.mkdir(parents=True, exist_ok=True)
 
-    config.failure_log_dir.mkdir(parents=True, exist_ok=True)
+    # The archive dir sits under data_root, so creating it creates both. On a
+    # warm start one stat per directory replaces mkdir's failed-create path.
+    for directory in (archive_dir, config.failure_log_dir):
+        if not directory.is_dir():
+            directory.mkdir(parents=True, exist_ok=True)
     ensure_brain_file(config.brain_file_path)
 
     store = RunStateStore(config.run_state_db_path)
     store.initialize()
+    store.close()
 
 
 def _resolve_data_root(brain_path: Path, db_path: Path) -> Path:
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import importlib
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any, cast
 
 from config import AppConfig
-from services.resilience import ResiliencePolicy
+from services.resilience import ExternalServiceError, ResiliencePolicy
 
 
 @dataclass(frozen=True)
@@ -30,7 +31,21 @@ class ResendSender:
     ) -> None:
         self._config = config
         self._dry_run = config.enable_dry_run
-        self._client = client or self._build_default_client(config)
+        # Dry runs never touch Resend, so skip importing and configuring the SDK.
+        if client is None and not self._dry_run:
+            client = self._build_default_client(config)
+        self._client: Any = client
+        # Resolve the SDK entry points once instead of on every (retried) call.
+        broadcasts = getattr(client, "Broadcasts", None)
+        self._create_broadcast: Callable[[dict[str, Any]], Any] | None = getattr(
+            broadcasts, "create", None
+        )
+        self._send_broadcast: Callable[[dict[str, Any]], Any] | None = getattr(
+            broadcasts, "send", None
+        )
+        self._get_broadcast: Callable[[dict[str, Any]], Any] | None = getattr(
+            broadcasts, "get", None
+        )
         self._resilience = ResiliencePolicy(
             name="resend_api",
             max_attempts=config.max_external_retries,
@@ -73,8 +88,10 @@ class ResendSender:
         if reply_to:
             payload["reply_to"] = [reply_to]
 
+        create = _require(self._create_broadcast, "create")
+
         def _operation() -> Any:
-            return self._client.Broadcasts.create(payload)
+            return create(payload)
 
         response = self._resilience.execute(_operation)
         response_id = _extract_id(response)
@@ -92,8 +109,10 @@ class ResendSender:
                 "status": "skipped_dry_run",
             }
 
+        send = _require(self._send_broadcast, "send")
+
         def _operation() -> Any:
-            return self._client.Broadcasts.send({"broadcast_id": broadcast_id})
+            return send({"broadcast_id": broadcast_id})
 
         response = self._resilience.execute(_operation)
         return _to_dict(response)
@@ -106,20 +125,28 @@ class ResendSender:
                 "status": "dry_run",
             }
 
-        broadcasts_cls = getattr(self._client, "Broadcasts", None)
-        if broadcasts_cls is None or not hasattr(broadcasts_cls, "get"):
+        get = self._get_broadcast
+        if get is None:
             return {
                 "id": broadcast_id,
                 "status": "unknown",
             }
 
         def _operation() -> Any:
-            return broadcasts_cls.get({"broadcast_id": broadcast_id})
+            return get({"broadcast_id": broadcast_id})
 
         response = self._resilience.execute(_operation)
         return _to_dict(response)
 
 
+def _require(
+    method: Callable[[dict[str, Any]], Any] | None, name: str
+) -> Callable[[dict[str, Any]], Any]:
+    if method is None:
+        raise ExternalServiceError(f"Resend client does not support Broadcasts.{name}")
+    return method
+
+
 def _extract_id(response: Any) -> str:
     as_dict = _to_dict(response)
     if "id" not in as_dict:
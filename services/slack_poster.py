@@ -0,0 +1,51 @@
+"""Keep-alive Slack message poster for high-volume draft and status posts."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from services.resilience import ExternalServiceError
+
+SLACK_POST_MESSAGE_URL = "https://slack.com/api/chat.postMessage"
+
+
+class SlackPoster:
+    """Post chat messages over one pooled HTTPS session.
+
+    ``slack_sdk.WebClient`` opens a fresh urllib connection per call; a draft
+    post fans out into many in-thread messages, so reusing a keep-alive session
+    saves a TCP + TLS handshake on every message after the first.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        timeout_seconds: float = 30.0,
+        session: requests.Session | None = None,
+    ) -> None:
+        self._timeout_seconds = timeout_seconds
+        # Sent per request so the token never lands on a caller's session.
+        self._auth_headers = {"Authorization": f"Bearer {token}"}
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        self._session = session
+
+    def chat_postMessage(self, **payload: Any) -> dict[str, Any]:
+        """Mirror ``WebClient.chat_postMessage`` and return the response body."""
+        response = self._session.post(
+            SLACK_POST_MESSAGE_URL,
+            json=payload,
+            headers=self._auth_headers,
+            timeout=self._timeout_seconds,
+        )
+        response.raise_for_status()
+        body = response.json()
+        if not isinstance(body, dict) or not body.get("ok"):
+            error = body.get("error", "unknown_error") if isinstance(body, dict) else "bad_response"
+            raise ExternalServiceError(f"Slack chat.postMessage failed: {error}")
+        return body
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
@@ -11,6 +13,12 @@ from config import AppConfig
 from models import TeamUpdate
 from services.resilience import ResiliencePolicy
 
+# conversations.history pages are cursor-chained, so they cannot be fetched
+# ahead of time; asking for Slack's maximum page size is what cuts round trips.
+_HISTORY_PAGE_LIMIT = 999
+_THREAD_REPLY_WORKERS = 8
+_MISSING = object()
+
 
 class SlackReader:
     """Read channel messages and thread context from Slack."""
@@ -28,10 +36,27 @@ class SlackReader:
         channel_id: str,
         oldest_ts: str,
         latest_ts: str,
-        limit: int = 200,
+        limit: int = _HISTORY_PAGE_LIMIT,
     ) -> list[dict[str, Any]]:
         """Fetch channel messages in time window with pagination."""
-        messages: list[dict[str, Any]] = []
+        return list(
+            self._iter_channel_messages(
+                channel_id=channel_id,
+                oldest_ts=oldest_ts,
+                latest_ts=latest_ts,
+                limit=limit,
+            )
+        )
+
+    def _iter_channel_messages(
+        self,
+        *,
+        channel_id: str,
+        oldest_ts: str,
+        latest_ts: str,
+        limit: int = _HISTORY_PAGE_LIMIT,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield channel messages page by page as Slack returns them."""
         cursor: str | None = None
 
         while True:
@@ -50,15 +75,13 @@ class SlackReader:
             response = self._resilience.execute(_operation)
             page_messages = response.get("messages", [])
             if isinstance(page_messages, list):
-                messages.extend(m for m in page_messages if isinstance(m, dict))
+                yield from (m for m in page_messages if isinstance(m, dict))
 
             next_cursor = response.get("response_metadata", {}).get("next_cursor")
             if not next_cursor:
-                break
+                return
             cursor = str(next_cursor)
 
-        return messages
-
     def fetch_thread_replies(self, *, channel_id: str, thread_ts: str) -> list[dict[str, Any]]:
         """Fetch replies for a thread message."""
 
@@ -86,32 +109,58 @@ class SlackReader:
         """Collect top-level team updates and include thread replies as context."""
         oldest_ts = str(start_at.timestamp())
         latest_ts = str(end_at.timestamp())
-        messages = self.fetch_channel_messages(
+        messages = self._iter_channel_messages(
             channel_id=channel_id,
             oldest_ts=oldest_ts,
             latest_ts=latest_ts,
         )
 
-        updates: list[TeamUpdate] = []
+        # Pass 1: filter pages as they arrive, keeping top-level messages and
+        # noting which ones have threads; the raw history is never collected.
+        top_level: list[tuple[str, str, str, bool]] = []
         for message in messages:
-            if "thread_ts" in message and message.get("thread_ts") != message.get("ts"):
+            # Each key is read once; this loop runs for every message in the window.
+            get = message.get
+            raw_ts = get("ts", "")
+            thread_ts = get("thread_ts", _MISSING)
+            if thread_ts is not _MISSING and thread_ts != raw_ts:
                 # Skip child replies from main message stream.
                 continue
 
-            ts = str(message.get("ts", "")).strip()
-            text = str(message.get("text", "")).strip()
-            user_id = str(message.get("user", "")).strip()
-            if not ts or not text:
+            ts = _clean_text(raw_ts)
+            if not ts:
+                continue
+            text = _clean_text(get("text", ""))
+            if not text:
                 continue
+            user_id = _clean_text(get("user", ""))
+
+            has_thread = thread_ts == ts and int(get("reply_count", 0)) > 0
+            top_level.append((ts, user_id, text, has_thread))
+
+        # Reply fetches are independent round trips; run them concurrently.
+        thread_ts_list = [ts for ts, _, _, has_thread in top_level if has_thread]
+        replies_by_ts: dict[str, list[dict[str, Any]]] = {}
+        if thread_ts_list:
+
+            def _fetch_replies(thread_ts: str) -> list[dict[str, Any]]:
+                return self.fetch_thread_replies(channel_id=channel_id, thread_ts=thread_ts)
 
+            workers = min(_THREAD_REPLY_WORKERS, len(thread_ts_list))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                replies = pool.map(_fetch_replies, thread_ts_list)
+                replies_by_ts = dict(zip(thread_ts_list, replies, strict=True))
+
+        # Pass 2: assemble updates in channel order.
+        updates: list[TeamUpdate] = []
+        for ts, user_id, text, has_thread in top_level:
             reply_texts: tuple[str, ...] = ()
-            has_thread = message.get("thread_ts") == ts and int(message.get("reply_count", 0)) > 0
             if has_thread:
-                replies = self.fetch_thread_replies(channel_id=channel_id, thread_ts=ts)
                 reply_texts = tuple(
-                    str(item.get("text", "")).strip()
-                    for item in replies
-                    if str(item.get("ts", "")) != ts and str(item.get("text", "")).strip()
+                    reply_text
+                    for item in replies_by_ts[ts]
+                    if str(item.get("ts", "")) != ts
+                    and (reply_text := _clean_text(item.get("text", "")))
                 )
 
             updates.append(
@@ -124,3 +173,7 @@ class SlackReader:
             )
 
         return updates
+
+
+def _clean_text(value: Any) -> str:
+    return (value if isinstance(value, str) else str(value)).strip()
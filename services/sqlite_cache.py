@@ -0,0 +1,49 @@
+"""Shared SQLite plumbing for the best-effort ingestion caches."""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import ClassVar
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteCache:
+    """One SQLite file holding a single cache table, created on first use.
+
+    Subclasses set ``_SCHEMA`` (a ``CREATE TABLE IF NOT EXISTS`` statement)
+    and ``_LABEL`` for log messages. Storage errors are logged and treated as
+    cache misses; a cache never blocks ingestion.
+    """
+
+    _SCHEMA: ClassVar[str]
+    _LABEL: ClassVar[str]
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+
+    @contextmanager
+    def _errors_as_misses(self, action: str) -> Iterator[None]:
+        """Log and swallow storage errors raised inside the block."""
+        try:
+            yield
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("%s cache %s failed: %s", self._LABEL, action, exc)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute(self._SCHEMA)
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
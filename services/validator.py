@@ -4,11 +4,21 @@ from __future__ import annotations
 
 import json
 import re
+from collections.abc import Callable, Iterable
+from html.parser import HTMLParser
 from typing import Any
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
-from jsonschema import ValidationError, validate
+import orjson
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+
+_UNSUBSCRIBE_PLACEHOLDER = "{{{RESEND_UNSUBSCRIBE_URL}}}"
+_MAX_RENDERED_HTML_CHARS = 180_000
+_CODE_FENCE_PATTERN = re.compile(r"```(?:json)?\s*\n?([\s\S]*?)\n?\s*```")
+_JSON_STRUCTURAL_PATTERN = re.compile(r'[{}"\\]')
+_SECTION_HEADER_PATTERN = re.compile("What We've Been Up To|This Week in AI", re.IGNORECASE)
 
 
 class ContentValidationError(ValueError):
@@ -18,33 +28,35 @@ class ContentValidationError(ValueError):
 def extract_json_payload(raw_text: str) -> dict[str, Any]:
     """Extract and parse JSON object from model output text.
 
-    Uses three strategies in order:
+    Uses four strategies in order:
     1. Direct ``json.loads`` on the full text.
     2. Extract from a markdown code fence (````` ```json ... ``` `````).
     3. Brace-depth scanning to find the first balanced ``{…}`` block.
+    4. Local syntax repair (trailing commas, stray control characters) so a
+       trivially broken reply does not cost another model round-trip.
+       Truncated output is never completed; it goes back to the model.
     """
     text = raw_text.strip()
     if not text:
         raise ContentValidationError("Model returned empty response")
 
-    # Strategy 1: the entire response is valid JSON.
-    try:
-        parsed = json.loads(text)
-        if isinstance(parsed, dict):
-            return parsed
-    except json.JSONDecodeError:
-        pass
+    # Strategy 1: the entire response is valid JSON. Only an object can be
+    # returned, so prose-wrapped replies skip the doomed parse.
+    if text[0] == "{" and text[-1] == "}":
+        try:
+            parsed = _loads(text)
+            if isinstance(parsed, dict):
+                return parsed
+        except json.JSONDecodeError:
+            pass
 
     # Strategy 2: markdown code fence (flexible whitespace handling).
-    fence_match = re.search(
-        r"```(?:json)?\s*\n?([\s\S]*?)\n?\s*```",
-        text,
-    )
+    fence_match = _CODE_FENCE_PATTERN.search(text) if "```" in text else None
     if fence_match:
         inner = fence_match.group(1).strip()
         if inner.startswith("{"):
             try:
-                parsed = json.loads(inner)
+                parsed = _loads(inner)
                 if isinstance(parsed, dict):
                     return parsed
             except json.JSONDecodeError:
@@ -54,11 +66,14 @@ def extract_json_payload(raw_text: str) -> dict[str, Any]:
     # This avoids the greedy regex problem where prose braces cause incorrect
     # extraction boundaries.
     extracted = _extract_first_json_object(text)
+    if extracted is None:
+        # Strategy 4: repair common syntax slips from the first opening brace.
+        extracted = _repair_json_text(text)
     if extracted is None:
         raise ContentValidationError("No JSON object found in model output")
 
     try:
-        parsed = json.loads(extracted)
+        parsed = json.loads(extracted, strict=False)
     except json.JSONDecodeError as exc:
         raise ContentValidationError("Invalid JSON in model output") from exc
 
@@ -68,71 +83,257 @@ def extract_json_payload(raw_text: str) -> dict[str, Any]:
     return parsed
 
 
-def _extract_first_json_object(text: str) -> str | None:
-    """Find the first balanced ``{…}`` block using brace-depth counting.
+def _loads(text: str) -> Any:
+    """Parse strict JSON with orjson, deferring to ``json`` on its rejects.
 
-    Tracks depth while respecting JSON string literals so that braces
-    inside quoted strings are not counted.  Returns *None* if no balanced
-    block is found.
+    orjson refuses a few inputs the stdlib accepts (``NaN``, integers beyond
+    64 bits, lone surrogate escapes); the fallback keeps results identical
+    while well-formed replies take the fast path. Its decode error subclasses
+    ``json.JSONDecodeError``.
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
+def _repair_json_text(text: str) -> str | None:
+    """Rewrite the first ``{…}`` block with common model syntax slips fixed.
+
+    Drops trailing commas before ``}``/``]`` and control characters between
+    tokens; raw control characters inside strings are left for
+    ``json.loads(strict=False)``. Returns *None* when there is no opening
+    brace, the brackets are mismatched, or the block never closes, so a reply
+    cut off mid-object is rejected rather than silently completed.
     """
     start = text.find("{")
     if start == -1:
         return None
 
-    depth = 0
+    out: list[str] = []
+    closers: list[str] = []
     in_string = False
     escape_next = False
 
-    for idx in range(start, len(text)):
-        char = text[idx]
-
-        if escape_next:
-            escape_next = False
-            continue
-
-        if char == "\\":
-            if in_string:
+    for char in text[start:]:
+        if in_string:
+            out.append(char)
+            if escape_next:
+                escape_next = False
+            elif char == "\\":
                 escape_next = True
+            elif char == '"':
+                in_string = False
             continue
 
         if char == '"':
-            in_string = not in_string
+            in_string = True
+        elif char in "{[":
+            closers.append("}" if char == "{" else "]")
+        elif char in "}]":
+            if not closers or closers.pop() != char:
+                return None
+            _drop_trailing_comma(out)
+            out.append(char)
+            if not closers:
+                return "".join(out)
             continue
-
-        if in_string:
+        elif char < " " and char not in "\t\n\r":
             continue
+        out.append(char)
 
-        if char == "{":
-            depth += 1
-        elif char == "}":
-            depth -= 1
-            if depth == 0:
-                candidate = text[start : idx + 1]
-                # Validate it actually parses before returning.
-                try:
-                    json.loads(candidate)
-                    return candidate
-                except json.JSONDecodeError:
-                    # This balanced block wasn't valid JSON; keep scanning
-                    # from the next opening brace.
-                    next_start = text.find("{", idx + 1)
-                    if next_start == -1:
-                        return None
-                    return _extract_first_json_object(text[next_start:])
+    return None
+
+
+def _drop_trailing_comma(out: list[str]) -> None:
+    index = len(out) - 1
+    while index >= 0 and out[index].isspace():
+        index -= 1
+    if index >= 0 and out[index] == ",":
+        del out[index]
+
+
+def _extract_first_json_object(text: str) -> str | None:
+    """Find the first balanced ``{…}`` block using brace-depth counting.
+
+    Tracks depth while respecting JSON string literals so that braces
+    inside quoted strings are not counted.  A balanced block that does not
+    parse restarts the scan at the next opening brace after it.  Returns
+    *None* if no balanced block is found.
+    """
+    start = text.find("{")
+    while start != -1:
+        depth = 0
+        in_string = False
+        escaped_idx = -1
+
+        # Only braces, quotes and backslashes affect the walk; the regex jumps
+        # between them in C instead of stepping through every character.
+        for match in _JSON_STRUCTURAL_PATTERN.finditer(text, start):
+            idx = match.start()
+            if idx == escaped_idx:
+                continue
+
+            char = match.group()
+            if char == "\\":
+                if in_string:
+                    escaped_idx = idx + 1
+                continue
+
+            if char == '"':
+                in_string = not in_string
+                continue
+
+            if in_string:
+                continue
+
+            if char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    break
+        else:
+            return None
+
+        candidate = text[start : idx + 1]
+        # Validate it actually parses before returning.
+        try:
+            _loads(candidate)
+            return candidate
+        except json.JSONDecodeError:
+            start = text.find("{", idx + 1)
 
     return None
 
 
 def validate_json_payload(payload: dict[str, Any], schema: dict[str, object]) -> None:
     """Validate payload against schema and surface clean error messages."""
-    try:
-        validate(instance=payload, schema=schema)
-    except ValidationError as exc:
+    validator, fast_check = _validator_for_schema(schema)
+    # Valid payloads are the common case; only a failed (or unavailable) fast
+    # check pays for jsonschema and its error selection.
+    if fast_check is not None and fast_check(payload):
+        return
+    # Same error selection as jsonschema.validate, minus per-call schema checks.
+    exc = best_match(validator.iter_errors(payload))
+    if exc is not None:
         path = ".".join(str(part) for part in exc.path)
         context = f" at {path}" if path else ""
         raise ContentValidationError(f"Schema validation failed{context}: {exc.message}") from exc
 
 
+_FastCheck = Callable[[Any], bool]
+
+# Keyed by id(); the schema is kept in the value so its id cannot be reused.
+_SCHEMA_VALIDATORS: dict[int, tuple[dict[str, object], Validator, _FastCheck | None]] = {}
+
+
+def _validator_for_schema(schema: dict[str, object]) -> tuple[Validator, _FastCheck | None]:
+    """Return a checked validator for ``schema``, building it on first use."""
+    cached = _SCHEMA_VALIDATORS.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1], cached[2]
+
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema)
+    fast_check = _compile_fast_check(schema)
+    _SCHEMA_VALIDATORS[id(schema)] = (schema, validator, fast_check)
+    return validator, fast_check
+
+
+_FAST_SCALAR_TYPES: dict[str, type] = {"string": str, "boolean": bool}
+
+
+def _compile_fast_check(schema: object) -> _FastCheck | None:
+    """Specialize ``schema`` into a plain predicate, or ``None`` if unsupported.
+
+    Covers only the keywords ``services.schemas`` uses (``type``, ``enum``,
+    ``required``, ``properties``, ``additionalProperties``, ``items``,
+    ``minItems``, ``maxItems``); anything else falls back to jsonschema. The
+    predicate never accepts what jsonschema would reject, and a test checks
+    that for every project schema; on ``False`` the caller re-runs
+    jsonschema to find and report the actual error.
+    """
+    if not isinstance(schema, dict):
+        return None
+    if "enum" in schema:
+        values = schema["enum"]
+        if set(schema) - {"type", "enum"} or schema.get("type") != "string":
+            return None
+        if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            return None
+        allowed = frozenset(values)
+        return lambda instance: isinstance(instance, str) and instance in allowed
+    type_name = schema.get("type")
+    if type_name == "object":
+        return _compile_fast_object_check(schema)
+    if type_name == "array":
+        return _compile_fast_array_check(schema)
+    if not isinstance(type_name, str) or type_name not in _FAST_SCALAR_TYPES or len(schema) > 1:
+        return None
+    expected_type = _FAST_SCALAR_TYPES[type_name]
+    return lambda instance: isinstance(instance, expected_type)
+
+
+def _compile_fast_object_check(schema: dict[str, object]) -> _FastCheck | None:
+    if set(schema) - {"type", "required", "properties", "additionalProperties"}:
+        return None
+    required = schema.get("required", [])
+    properties = schema.get("properties", {})
+    additional = schema.get("additionalProperties", True)
+    if not isinstance(required, list) or not isinstance(properties, dict):
+        return None
+    if additional not in (True, False):
+        return None
+
+    property_checks: dict[str, _FastCheck] = {}
+    for name, subschema in properties.items():
+        check = _compile_fast_check(subschema)
+        if check is None:
+            return None
+        property_checks[name] = check
+    allow_additional = additional is True
+
+    def _check(instance: Any) -> bool:
+        if not isinstance(instance, dict):
+            return False
+        for name in required:
+            if name not in instance:
+                return False
+        for name, value in instance.items():
+            check = property_checks.get(name)
+            if check is None:
+                if not allow_additional:
+                    return False
+            elif not check(value):
+                return False
+        return True
+
+    return _check
+
+
+def _compile_fast_array_check(schema: dict[str, object]) -> _FastCheck | None:
+    if set(schema) - {"type", "items", "minItems", "maxItems"}:
+        return None
+    min_items = schema.get("minItems", 0)
+    max_items = schema.get("maxItems")
+    if type(min_items) is not int or (max_items is not None and type(max_items) is not int):
+        return None
+    item_check = _compile_fast_check(schema["items"]) if "items" in schema else None
+    if "items" in schema and item_check is None:
+        return None
+
+    def _check(instance: Any) -> bool:
+        if not isinstance(instance, list):
+            return False
+        if len(instance) < min_items or (max_items is not None and len(instance) > max_items):
+            return False
+        return item_check is None or all(item_check(item) for item in instance)
+
+    return _check
+
+
 def validate_https_links(payload: dict[str, Any]) -> list[str]:
     """Validate that all URL fields in payload use https absolute links."""
     errors: list[str] = []
@@ -155,28 +356,84 @@ def validate_https_links(payload: dict[str, Any]) -> list[str]:
 
 def validate_rendered_html(html: str) -> list[str]:
     """Run pre-send HTML checks for required sections and link quality."""
+    return validate_rendered_html_stream((html,))[1]
+
+
+def validate_rendered_html_stream(chunks: Iterable[str]) -> tuple[str, list[str]]:
+    """Validate HTML as it is produced and return the joined HTML with errors.
+
+    Each chunk is fed to an incremental parser as it arrives, so a streamed
+    template render is checked in the same pass instead of being re-parsed
+    into a full document tree afterwards.
+    """
+    scanner = _RenderedHtmlScanner()
+    parts: list[str] = []
+    for chunk in chunks:
+        parts.append(chunk)
+        scanner.feed(chunk)
+    scanner.close()
+    html = "".join(parts)
+
     errors: list[str] = []
-    if "{{{RESEND_UNSUBSCRIBE_URL}}}" not in html:
+    if _UNSUBSCRIBE_PLACEHOLDER not in html:
         errors.append("Missing unsubscribe placeholder")
 
-    if len(html) > 180_000:
+    if len(html) > _MAX_RENDERED_HTML_CHARS:
         errors.append("Rendered HTML exceeds size budget")
 
-    soup = BeautifulSoup(html, "html.parser")
-    if not soup.find(string=re.compile("What We've Been Up To|This Week in AI", re.IGNORECASE)):
+    if not scanner.has_section_header:
         errors.append("Missing required section headers")
 
-    for anchor in soup.find_all("a"):
-        href = str(anchor.get("href", "")).strip()
+    for href in scanner.hrefs:
         if not href:
             errors.append("Anchor tag missing href")
             continue
-        if href == "{{{RESEND_UNSUBSCRIBE_URL}}}":
+        if href == _UNSUBSCRIBE_PLACEHOLDER:
             continue
         if not _is_https_url(href):
             errors.append(f"Invalid anchor href: {href}")
 
-    return errors
+    return html, errors
+
+
+class _RenderedHtmlScanner(HTMLParser):
+    """Collect anchor hrefs and section-header presence from fed HTML."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.hrefs: list[str] = []
+        self.has_section_header = False
+        # Text between two tags can arrive split across feed() calls.
+        self._text: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._flush_text()
+        if tag == "a":
+            # Duplicate attributes resolve to the last value, as in BeautifulSoup.
+            self.hrefs.append((dict(attrs).get("href") or "").strip())
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush_text()
+
+    def handle_comment(self, data: str) -> None:
+        # BeautifulSoup's string search also matched comments; keep that behaviour.
+        self._flush_text()
+        self._text.append(data)
+        self._flush_text()
+
+    def handle_data(self, data: str) -> None:
+        if not self.has_section_header:
+            self._text.append(data)
+
+    def close(self) -> None:
+        super().close()
+        self._flush_text()
+
+    def _flush_text(self) -> None:
+        if self._text:
+            if _SECTION_HEADER_PATTERN.search("".join(self._text)):
+                self.has_section_header = True
+            self._text.clear()
 
 
 def _is_https_url(value: str) -> bool:
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any
 
 from config import AppConfig
-from services.composition import CompositionFailure, save_composition_dead_letter
+from services.composition import (
+    CompositionFailure,
+    compact_json,
+    repair_followups,
+    save_composition_dead_letter,
+)
 from services.llm import OpenRouterClient
 from services.schemas import NEWSLETTER_SCHEMA
 from services.validator import ContentValidationError, extract_json_payload, validate_json_payload
@@ -117,8 +121,10 @@ class NewsletterWriter:
             "plan": newsletter_plan,
         }
 
-        initial_prompt = self._build_prompt(input_payload)
-        prompt = initial_prompt
+        # Serialize once; the prompt and the dead letter share the same string.
+        payload_json = compact_json(input_payload)
+        prompt = self._build_prompt(payload_json)
+        followups: list[dict[str, str]] = []
         attempts = self._config.max_external_retries
         last_error = "unknown"
         last_output: str | None = None
@@ -127,6 +133,7 @@ class NewsletterWriter:
             result = self._llm_client.ask_claude(
                 system_prompt=WRITER_SYSTEM_PROMPT,
                 user_prompt=prompt,
+                followup_messages=followups,
                 temperature=0.5,
                 max_tokens=16384,
             )
@@ -151,8 +158,7 @@ class NewsletterWriter:
                     attempts,
                     last_error,
                 )
-                prompt = self._build_repair_prompt(
-                    original_prompt=initial_prompt,
+                followups = repair_followups(
                     invalid_output=result.content,
                     error_message=last_error,
                 )
@@ -162,7 +168,7 @@ class NewsletterWriter:
             stage="writer",
             attempts=attempts,
             error_summary=last_error,
-            input_payload=input_payload,
+            input_payload_json=payload_json,
             last_model_output=last_output,
         )
         raise CompositionFailure(
@@ -183,19 +189,20 @@ class NewsletterWriter:
             "current_draft": current_draft,
             "feedback": feedback_text,
         }
-        initial_prompt = (
+        payload_json = compact_json(input_payload)
+        prompt = (
             "You are revising an existing newsletter JSON payload.\n"
             "Apply only the requested feedback while preserving unchanged sections.\n"
             "Preserve the voice target and safety rules below while revising.\n\n"
             f"{VOICE_STYLE_GUIDE}\n"
             "Return valid JSON only and keep all required schema fields.\n"
             f"{NEWSLETTER_JSON_SCHEMA_SNIPPET}\n"
-            f"INPUT:\n{json.dumps(input_payload, indent=2, sort_keys=True)}\n\n"
+            f"INPUT:\n{payload_json}\n\n"
             "IMPORTANT: Respond ONLY with the JSON object. "
             "Do not include any explanation, commentary, or markdown formatting. "
             "Start your response with { and end with }."
         )
-        prompt = initial_prompt
+        followups: list[dict[str, str]] = []
         attempts = self._config.max_external_retries
         last_error = "unknown"
         last_output: str | None = None
@@ -204,6 +211,7 @@ class NewsletterWriter:
             result = self._llm_client.ask_claude(
                 system_prompt=WRITER_SYSTEM_PROMPT,
                 user_prompt=prompt,
+                followup_messages=followups,
                 temperature=0.5,
                 max_tokens=16384,
             )
@@ -226,8 +234,7 @@ class NewsletterWriter:
                     attempts,
                     last_error,
                 )
-                prompt = self._build_repair_prompt(
-                    original_prompt=initial_prompt,
+                followups = repair_followups(
                     invalid_output=result.content,
                     error_message=last_error,
                 )
@@ -237,7 +244,7 @@ class NewsletterWriter:
             stage="writer_revision",
             attempts=attempts,
             error_summary=last_error,
-            input_payload=input_payload,
+            input_payload_json=payload_json,
             last_model_output=last_output,
         )
         raise CompositionFailure(
@@ -247,7 +254,7 @@ class NewsletterWriter:
             dead_letter_path=dead_letter,
         )
 
-    def _build_prompt(self, payload: dict[str, Any]) -> str:
+    def _build_prompt(self, payload_json: str) -> str:
         return (
             "Write the weekly newsletter JSON from the planning payload.\n\n"
             f"{VOICE_STYLE_GUIDE}\n"
@@ -259,24 +266,8 @@ class NewsletterWriter:
             "or to get in touch about investment opportunities.\n"
             "- The entire newsletter should be readable in under 5 minutes.\n\n"
             f"{NEWSLETTER_JSON_SCHEMA_SNIPPET}\n"
-            f"INPUT:\n{json.dumps(payload, indent=2, sort_keys=True)}\n\n"
+            f"INPUT:\n{payload_json}\n\n"
             "IMPORTANT: Respond ONLY with the JSON object. "
             "Do not include any explanation, commentary, or markdown formatting. "
             "Start your response with { and end with }."
         )
-
-    @staticmethod
-    def _build_repair_prompt(
-        *,
-        original_prompt: str,
-        invalid_output: str,
-        error_message: str,
-    ) -> str:
-        return (
-            "Your previous output was invalid. Repair and return only valid JSON.\n"
-            f"Validation error: {error_message}\n\n"
-            "Original task:\n"
-            f"{original_prompt}\n\n"
-            "Invalid output:\n"
-            f"{invalid_output}"
-        )
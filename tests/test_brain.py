@@ -38,3 +38,16 @@ def test_append_and_read_published_stories(tmp_path: Path) -> None:
     assert len(entries) == 3
     assert entries[0].issue_date == "2026-02-27"
     assert entries[2].title == "Story C"
+
+
+def test_read_published_stories_reparses_only_after_file_changes(tmp_path: Path) -> None:
+    brain_path = tmp_path / "published_stories.md"
+    append_published_stories(brain_path, "2026-02-27", [("Story A", "https://example.com/a")])
+
+    first = read_published_stories(brain_path)
+    first.clear()
+    assert len(read_published_stories(brain_path)) == 1
+
+    append_published_stories(brain_path, "2026-03-06", [("Story B", "https://example.com/b")])
+
+    assert [entry.title for entry in read_published_stories(brain_path)] == ["Story A", "Story B"]
@@ -95,3 +95,18 @@ def test_stale_check(tmp_path: Path) -> None:
         )
 
     assert manager.is_current_draft_stale()
+
+
+def test_draft_dict_is_parsed_once_per_context(tmp_path: Path) -> None:
+    manager, _, _ = _setup_manager(tmp_path)
+    manager.create_or_replace_draft(
+        run_id="run-1",
+        draft_ts="1.0",
+        draft_json={"a": 1},
+        draft_html="<p>a</p>",
+    )
+
+    current = manager.get_current_draft()
+    assert current is not None
+    assert current.draft_dict == {"a": 1}
+    assert current.draft_dict is current.draft_dict
@@ -0,0 +1,29 @@
+"""Tests for the persistent RSS feed response cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from services.feed_cache import CachedFeed, FeedResponseCache
+
+
+def test_feed_cache_round_trips_and_overwrites(tmp_path: Path) -> None:
+    cache = FeedResponseCache(tmp_path / "feeds.sqlite")
+    url = "https://example.com/feed.xml"
+
+    assert cache.get(url) is None
+
+    cache.put(url, CachedFeed(etag='"v1"', last_modified=None, content=b"<rss>1</rss>"))
+    cache.put(url, CachedFeed(etag='"v2"', last_modified="Fri", content=b"<rss>2</rss>"))
+
+    assert cache.get(url) == CachedFeed(etag='"v2"', last_modified="Fri", content=b"<rss>2</rss>")
+
+
+def test_feed_cache_treats_storage_errors_as_misses(tmp_path: Path) -> None:
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("x", encoding="utf-8")
+    cache = FeedResponseCache(blocker / "feeds.sqlite")
+
+    cache.put("https://example.com/feed.xml", CachedFeed(etag="e", last_modified=None, content=b""))
+
+    assert cache.get("https://example.com/feed.xml") is None
@@ -0,0 +1,56 @@
+"""Tests for the persistent Google News URL cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from models import Confidence, SourceTier, StoryCandidate
+from services.google_news_cache import GoogleNewsUrlCache
+from services.quality import apply_canonicalization_and_tiering
+
+
+def test_cache_honors_separate_ttls_for_resolved_and_failed_urls(tmp_path: Path) -> None:
+    cache = GoogleNewsUrlCache(
+        tmp_path / "gn.sqlite",
+        resolved_ttl_seconds=100,
+        unresolved_ttl_seconds=10,
+    )
+    cache.put_many({"gn-a": "https://techcrunch.com/a", "gn-b": None}, now=1_000)
+
+    assert cache.get_many(["gn-a", "gn-b", "gn-c"], now=1_005) == {
+        "gn-a": "https://techcrunch.com/a",
+        "gn-b": None,
+    }
+    assert cache.get_many(["gn-a", "gn-b"], now=1_050) == {"gn-a": "https://techcrunch.com/a"}
+    assert cache.get_many(["gn-a", "gn-b"], now=1_200) == {}
+
+
+def test_google_news_cache_treats_storage_errors_as_misses(tmp_path: Path) -> None:
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("x", encoding="utf-8")
+    cache = GoogleNewsUrlCache(blocker / "gn.sqlite")
+
+    cache.put_many({"gn-a": "https://techcrunch.com/a"}, now=1_000)
+
+    assert cache.get_many(["gn-a"], now=1_005) == {}
+
+
+def test_cached_resolution_skips_network(tmp_path: Path) -> None:
+    url = "https://news.google.com/rss/articles/CBMiZmh0dHBz"
+    cache = GoogleNewsUrlCache(tmp_path / "gn.sqlite")
+    cache.put_many({url: "https://techcrunch.com/actual-article"})
+    story = StoryCandidate(
+        title="Story",
+        source_url=url,
+        source_name="Google News",
+        published_at=None,
+        confidence=Confidence.MEDIUM,
+        source_tier=SourceTier.TIER_3,
+    )
+
+    with patch("services.quality._GOOGLE_NEWS_SESSION.head") as head:
+        output = apply_canonicalization_and_tiering([story], url_cache=cache)
+
+    head.assert_not_called()
+    assert output[0].source_url == "https://techcrunch.com/actual-article"
@@ -5,7 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+import pytest
+
 from services.llm import OpenRouterClient
+from services.resilience import CircuitBreakerOpenError, ExternalServiceError
 
 
 @dataclass
@@ -31,7 +34,11 @@ class _FakeResponse:
 
 
 class _FakeCompletions:
-    def create(self, **_: Any) -> _FakeResponse:
+    def __init__(self) -> None:
+        self.last_kwargs: dict[str, Any] = {}
+
+    def create(self, **kwargs: Any) -> _FakeResponse:
+        self.last_kwargs = kwargs
         return _FakeResponse("result text", ["https://example.com/a"])
 
 
@@ -53,3 +60,55 @@ def test_openrouter_client_normalizes_content_and_citations(app_config: Any) ->
 
     assert result.content == "result text"
     assert result.citations == ("https://example.com/a",)
+
+
+def test_openrouter_clients_share_underlying_openai_client(app_config: Any) -> None:
+    first = OpenRouterClient(app_config)
+    second = OpenRouterClient(app_config)
+
+    assert first._client is second._client
+
+
+def test_openrouter_client_short_circuits_failing_model(app_config: Any) -> None:
+    class _FailingCompletions:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def create(self, **_: Any) -> _FakeResponse:
+            self.calls += 1
+            raise ValueError("model unavailable")
+
+    completions = _FailingCompletions()
+    fake_client = _FakeOpenAIClient()
+    fake_client.chat.completions = completions  # type: ignore[assignment]
+    client = OpenRouterClient(app_config)
+    client._client = fake_client  # type: ignore[assignment]
+
+    for _ in range(3):
+        with pytest.raises(ExternalServiceError):
+            client.ask_grok(user_prompt="trending?")
+    with pytest.raises(CircuitBreakerOpenError):
+        client.ask_grok(user_prompt="trending?")
+
+    assert completions.calls == 3
+
+
+def test_cached_prefix_is_sent_as_cache_control_block(app_config: Any) -> None:
+    client = OpenRouterClient(app_config)
+    fake = _FakeOpenAIClient()
+    client._client = fake  # type: ignore[assignment]
+
+    client.ask_claude(
+        system_prompt="sys",
+        cached_prefix="RULES",
+        user_prompt="INPUT",
+        followup_messages=[{"role": "assistant", "content": "oops"}],
+    )
+
+    messages = fake.chat.completions.last_kwargs["messages"]
+    assert messages[0] == {"role": "system", "content": "sys"}
+    assert messages[1]["content"] == [
+        {"type": "text", "text": "RULES", "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": "INPUT"},
+    ]
+    assert messages[2] == {"role": "assistant", "content": "oops"}
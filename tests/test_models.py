@@ -24,3 +24,39 @@ def test_story_candidate_fields() -> None:
 def test_enums_have_expected_values() -> None:
     assert DraftStatus.PENDING_REVIEW.value == "pending_review"
     assert RunStage.RENDER_VALIDATED.value == "render_validated"
+
+
+def test_story_candidate_uses_slots() -> None:
+    story = StoryCandidate(
+        title="Test",
+        source_url="https://example.com",
+        source_name="Example",
+        published_at=None,
+        confidence=Confidence.HIGH,
+        source_tier=SourceTier.TIER_1,
+    )
+
+    assert not hasattr(story, "__dict__")
+    story.metadata["key"] = "value"
+    assert story.metadata == {"key": "value"}
+
+
+def test_story_candidate_with_updates_merges_metadata() -> None:
+    story = StoryCandidate(
+        title="Test",
+        source_url="https://example.com",
+        source_name="Example",
+        published_at=None,
+        confidence=Confidence.LOW,
+        source_tier=SourceTier.TIER_3,
+        summary="Summary",
+        metadata={"origin": "rss"},
+    )
+
+    updated = story.with_updates({"note": "x"}, confidence=Confidence.HIGH)
+
+    assert updated.confidence == Confidence.HIGH
+    assert updated.source_tier == SourceTier.TIER_3
+    assert updated.summary == "Summary"
+    assert updated.metadata == {"origin": "rss", "note": "x"}
+    assert story.metadata == {"origin": "rss"}
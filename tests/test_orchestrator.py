@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import pytest
+
 from config import AppConfig
 from models import Confidence, DraftStatus, SourceTier, StoryCandidate
 from services.context_state import ConversationState
 from services.draft_manager import DraftManager
 from services.formatter import SlackPreviewResult
-from services.orchestrator import NewsletterOrchestrator
+from services.orchestrator import NewsletterOrchestrator, _chunk_text
 from services.research_pipeline import RankedStory, WeeklyResearchBundle
 from services.run_state import RunStage, RunStateStore
 from services.runtime_paths import bootstrap_runtime_paths
@@ -113,6 +116,16 @@ class _FakeRenderer:
             "</body></html>"
         )
 
+    def render_with_team_update(
+        self,
+        newsletter_payload: dict[str, Any],
+        *,
+        existing_html: str | None,
+        update: dict[str, Any],
+    ) -> str:
+        del existing_html, update
+        return self.render(newsletter_payload)
+
 
 class _FakeFormatter:
     def format_preview(self, newsletter_payload: dict[str, Any]) -> SlackPreviewResult:
@@ -296,7 +309,14 @@ def test_send_pipeline_completes_and_writes_backups(tmp_path: Path) -> None:
     assert current is not None
     assert current.draft_status == DraftStatus.SENT
 
-    assert config.run_state_db_path.with_suffix(".db.bak").exists()
+    orchestrator.wait_for_backups(timeout=5)
+    backup_path = config.run_state_db_path.with_suffix(".db.bak")
+    with sqlite3.connect(backup_path) as conn:
+        backed_up = conn.execute(
+            "SELECT stage FROM run_ledger WHERE run_id = ?", (run_id,)
+        ).fetchone()
+    assert backed_up is not None
+    assert not backup_path.with_suffix(".bak.tmp").exists()
     assert list((config.brain_file_path.parent / "archive").glob("published_stories_*.md"))
 
 
@@ -320,6 +340,26 @@ def test_full_dry_run_path_skips_live_send(tmp_path: Path) -> None:
     assert run.stage == RunStage.BRAIN_UPDATED
 
 
+def test_send_pipeline_posts_one_coalesced_status_message(tmp_path: Path) -> None:
+    orchestrator, draft_manager, run_state, slack_client, _sender, _config = _build_orchestrator(
+        tmp_path,
+        sender_dry_run=True,
+    )
+    run_outcome = orchestrator.trigger_run(trigger="manual")
+    run_id = run_outcome.run_id or _latest_run_id(run_state)
+    draft_manager.mark_status(status=DraftStatus.APPROVED)
+    posted_before = len(slack_client.messages)
+
+    send_outcome = orchestrator.send_approved_run(run_id=run_id)
+
+    assert send_outcome.accepted
+    orchestrator.wait_for_backups(timeout=5)
+    status_messages = slack_client.messages[posted_before:]
+    assert len(status_messages) == 2
+    assert "\n" in status_messages[0]["text"]
+    assert "backups written" in status_messages[1]["text"]
+
+
 def test_send_validation_failure_stays_send_requested(tmp_path: Path) -> None:
     orchestrator, draft_manager, run_state, _slack_client, _sender, _config = _build_orchestrator(
         tmp_path,
@@ -368,6 +408,24 @@ def test_include_late_update_injects_into_draft_json(tmp_path: Path) -> None:
     assert "Late Team Update" in titles
 
 
+def test_include_late_update_leaves_shared_draft_dict_intact(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    orchestrator, draft_manager, _run_state, _slack_client, _sender, _config = _build_orchestrator(
+        tmp_path,
+        sender_dry_run=True,
+    )
+    orchestrator.trigger_run(trigger="manual")
+    current = draft_manager.get_current_draft()
+    assert current is not None
+    original_updates = list(current.draft_dict["team_updates"])
+    monkeypatch.setattr(draft_manager, "get_current_draft", lambda: current)
+    orchestrator._context_state.record_late_update("123.45", "Late launch")  # noqa: SLF001
+
+    assert orchestrator.include_late_update(thread_ts="123.45").accepted
+    assert current.draft_dict["team_updates"] == original_updates
+
+
 def test_replay_resumes_send_from_send_requested(tmp_path: Path) -> None:
     orchestrator, draft_manager, run_state, _slack_client, sender, _config = _build_orchestrator(
         tmp_path,
@@ -429,3 +487,22 @@ def test_reset_starts_new_run_and_replaces_active_draft(tmp_path: Path) -> None:
     assert current is not None
     assert current.run_id == second_run_id
     assert current.draft_version == 1
+
+
+def test_full_draft_snippet_posts_heading_with_first_chunk(tmp_path: Path) -> None:
+    orchestrator, _, _, slack_client, _, _ = _build_orchestrator(tmp_path, sender_dry_run=True)
+    markdown = "\n".join(f"line {index} " + "x" * 60 for index in range(100))
+
+    orchestrator._post_full_draft_snippet(thread_ts="1.0", markdown=markdown)
+
+    texts = [message["text"] for message in slack_client.messages]
+    assert len(texts) == 3
+    assert texts[0].startswith("View full draft (canonical markdown preview):\n```\nline 0 ")
+    assert all(message["thread_ts"] == "1.0" for message in slack_client.messages)
+
+
+def test_chunk_text_splits_on_newlines_within_budget() -> None:
+    text = "alpha beta\n\ngamma delta\nepsilon"
+
+    assert _chunk_text(text, max_chars=12) == ["alpha beta", "gamma delta", "epsilon"]
+    assert _chunk_text("abcdefghij", max_chars=4) == ["abcd", "efgh", "ij"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import replace
 from datetime import UTC, datetime
 from typing import Any
@@ -10,7 +11,7 @@ import pytest
 
 from models import TeamUpdate
 from services.composition import CompositionFailure
-from services.planner import NewsletterPlanner
+from services.planner import NewsletterPlanner, _truncate
 from services.schemas import PLANNER_SCHEMA
 from services.validator import validate_json_payload, ContentValidationError
 
@@ -88,6 +89,7 @@ def test_planner_failure_writes_dead_letter(app_config: Any) -> None:
     assert exc_info.value.dead_letter_path.exists()
     payload = exc_info.value.dead_letter_path.read_text(encoding="utf-8")
     assert '"stage": "planner"' in payload
+    assert json.loads(payload)["input_payload"] == {"industry_stories": [], "team_updates": []}
 
 
 def test_planner_prompt_includes_style_guidance(app_config: Any) -> None:
@@ -113,10 +115,11 @@ def test_planner_prompt_includes_style_guidance(app_config: Any) -> None:
     planner = NewsletterPlanner(app_config, llm)  # type: ignore[arg-type]
     planner.create_plan(team_updates=[], industry_story_inputs=[])
 
-    prompt = str(llm.last_kwargs.get("user_prompt", ""))
+    prompt = str(llm.last_kwargs.get("cached_prefix", ""))
     assert "STYLE INTENT FOR DOWNSTREAM WRITING" in prompt
     assert "plain language" in prompt
     assert "BANNED WORDS" in prompt or "NEVER use these words" in prompt
+    assert str(llm.last_kwargs["user_prompt"]).startswith("INPUT:\n")
 
 
 def test_planner_schema_rejects_more_than_8_stories() -> None:
@@ -144,3 +147,123 @@ def test_planner_schema_rejects_more_than_8_stories() -> None:
     }
     with pytest.raises(ContentValidationError, match="too long"):
         validate_json_payload(invalid_payload, PLANNER_SCHEMA)
+
+
+def test_planner_repair_resends_original_prompt_with_followups(app_config: Any) -> None:
+    config = replace(app_config, max_external_retries=2)
+    llm = _FakeLLM(outputs=["not json", "still not json"])
+    planner = NewsletterPlanner(config, llm)  # type: ignore[arg-type]
+
+    with pytest.raises(CompositionFailure):
+        planner.create_plan(team_updates=[], industry_story_inputs=[])
+
+    prompt = str(llm.last_kwargs.get("user_prompt", ""))
+    assert prompt.startswith('INPUT:\n{"industry_stories":[],"team_updates":[]}')
+    followups = llm.last_kwargs["followup_messages"]
+    assert followups[0] == {"role": "assistant", "content": "not json"}
+    assert followups[1]["content"].startswith("Your previous output was invalid.")
+
+
+def test_planner_reuses_cached_plan_for_identical_input(app_config: Any) -> None:
+    llm = _FakeLLM(
+        outputs=[
+            """
+            {
+              "team_section": {"include": true, "items": []},
+              "industry_section": {"items": [{
+                "headline": "Story",
+                "hook": "Hook",
+                "why_it_matters": "Why",
+                "source_url": "https://example.com",
+                "source_name": "Example",
+                "published_at": "2026-02-27T00:00:00Z",
+                "confidence": "high"
+              }]},
+              "cta": {"text": "Reach out"}
+            }
+            """
+        ]
+    )
+    planner = NewsletterPlanner(app_config, llm)  # type: ignore[arg-type]
+
+    first = planner.create_plan(team_updates=[], industry_story_inputs=[])
+    second = NewsletterPlanner(app_config, llm).create_plan(  # type: ignore[arg-type]
+        team_updates=[], industry_story_inputs=[]
+    )
+
+    assert first == second
+    assert llm.calls == 1
+
+
+def test_planner_cache_misses_after_prompt_change(
+    app_config: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import services.planner as planner_module
+
+    llm = _FakeLLM(
+        outputs=[
+            """
+            {
+              "team_section": {"include": false, "items": []},
+              "industry_section": {"items": [{
+                "headline": "Story",
+                "hook": "Hook",
+                "why_it_matters": "Why",
+                "source_url": "https://example.com",
+                "source_name": "Example",
+                "published_at": "2026-02-27T00:00:00Z",
+                "confidence": "high"
+              }]},
+              "cta": {"text": "Reach out"}
+            }
+            """
+        ]
+    )
+    NewsletterPlanner(app_config, llm).create_plan(  # type: ignore[arg-type]
+        team_updates=[], industry_story_inputs=[]
+    )
+    monkeypatch.setattr(planner_module, "_PLAN_CACHE_FINGERPRINT", b"changed-rules")
+    NewsletterPlanner(app_config, llm).create_plan(  # type: ignore[arg-type]
+        team_updates=[], industry_story_inputs=[]
+    )
+
+    assert llm.calls == 2
+
+
+def test_planner_regenerates_plan_when_story_set_changes(app_config: Any) -> None:
+    plan_json = """
+    {
+      "team_section": {"include": false, "items": []},
+      "industry_section": {"items": [{
+        "headline": "Story",
+        "hook": "Hook",
+        "why_it_matters": "Why",
+        "source_url": "https://example.com/0",
+        "source_name": "Example",
+        "published_at": "2026-02-27T00:00:00Z",
+        "confidence": "high"
+      }]},
+      "cta": {"text": "Reach out"}
+    }
+    """
+    llm = _FakeLLM(outputs=[plan_json])
+
+    def _stories(indexes: range | list[int]) -> list[dict[str, str | int | None]]:
+        return [
+            {"title": f"Story {i}", "source_url": f"https://example.com/{i}", "summary": "S"}
+            for i in indexes
+        ]
+
+    planner = NewsletterPlanner(app_config, llm)  # type: ignore[arg-type]
+    planner.create_plan(team_updates=[], industry_story_inputs=_stories(range(10)))
+    # A plan is only reused for the exact input it was built from.
+    planner.create_plan(team_updates=[], industry_story_inputs=_stories([*range(9), 10]))
+    assert llm.calls == 2
+
+
+def test_truncate_clips_at_last_word_boundary() -> None:
+    assert _truncate("alpha beta gamma", 12) == "alpha beta…"
+    assert _truncate("alphabetagamma", 5) == "alpha…"
+    assert _truncate("short", 10) == "short"
+    assert _truncate("", 0) == ""
+    assert _truncate(None, 5) is None
@@ -10,6 +10,7 @@ from services.quality import (
     assign_source_tier,
     canonicalize_url,
     enforce_numeric_claim_verification,
+    enforce_numeric_claims_and_recency,
     enforce_recency,
     to_planning_inputs,
     validate_citation_fields,
@@ -50,6 +51,12 @@ def test_assign_source_tier_for_known_domains() -> None:
     assert assign_source_tier("https://random-substack.com/y") == SourceTier.TIER_3
 
 
+def test_assign_source_tier_matches_subdomains_only_on_label_boundaries() -> None:
+    assert assign_source_tier("https://platform.openai.com/docs") == SourceTier.TIER_1
+    assert assign_source_tier("https://finance.bloomberg.com/x") == SourceTier.TIER_2
+    assert assign_source_tier("https://notopenai.com/y") == SourceTier.TIER_3
+
+
 def test_apply_canonicalization_and_tiering_updates_fields() -> None:
     stories = [
         _story(title="Story", url="https://www.openai.com/blog/?utm_medium=email"),
@@ -84,6 +91,27 @@ def test_numeric_claim_verification_promotes_or_demotes() -> None:
     assert verified[1].metadata["numeric_claims_verified"] is False
 
 
+def test_numeric_claim_verification_requires_two_domains() -> None:
+    first = _story(title="Lab raises $2B", url="https://a.example/one")
+    same_domain = _story(title="Lab raises $2B again", url="https://a.example/two")
+    lonely = _story(title="Robot costs $40K", url="https://c.example/robot")
+    corroborated = _story(title="Lab raises $2B, per reports", url="https://b.example/x")
+
+    verified = enforce_numeric_claim_verification([first, same_domain, lonely])
+    assert [story.metadata["numeric_claims_verified"] for story in verified] == [
+        False,
+        False,
+        False,
+    ]
+
+    verified = enforce_numeric_claim_verification([first, corroborated, lonely])
+    assert [story.metadata["numeric_claims_verified"] for story in verified] == [
+        True,
+        True,
+        False,
+    ]
+
+
 def test_enforce_recency_handles_missing_and_stale_dates() -> None:
     now = datetime.now(UTC)
     in_window = _story(title="In", url="https://a.com", published_at=now - timedelta(days=1))
@@ -103,6 +131,25 @@ def test_enforce_recency_handles_missing_and_stale_dates() -> None:
     assert missing_story.metadata["missing_timestamp"] is True
 
 
+def test_fused_claims_and_recency_matches_sequential_passes() -> None:
+    now = datetime.now(UTC)
+    stories = [
+        _story(title="Raises $5B", url="https://a.com/1", published_at=now - timedelta(days=1)),
+        _story(title="Also $5B", url="https://b.com/2", published_at=now - timedelta(days=30)),
+        _story(title="Up 40%", url="https://c.com/3", published_at=None),
+        _story(title="No claims", url="https://d.com/4", published_at=now - timedelta(days=2)),
+    ]
+    window = {"start_at": now - timedelta(days=7), "end_at": now}
+
+    fused = enforce_numeric_claims_and_recency(stories, **window)
+
+    assert fused == enforce_recency(enforce_numeric_claim_verification(stories), **window)
+    assert [story.title for story in fused] == ["Raises $5B", "Up 40%", "No claims"]
+    assert fused[0].confidence == Confidence.HIGH
+    assert fused[1].metadata["verification_note"] == "missing published_at"
+    assert fused[2] is stories[3]
+
+
 def test_citation_validation_and_planning_payload() -> None:
     story = _story(
         title="Story",
@@ -128,7 +175,7 @@ def test_canonicalize_resolves_google_news_url() -> None:
     mock_response = MagicMock()
     mock_response.url = "https://techcrunch.com/actual-article"
 
-    with patch("services.quality.requests.head", return_value=mock_response):
+    with patch("services.quality._GOOGLE_NEWS_SESSION.head", return_value=mock_response):
         result = canonicalize_url(
             "https://news.google.com/rss/articles/CBMiZmh0dHBz"
         )
@@ -140,9 +187,70 @@ def test_canonicalize_google_news_url_fallback_on_failure() -> None:
     """Google News URL resolution falls back to original on network error."""
     from unittest.mock import patch
 
-    with patch("services.quality.requests.head", side_effect=Exception("timeout")):
+    with patch("services.quality._GOOGLE_NEWS_SESSION.head", side_effect=Exception("timeout")):
         result = canonicalize_url(
             "https://news.google.com/rss/articles/CBMiZmh0dHBz"
         )
 
     assert "news.google.com" in result
+
+
+def test_tiering_resolves_unresolvable_google_news_url_once() -> None:
+    from unittest.mock import patch
+
+    stories = [_story(title="Story", url="https://news.google.com/rss/articles/CBMiZmh0dHBz")]
+
+    with patch(
+        "services.quality._GOOGLE_NEWS_SESSION.head",
+        side_effect=Exception("timeout"),
+    ) as head:
+        output = apply_canonicalization_and_tiering(stories)
+
+    assert head.call_count == 1
+    assert output[0].source_tier == SourceTier.TIER_3
+
+
+def test_tiering_resolves_each_google_news_url_once_per_batch() -> None:
+    from unittest.mock import MagicMock, patch
+
+    def _head(url: str, **_: object) -> MagicMock:
+        response = MagicMock()
+        response.url = f"https://techcrunch.com/{url.rsplit('/', 1)[-1]}"
+        return response
+
+    stories = [
+        _story(title="A", url="https://news.google.com/rss/articles/AAA"),
+        _story(title="B", url="https://news.google.com/rss/articles/BBB"),
+        _story(title="A again", url="https://news.google.com/rss/articles/AAA"),
+    ]
+
+    with patch("services.quality._GOOGLE_NEWS_SESSION.head", side_effect=_head) as head:
+        output = apply_canonicalization_and_tiering(stories)
+
+    assert head.call_count == 2
+    assert [story.source_url for story in output] == [
+        "https://techcrunch.com/AAA",
+        "https://techcrunch.com/BBB",
+        "https://techcrunch.com/AAA",
+    ]
+    assert all(story.source_tier == SourceTier.TIER_2 for story in output)
+
+
+def test_canonicalize_caches_normalization_but_not_resolution() -> None:
+    from unittest.mock import MagicMock, patch
+
+    from services.quality import _normalize_url
+
+    url = "https://www.example.com/cached//path/?utm_source=x&id=1"
+    first = canonicalize_url(url)
+    hits = _normalize_url.cache_info().hits
+    assert canonicalize_url(url) == first == "https://example.com/cached/path?id=1"
+    assert _normalize_url.cache_info().hits == hits + 1
+
+    response = MagicMock()
+    response.url = "https://techcrunch.com/cached"
+    with patch("services.quality._GOOGLE_NEWS_SESSION.head", return_value=response) as head:
+        canonicalize_url("https://news.google.com/rss/articles/CACHED")
+        canonicalize_url("https://news.google.com/rss/articles/CACHED")
+
+    assert head.call_count == 2
@@ -9,6 +9,8 @@ import pytest
 from services.renderer import NewsletterRenderer
 from services.validator import ContentValidationError
 
+_TEMPLATE_PATH = Path(__file__).resolve().parents[1] / "templates" / "newsletter_base.html"
+
 
 def _payload() -> dict[str, object]:
     return {
@@ -53,3 +55,27 @@ def test_renderer_rejects_invalid_links() -> None:
 
     with pytest.raises(ContentValidationError):
         renderer.render(payload)
+
+
+def test_render_with_team_update_splices_row_into_existing_html() -> None:
+    renderer = NewsletterRenderer(template_path=_TEMPLATE_PATH)
+    payload = _payload()
+    html = renderer.render(payload)
+    update = {"title": "Late <Update>", "summary": "Shipped"}
+    payload["team_updates"] = [{"title": "Update", "summary": "Summary"}, update]
+
+    spliced = renderer.render_with_team_update(payload, existing_html=html, update=update)
+
+    assert "Late &lt;Update&gt;" in spliced
+    assert spliced.index("Late &lt;Update&gt;") < spliced.index("This Week in AI")
+    assert spliced.count("<!-- /team-updates -->") == 1
+
+
+def test_render_with_team_update_falls_back_without_anchor() -> None:
+    renderer = NewsletterRenderer(template_path=_TEMPLATE_PATH)
+    payload = _payload()
+    update = {"title": "Late", "summary": "Shipped"}
+
+    html = renderer.render_with_team_update(payload, existing_html="<html></html>", update=update)
+
+    assert "AI Weekly" in html
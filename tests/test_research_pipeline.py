@@ -50,7 +50,7 @@ class _FakeNewsResearcher:
     def run_weekly_research(self) -> list[QueryResearchResult]:
         return self.results
 
-    def to_story_candidates(self, _: list[QueryResearchResult]) -> list[StoryCandidate]:
+    def to_story_candidates(self, _: list[QueryResearchResult], **__: Any) -> list[StoryCandidate]:
         return self.stories
 
 
@@ -266,3 +266,127 @@ def test_research_pipeline_collects_and_ranks(app_config: Any) -> None:
     assert len(bundle.source_stories) >= 1
     assert len(bundle.perplexity_results) == 1
     assert len(bundle.ranked_stories) >= 1
+
+
+def test_research_pipeline_keeps_llm_stories_when_window_ended_in_the_past(
+    app_config: Any,
+) -> None:
+    from services.news_researcher import NewsResearcher
+
+    class _FakePerplexity:
+        def ask_perplexity(self, *, user_prompt: str, **_: Any) -> Any:
+            return type(
+                "Resp",
+                (),
+                {
+                    "content": "[Agent platform launch](https://q.com/agents)",
+                    "citations": ["https://q.com/agents"],
+                },
+            )()
+
+    end_at = datetime.now(UTC) - timedelta(days=2)
+    pipeline = ResearchPipeline(
+        config=app_config,
+        slack_reader=_FakeSlackReader(updates=[]),  # type: ignore[arg-type]
+        rss_reader=_FakeRssReader(stories=[]),  # type: ignore[arg-type]
+        hacker_news_reader=_FakeHnReader(stories=[]),  # type: ignore[arg-type]
+        news_researcher=NewsResearcher(_FakePerplexity(), queries=("Q",)),  # type: ignore[arg-type]
+    )
+
+    bundle = pipeline.run_weekly(
+        start_at=end_at - timedelta(days=7),
+        end_at=end_at,
+        published_stories=[],
+    )
+
+    assert [ranked.story.source_url for ranked in bundle.ranked_stories] == ["https://q.com/agents"]
+    assert bundle.ranked_stories[0].story.published_at == end_at
+
+
+def test_fuzzy_title_index_matches_full_scan() -> None:
+    import random
+    from difflib import SequenceMatcher
+
+    from services.research_pipeline import _FuzzyTitleIndex
+
+    rng = random.Random(3)
+    words = ["openai", "ships", "agents", "model", "funding", "a", "new", "enterprise", "gemini"]
+
+    def title() -> str:
+        return " ".join(rng.choice(words) for _ in range(rng.randint(1, 8)))
+
+    published = [title() for _ in range(200)]
+    index = _FuzzyTitleIndex(published, threshold=0.82)
+
+    for query in (title() for _ in range(200)):
+        expected = any(
+            SequenceMatcher(None, query, existing).ratio() >= 0.82 for existing in published
+        )
+        assert index.matches(query) is expected
+
+
+def test_merge_primary_dedupe_matches_reordered_title_words() -> None:
+    stories = [
+        _story("Anthropic, OpenAI sign safety pact", "https://a.com/1"),
+        _story("OpenAI, Anthropic Sign Safety Pact", "https://b.com/2"),
+        _story("OpenAI and Anthropic sign safety pact", "https://c.com/3"),
+    ]
+
+    deduped = merge_primary_dedupe(stories)
+
+    assert [story.source_url for story in deduped] == ["https://a.com/1", "https://c.com/3"]
+
+
+def test_filter_previously_published_keeps_reordered_title_with_low_similarity() -> None:
+    now = datetime(2026, 3, 1, tzinfo=UTC)
+    candidates = [_story("Apple sues Samsung over chip patents", "https://new.com/suit")]
+    published = [
+        PublishedStory(
+            issue_date="2026-02-27",
+            title="Samsung sues Apple over chip patents",
+            url="https://old.com/suit",
+        ),
+    ]
+
+    filtered = filter_previously_published(
+        candidates=candidates,
+        published=published,
+        lookback_weeks=12,
+        now=now,
+    )
+
+    assert filtered == candidates
+
+
+def test_extract_key_entities_stops_at_word_boundaries() -> None:
+    from services.research_pipeline import _extract_key_entities
+
+    assert _extract_key_entities("Big Apple PieXy ships GPT4 with OpenAI") == {
+        "big apple",
+        "piexy",
+        "openai",
+    }
+    assert _extract_key_entities("A" + "a" * 5000 + "1") == frozenset()
+
+
+def test_normalize_url_fast_path_matches_urlparse() -> None:
+    from urllib.parse import urlparse
+
+    from services.research_pipeline import _normalize_url
+
+    def via_urlparse(url: str) -> str:
+        parsed = urlparse(url.strip().rstrip("/"))
+        host = parsed.netloc.lower().removeprefix("www.")
+        return f"{host}{parsed.path}".lower()
+
+    for url in (
+        "https://www.Example.com/Path/?utm_source=x#frag",
+        "HTTP://user@host:8080/a/b/",
+        "https://example.com/a;params?q=1",
+        "https://[::1]/a",
+        "https://example.com/a\tb",
+        "example.com/no-scheme",
+        "mailto:someone@example.com",
+        "https://exämple.com/ü",
+    ):
+        assert _normalize_url(url) == via_urlparse(url)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import pytest
 
 from services.resilience import (
+    CircuitBreaker,
     CircuitBreakerOpenError,
     CircuitBreakerState,
     ExternalServiceError,
@@ -29,6 +30,21 @@ def test_resilience_policy_retries_then_succeeds() -> None:
     assert policy.breaker.state == CircuitBreakerState.CLOSED
 
 
+def test_resilience_policy_restarts_attempts_on_each_call() -> None:
+    attempts = {"count": 0}
+
+    def fails_every_other_attempt() -> str:
+        attempts["count"] += 1
+        if attempts["count"] % 2:
+            raise OSError("transient")
+        return "ok"
+
+    policy = ResiliencePolicy(name="test", max_attempts=2)
+
+    assert [policy.execute(fails_every_other_attempt) for _ in range(3)] == ["ok"] * 3
+    assert attempts["count"] == 6
+
+
 def test_circuit_breaker_opens_after_failed_calls() -> None:
     policy = ResiliencePolicy(
         name="test",
@@ -46,3 +62,20 @@ def test_circuit_breaker_opens_after_failed_calls() -> None:
 
     with pytest.raises(CircuitBreakerOpenError):
         policy.execute(lambda: "should not run")
+
+
+def test_success_resets_failure_count_and_recovers_half_open() -> None:
+    breaker = CircuitBreaker(name="test", failure_threshold=2, recovery_timeout_seconds=0)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreakerState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreakerState.OPEN
+
+    breaker.before_call()
+    assert breaker.state == CircuitBreakerState.HALF_OPEN
+    breaker.record_success()
+    assert breaker.state == CircuitBreakerState.CLOSED
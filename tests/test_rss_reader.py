@@ -50,6 +50,8 @@ def test_collect_recent_stories_filters_old_and_dedupes(app_config: Any, monkeyp
 
     class _FakeResponse:
         content = b"xml"
+        status_code = 200
+        headers: dict[str, str] = {}
 
         def raise_for_status(self) -> None:
             return None
@@ -57,10 +59,10 @@ def test_collect_recent_stories_filters_old_and_dedupes(app_config: Any, monkeyp
     def _fake_get(*_: Any, **__: Any) -> _FakeResponse:
         return _FakeResponse()
 
-    monkeypatch.setattr(requests, "get", _fake_get)
+    monkeypatch.setattr(requests.Session, "get", _fake_get)
     monkeypatch.setattr(
         "services.rss_reader.feedparser.parse",
-        lambda _: SimpleNamespace(entries=fake_entries),
+        lambda *_, **__: SimpleNamespace(entries=fake_entries),
     )
 
     stories = reader.collect_recent_stories(lookback_days=7, now=now)
@@ -84,9 +86,89 @@ def test_collect_recent_stories_raises_when_all_sources_fail(
     def _fake_get(*_: Any, **__: Any) -> Any:
         raise requests.RequestException("boom")
 
-    monkeypatch.setattr(requests, "get", _fake_get)
+    monkeypatch.setattr(requests.Session, "get", _fake_get)
 
     with pytest.raises(Exception) as exc_info:
         reader.collect_recent_stories()
 
     assert "All RSS sources failed" in str(exc_info.value)
+
+
+def test_parse_feed_normalizes_entries() -> None:
+    from services.rss_reader import _parse_feed
+
+    source = FeedSource(
+        name="Test Feed",
+        url="https://example.com/feed.xml",
+        source_tier=SourceTier.TIER_2,
+        default_confidence=Confidence.MEDIUM,
+    )
+    content = (
+        b"<?xml version='1.0'?><rss version='2.0'><channel><title>Feed</title>"
+        b"<item><title>Agent launch</title><link>https://example.com/a</link>"
+        b"<pubDate>Fri, 27 Feb 2026 10:00:00 GMT</pubDate>"
+        b"<description>&lt;p&gt;Summary&lt;script&gt;x()&lt;/script&gt;&lt;/p&gt;</description>"
+        b"</item><item><title></title><link>https://example.com/b</link></item>"
+        b"</channel></rss>"
+    )
+
+    stories = _parse_feed(content, source)
+
+    assert len(stories) == 1
+    assert stories[0].title == "Agent launch"
+    assert stories[0].published_at == datetime(2026, 2, 27, 10, 0, tzinfo=UTC)
+    assert stories[0].summary == "<p>Summary</p>"
+    assert stories[0].source_tier == SourceTier.TIER_2
+
+
+def test_fetch_feed_replays_cached_body_on_not_modified(
+    app_config: Any,
+    monkeypatch: Any,
+) -> None:
+    source = FeedSource(
+        name="Test Feed",
+        url="https://example.com/feed.xml",
+        source_tier=SourceTier.TIER_2,
+        default_confidence=Confidence.MEDIUM,
+    )
+    reader = RSSReader(app_config, feed_sources=(source,))
+    responses = [
+        SimpleNamespace(
+            status_code=200,
+            headers={"ETag": '"v1"', "Last-Modified": "Fri, 27 Feb 2026 10:00:00 GMT"},
+            content=b"<rss>v1</rss>",
+            raise_for_status=lambda: None,
+        ),
+        SimpleNamespace(
+            status_code=304,
+            headers={},
+            content=b"",
+            raise_for_status=lambda: None,
+        ),
+    ]
+    sent_headers: list[dict[str, str]] = []
+
+    def _fake_get(_: Any, url: str, *, headers: dict[str, str], **__: Any) -> Any:
+        sent_headers.append(headers)
+        return responses[len(sent_headers) - 1]
+
+    monkeypatch.setattr(requests.Session, "get", _fake_get)
+
+    assert reader._fetch_feed(source) == b"<rss>v1</rss>"
+    assert reader._fetch_feed(source) == b"<rss>v1</rss>"
+    assert sent_headers == [
+        {},
+        {"If-None-Match": '"v1"', "If-Modified-Since": "Fri, 27 Feb 2026 10:00:00 GMT"},
+    ]
+
+
+def test_injected_session_keeps_its_adapters(app_config: Any) -> None:
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    retrying_adapter = HTTPAdapter(max_retries=5)
+    session.mount("https://", retrying_adapter)
+
+    RSSReader(app_config, session=session)
+
+    assert session.get_adapter("https://example.com/feed.xml") is retrying_adapter
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sqlite3
 from pathlib import Path
 
 import pytest
@@ -27,7 +28,7 @@ def test_run_lifecycle_persists_across_store_instances(tmp_path: Path) -> None:
     persisted = reopened.get_run(run_id)
     assert persisted is not None
     assert persisted.stage == RunStage.SEND_REQUESTED
-    assert '"attempt": 1' in persisted.payload_json
+    assert '"attempt":1' in persisted.payload_json
 
 
 def test_invalid_transition_raises(tmp_path: Path) -> None:
@@ -65,3 +66,175 @@ def test_upsert_and_read_draft_state(tmp_path: Path) -> None:
     persisted = store.get_draft_state(run_id)
     assert persisted is not None
     assert persisted.draft_ts == "123.456"
+
+
+def test_get_draft_states_returns_existing_drafts_by_run_id(tmp_path: Path) -> None:
+    store = RunStateStore(tmp_path / "run_state.db")
+    store.initialize()
+    for run_id in ("run-1", "run-2", "run-3"):
+        store.create_run(run_id)
+    store.upsert_draft_state("run-1", 1, DraftStatus.APPROVED, "1.0", "{}", "<p>1</p>")
+    store.upsert_draft_state("run-3", 2, DraftStatus.PENDING_REVIEW, "3.0", "{}", "<p>3</p>")
+
+    drafts = store.get_draft_states(["run-1", "run-2", "run-3", "run-1"])
+
+    assert set(drafts) == {"run-1", "run-3"}
+    assert drafts["run-1"].draft_status == DraftStatus.APPROVED
+    assert drafts["run-3"].draft_version == 2
+    assert store.get_draft_states([]) == {}
+
+
+def test_draft_blobs_are_compressed_and_legacy_text_rows_still_read(tmp_path: Path) -> None:
+    db_path = tmp_path / "run_state.db"
+    store = RunStateStore(db_path)
+    store.initialize()
+    store.create_run("run-1")
+    store.create_run("run-legacy")
+    html = "<html>" + "story " * 500 + "</html>"
+
+    store.upsert_draft_state("run-1", 1, DraftStatus.PENDING_REVIEW, "1.0", '{"a": 1}', html)
+    with sqlite3.connect(db_path) as conn:
+        raw_html = conn.execute(
+            "SELECT draft_html FROM draft_state WHERE run_id = 'run-1'"
+        ).fetchone()[0]
+        conn.execute(
+            "INSERT INTO draft_state VALUES ('run-legacy', 1, 'pending_review', NULL, '{}', "
+            "'<html></html>', '2026-01-01T00:00:00+00:00')"
+        )
+
+    assert isinstance(raw_html, bytes)
+    assert len(raw_html) < len(html)
+    draft = store.get_draft_state("run-1")
+    assert draft is not None
+    assert draft.draft_html == html
+    assert draft.draft_json == '{"a": 1}'
+    legacy = store.get_draft_state("run-legacy")
+    assert legacy is not None
+    assert legacy.draft_html == "<html></html>"
+
+
+def test_store_reuses_one_connection_across_threads_and_reopens_after_close(
+    tmp_path: Path,
+) -> None:
+    import threading
+
+    store = RunStateStore(tmp_path / "run_state.db")
+    store.initialize()
+    store.create_run("run-1")
+
+    worker = threading.Thread(target=store.set_run_error, args=("run-1", "boom"))
+    worker.start()
+    worker.join()
+
+    with pytest.raises(RunStateError):
+        store.create_run("run-1")
+    store.close()
+
+    record = store.get_run("run-1")
+    assert record is not None
+    assert record.last_error == "boom"
+
+
+def test_payload_patch_and_error_updates_return_the_written_row(tmp_path: Path) -> None:
+    store = RunStateStore(tmp_path / "run_state.db")
+    store.initialize()
+    store.create_run("run-1", payload={"keep": True, "attempt": 1})
+
+    patched = store.patch_run_payload("run-1", {"attempt": 2})
+    assert patched.payload_json == '{"attempt":2,"keep":true}'
+    errored = store.set_run_error("run-1", "boom")
+    assert errored.last_error == "boom"
+    assert errored.payload_json == patched.payload_json
+
+    with pytest.raises(RunStateError, match="Run not found"):
+        store.set_run_error("missing", "boom")
+    with pytest.raises(RunStateError, match="Run not found"):
+        store.patch_run_payload("missing", {"attempt": 1})
+
+
+def test_run_and_draft_listings_use_indexes(tmp_path: Path) -> None:
+    db_path = tmp_path / "run_state.db"
+    RunStateStore(db_path).initialize()
+
+    with sqlite3.connect(db_path) as conn:
+        incomplete_plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT run_id, payload_json FROM run_ledger "
+            "WHERE stage != ? ORDER BY created_at ASC",
+            (RunStage.BRAIN_UPDATED.value,),
+        ).fetchall()
+        incomplete_ids_plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT run_id, stage FROM run_ledger "
+            "WHERE stage != ? ORDER BY created_at ASC",
+            (RunStage.BRAIN_UPDATED.value,),
+        ).fetchall()
+        latest_draft_plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT run_id FROM draft_state ORDER BY updated_at DESC LIMIT 1"
+        ).fetchall()
+
+    assert "USING INDEX idx_run_ledger_created_stage_id" in str(incomplete_plan)
+    assert "USING INDEX idx_draft_state_updated_at" in str(latest_draft_plan)
+    assert "USING COVERING INDEX idx_run_ledger_created_stage_id" in str(incomplete_ids_plan)
+    assert "TEMP B-TREE" not in str(incomplete_plan + incomplete_ids_plan + latest_draft_plan)
+
+
+def test_create_and_upsert_return_records_matching_stored_rows(tmp_path: Path) -> None:
+    store = RunStateStore(tmp_path / "run_state.db")
+    store.initialize()
+
+    created = store.create_run("run-1", payload={"trigger": "manual"})
+    assert created == store.get_run("run-1")
+
+    draft = store.upsert_draft_state(
+        "run-1", 2, DraftStatus.PENDING_REVIEW, "1.0", '{"a": 1}', "<p>x</p>"
+    )
+    assert draft == store.get_draft_state("run-1")
+
+
+def test_iter_runs_pages_in_creation_order_and_allows_store_calls(tmp_path: Path) -> None:
+    store = RunStateStore(tmp_path / "run_state.db")
+    store.initialize()
+    for index in range(230):
+        store.create_run(f"run-{index:03d}")
+    store.transition_run("run-005", RunStage.SEND_REQUESTED)
+
+    streamed = []
+    for record in store.iter_runs():
+        streamed.append(record)
+        store.get_run(record.run_id)
+
+    assert streamed == store.list_runs()
+    assert list(store.iter_incomplete_runs()) == store.list_incomplete_runs()
+    assert store.list_incomplete_run_ids()[:6] == [
+        (f"run-{index:03d}", RunStage.SEND_REQUESTED if index == 5 else RunStage.DRAFT_READY)
+        for index in range(6)
+    ]
+
+
+def test_transition_merges_payload_shallowly_and_guards_stage(tmp_path: Path) -> None:
+    store = RunStateStore(tmp_path / "run_state.db")
+    store.initialize()
+    store.create_run("run-1", payload={"meta": {"a": 1, "b": 2}, "keep": "x"})
+
+    moved = store.transition_run("run-1", RunStage.SEND_REQUESTED, {"meta": {"a": 3}, "keep": None})
+    assert moved.stage == RunStage.SEND_REQUESTED
+    assert moved.payload_json == '{"keep":null,"meta":{"a":3}}'
+
+    with pytest.raises(RunStateError, match="send_requested -> broadcast_sent"):
+        store.transition_run("run-1", RunStage.BROADCAST_SENT, {"meta": None})
+    assert store.get_run("run-1") == moved
+    with pytest.raises(RunStateError, match="Run not found"):
+        store.transition_run("missing", RunStage.SEND_REQUESTED)
+
+
+def test_backup_includes_writes_still_in_the_wal(tmp_path: Path) -> None:
+    store = RunStateStore(tmp_path / "run_state.db")
+    store.initialize()
+    store.create_run("run-1")
+    store.transition_run("run-1", RunStage.SEND_REQUESTED)
+
+    backup_path = tmp_path / "run_state.db.bak"
+    store.backup(backup_path)
+
+    with sqlite3.connect(backup_path) as conn:
+        rows = conn.execute("SELECT run_id, stage FROM run_ledger").fetchall()
+    assert rows == [("run-1", RunStage.SEND_REQUESTED.value)]
@@ -32,3 +32,20 @@ def test_patch_run_payload_merges_values(tmp_path: Path) -> None:
 
     payload = json.loads(updated.payload_json)
     assert payload == {"a": 1, "b": 2}
+
+
+def test_initialize_clears_stale_lock_but_keeps_fresh_one(tmp_path: Path) -> None:
+    import sqlite3
+
+    db_path = tmp_path / "state.db"
+    store = RunStateStore(db_path)
+    store.initialize()
+    assert store.try_acquire_run_lock("run-1") is True
+
+    store.initialize()
+    assert store.get_locked_run_id() == "run-1"
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE run_lock SET acquired_at = '2000-01-01T00:00:00+00:00'")
+    store.initialize()
+    assert store.get_locked_run_id() is None
@@ -60,3 +60,26 @@ def test_sender_live_mode_calls_client(app_config: Any) -> None:
 
     status = sender.get_broadcast(broadcast_id=created.broadcast_id)
     assert status["status"] == "queued"
+
+
+def test_sender_dry_run_does_not_load_resend_sdk(app_config: Any, monkeypatch: Any) -> None:
+    import importlib
+
+    def _fail_import(name: str) -> Any:
+        raise AssertionError(f"unexpected import of {name}")
+
+    monkeypatch.setattr(importlib, "import_module", _fail_import)
+    sender = ResendSender(app_config)
+
+    created = sender.create_broadcast(
+        audience_id=app_config.resend_audience_id,
+        from_email=app_config.newsletter_from_email,
+        subject="Subject",
+        html="<p>html</p>",
+    )
+    assert created.raw_response == {
+        "id": "dry-run-broadcast",
+        "subject": "Subject",
+        "dry_run": True,
+    }
+    assert sender.get_broadcast(broadcast_id=created.broadcast_id)["status"] == "dry_run"
@@ -0,0 +1,69 @@
+"""Tests for pooled Slack message poster."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+import requests
+
+from services.resilience import ExternalServiceError
+from services.slack_poster import SLACK_POST_MESSAGE_URL, SlackPoster
+
+
+class _FakeResponse:
+    def __init__(self, body: dict[str, Any]) -> None:
+        self._body = body
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> dict[str, Any]:
+        return self._body
+
+
+class _FakeSession(requests.Session):
+    def __init__(self, body: dict[str, Any]) -> None:
+        super().__init__()
+        self._body = body
+        self.posts: list[tuple[str, dict[str, Any]]] = []
+        self.sent_headers: list[dict[str, str]] = []
+
+    def post(self, url: str, **kwargs: Any) -> Any:  # type: ignore[override]
+        self.posts.append((url, kwargs["json"]))
+        self.sent_headers.append(kwargs["headers"])
+        return _FakeResponse(self._body)
+
+
+def test_slack_poster_reuses_session_and_returns_body() -> None:
+    session = _FakeSession({"ok": True, "ts": "1.0"})
+    poster = SlackPoster("xoxb-test", session=session)
+
+    first = poster.chat_postMessage(channel="C1", text="hello")
+    poster.chat_postMessage(channel="C1", text="again", thread_ts="1.0")
+
+    assert first["ts"] == "1.0"
+    assert session.sent_headers == [{"Authorization": "Bearer xoxb-test"}] * 2
+    assert "Authorization" not in session.headers
+    assert [url for url, _ in session.posts] == [SLACK_POST_MESSAGE_URL] * 2
+    assert session.posts[1][1] == {"channel": "C1", "text": "again", "thread_ts": "1.0"}
+
+
+def test_slack_poster_raises_on_api_error() -> None:
+    session = _FakeSession({"ok": False, "error": "not_in_channel"})
+    poster = SlackPoster("xoxb-test", session=session)
+
+    with pytest.raises(ExternalServiceError, match="not_in_channel"):
+        poster.chat_postMessage(channel="C1", text="hello")
+
+
+def test_slack_poster_leaves_injected_session_adapters_alone() -> None:
+    from requests.adapters import HTTPAdapter
+
+    session = _FakeSession({"ok": True})
+    retrying_adapter = HTTPAdapter(max_retries=5)
+    session.mount("https://", retrying_adapter)
+
+    SlackPoster("xoxb-test", session=session)
+
+    assert session.get_adapter(SLACK_POST_MESSAGE_URL) is retrying_adapter
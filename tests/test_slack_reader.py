@@ -47,3 +47,52 @@ def test_collect_weekly_updates_includes_thread_replies(app_config: Any) -> None
     assert len(updates) == 1
     assert updates[0].text == "Top-level update"
     assert updates[0].thread_replies == ("clarification reply",)
+
+
+def test_fetch_channel_messages_follows_cursors_with_large_pages(app_config: Any) -> None:
+    calls: list[dict[str, Any]] = []
+
+    class _PagedClient:
+        def conversations_history(self, **kwargs: Any) -> dict[str, Any]:
+            calls.append(kwargs)
+            if kwargs["cursor"] is None:
+                return {"messages": [{"ts": "1.0"}], "response_metadata": {"next_cursor": "c2"}}
+            return {"messages": [{"ts": "2.0"}], "response_metadata": {"next_cursor": ""}}
+
+    reader = SlackReader(app_config)
+    reader._client = _PagedClient()  # type: ignore[assignment]
+
+    messages = reader.fetch_channel_messages(channel_id="C1", oldest_ts="0", latest_ts="9")
+
+    assert [m["ts"] for m in messages] == ["1.0", "2.0"]
+    assert [call["cursor"] for call in calls] == [None, "c2"]
+    assert all(call["limit"] == 999 for call in calls)
+
+
+def test_collect_weekly_updates_fetches_replies_per_thread_in_channel_order(
+    app_config: Any,
+) -> None:
+    class _ManyThreadsClient(_FakeSlackClient):
+        def conversations_history(self, **_: Any) -> dict[str, Any]:
+            return {
+                "messages": [
+                    {"ts": f"{i}.0", "thread_ts": f"{i}.0", "reply_count": 1, "text": f"u{i}"}
+                    for i in range(1, 6)
+                ],
+                "response_metadata": {"next_cursor": ""},
+            }
+
+        def conversations_replies(self, **kwargs: Any) -> dict[str, Any]:
+            return {"messages": [{"ts": "9.9", "text": f"reply to {kwargs['ts']}"}]}
+
+    reader = SlackReader(app_config)
+    reader._client = _ManyThreadsClient()  # type: ignore[assignment]
+
+    updates = reader.collect_weekly_updates(
+        channel_id=app_config.newsletter_channel_id,
+        start_at=datetime.now(UTC) - timedelta(days=7),
+        end_at=datetime.now(UTC),
+    )
+
+    assert [u.text for u in updates] == ["u1", "u2", "u3", "u4", "u5"]
+    assert [u.thread_replies for u in updates] == [(f"reply to {i}.0",) for i in range(1, 6)]
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from typing import Any
+
 import pytest
 
+from services import schemas
 from services.validator import (
     ContentValidationError,
     extract_json_payload,
     validate_https_links,
     validate_json_payload,
     validate_rendered_html,
+    validate_rendered_html_stream,
 )
 
 
@@ -57,6 +62,44 @@ def test_extract_json_payload_with_escaped_quotes() -> None:
     assert payload["text"] == 'He said "hello" today'
 
 
+def test_extract_json_payload_ignores_escaped_braces_in_wrapped_text() -> None:
+    text = 'Result: {"text": "a \\"}\\" b \\\\", "n": {"m": 1}} done'
+    payload = extract_json_payload(text)
+    assert payload == {"text": 'a "}" b \\', "n": {"m": 1}}
+
+
+def test_extract_json_payload_accepts_values_outside_orjson_range() -> None:
+    big = 2**70
+    payload = extract_json_payload(f'note {{"n": {big}, "s": "\\ud800"}} {{"b": 1}}')
+    assert payload == {"n": big, "s": "\ud800"}
+
+
+def test_extract_json_payload_skips_many_invalid_brace_blocks() -> None:
+    text = "{x} " * 5000 + '{"a": 1}'
+    payload = extract_json_payload(text)
+    assert payload == {"a": 1}
+
+
+def test_extract_json_payload_repairs_trailing_commas() -> None:
+    payload = extract_json_payload('{"items": [1, 2,], "cta": {"text": "x",},}')
+    assert payload == {"items": [1, 2], "cta": {"text": "x"}}
+
+
+def test_extract_json_payload_repairs_control_characters() -> None:
+    payload = extract_json_payload('Plan: {"title": "line one\nline two",\x00 "items": [1,],}')
+    assert payload == {"title": "line one\nline two", "items": [1]}
+
+
+def test_extract_json_payload_rejects_truncated_output() -> None:
+    with pytest.raises(ContentValidationError, match="No JSON object"):
+        extract_json_payload('Plan: {"title": "line one", "items": [{"a": "cut')
+
+
+def test_extract_json_payload_rejects_mismatched_brackets() -> None:
+    with pytest.raises(ContentValidationError):
+        extract_json_payload('{"items": [1, 2}')
+
+
 def test_extract_json_payload_raises_for_invalid() -> None:
     with pytest.raises(ContentValidationError):
         extract_json_payload("no json here")
@@ -66,6 +109,118 @@ def test_validate_json_payload_with_minimal_schema() -> None:
     validate_json_payload({"a": "x"}, {"type": "object", "required": ["a"]})
 
 
+def test_validate_json_payload_reports_path_with_reused_validator() -> None:
+    schema: dict[str, Any] = {
+        "type": "object",
+        "properties": {"items": {"type": "array", "items": {"type": "string"}}},
+    }
+    validate_json_payload({"items": ["ok"]}, schema)
+
+    with pytest.raises(ContentValidationError, match="at items.1"):
+        validate_json_payload({"items": ["ok", 2]}, schema)
+
+
+def test_fast_schema_check_agrees_with_jsonschema_on_newsletter_payloads() -> None:
+    from jsonschema.validators import validator_for
+
+    from services.schemas import NEWSLETTER_SCHEMA, PLANNER_SCHEMA
+    from services.validator import _compile_fast_check
+
+    assert _compile_fast_check(PLANNER_SCHEMA) is not None
+    fast_check = _compile_fast_check(NEWSLETTER_SCHEMA)
+    assert fast_check is not None
+    reference = validator_for(NEWSLETTER_SCHEMA)(NEWSLETTER_SCHEMA)
+
+    story = {
+        "headline": "h",
+        "hook": "x",
+        "why_it_matters": "y",
+        "source_url": "https://example.com",
+        "source_name": "s",
+        "published_at": "2026-02-27",
+        "confidence": "high",
+    }
+    payload = {
+        "newsletter_name": "n",
+        "issue_date": "d",
+        "subject_line": "s",
+        "preheader": "p",
+        "intro": "i",
+        "team_updates": [{"title": "t", "summary": "s"}],
+        "industry_stories": [story],
+        "cta": {"text": "a", "url": "https://example.com"},
+    }
+    variants: list[dict[str, Any]] = [
+        payload,
+        {**payload, "extra": 1},
+        {**payload, "industry_stories": []},
+        {**payload, "industry_stories": [story] * 9},
+        {**payload, "industry_stories": [{**story, "confidence": "certain"}]},
+        {**payload, "industry_stories": [{**story, "confidence": 1}]},
+        {**payload, "team_updates": ({"title": "t", "summary": "s"},)},
+        {**payload, "cta": {"text": "a"}},
+        {**payload, "intro": None},
+    ]
+    for variant in variants:
+        assert fast_check(variant) == reference.is_valid(variant)
+
+    with pytest.raises(ContentValidationError, match="at industry_stories.0.confidence"):
+        validate_json_payload(variants[4], NEWSLETTER_SCHEMA)
+
+
+def _sample_instance(schema: dict[str, Any]) -> Any:
+    """Build the smallest instance that fills every declared field of ``schema``."""
+    if "enum" in schema:
+        return schema["enum"][0]
+    if schema["type"] == "object":
+        return {name: _sample_instance(sub) for name, sub in schema["properties"].items()}
+    if schema["type"] == "array":
+        return [_sample_instance(schema["items"])] * max(schema.get("minItems", 0), 1)
+    return {"string": "x", "boolean": True}[schema["type"]]
+
+
+def _schema_variants(schema: dict[str, Any], instance: Any) -> Iterator[Any]:
+    """Yield ``instance`` and single-edit mutations of it, nested ones included."""
+    yield instance
+    yield None
+    yield 1
+    if "enum" in schema:
+        yield "not-an-enum-value"
+    elif schema["type"] == "object":
+        yield {**instance, "unexpected": "x"}
+        for name in schema.get("required", []):
+            yield {key: value for key, value in instance.items() if key != name}
+        for name, subschema in schema["properties"].items():
+            for variant in _schema_variants(subschema, instance[name]):
+                yield {**instance, name: variant}
+    elif schema["type"] == "array":
+        yield []
+        yield tuple(instance)
+        yield instance * (schema.get("maxItems", 1) + 1)
+        for variant in _schema_variants(schema["items"], instance[0]):
+            yield [variant, *instance[1:]]
+
+
+@pytest.mark.parametrize(
+    "schema_name", sorted(name for name in vars(schemas) if name.endswith("_SCHEMA"))
+)
+def test_fast_schema_check_agrees_with_jsonschema_for_every_project_schema(
+    schema_name: str,
+) -> None:
+    from jsonschema.validators import validator_for
+
+    from services.validator import _compile_fast_check
+
+    schema: dict[str, Any] = getattr(schemas, schema_name)
+    # None means a keyword outside the fast subset crept into the schema.
+    fast_check = _compile_fast_check(schema)
+    assert fast_check is not None
+    reference = validator_for(schema)(schema)
+
+    for variant in _schema_variants(schema, _sample_instance(schema)):
+        assert fast_check(variant) == reference.is_valid(variant), variant
+
+
 def test_validate_https_links_flags_non_https() -> None:
     errors = validate_https_links({"cta": {"url": "http://example.com"}})
     assert errors
@@ -75,3 +230,18 @@ def test_validate_rendered_html_checks_unsubscribe_and_links() -> None:
     errors = validate_rendered_html("<html><body><a href='http://bad.com'>x</a></body></html>")
     assert any("unsubscribe" in error.lower() for error in errors)
     assert any("invalid anchor" in error.lower() for error in errors)
+
+
+def test_validate_rendered_html_stream_handles_split_chunks() -> None:
+    chunks = [
+        "<html><body><h2>This Week",
+        " in AI</h2><a hr",
+        "ef='https://example.com/a'>a</a><a href='{{{RESEND_UNSUB",
+        "SCRIBE_URL}}}'>unsubscribe</a></body></html>",
+    ]
+
+    html, errors = validate_rendered_html_stream(iter(chunks))
+
+    assert html == "".join(chunks)
+    assert errors == []
+    assert validate_rendered_html(html) == []
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import replace
 from typing import Any
 
@@ -73,7 +74,13 @@ def test_writer_failure_writes_dead_letter(app_config: Any) -> None:
         )
 
     assert exc_info.value.dead_letter_path.exists()
-    assert '"stage": "writer"' in exc_info.value.dead_letter_path.read_text(encoding="utf-8")
+    body = exc_info.value.dead_letter_path.read_text(encoding="utf-8")
+    assert '"stage": "writer"' in body
+    assert json.loads(body)["input_payload"] == {
+        "issue_date": "2026-02-27",
+        "newsletter_name": "AI Weekly",
+        "plan": {},
+    }
 
 
 def test_writer_revise_newsletter_returns_valid_json(app_config: Any) -> None:
@@ -154,3 +161,4 @@ def test_writer_prompt_includes_new_voice_contract(app_config: Any) -> None:
     assert "sharp, well-read friend" in prompt
     assert "BANNED WORDS" in prompt
     assert "Punch up at hype and absurd trends" in prompt
+    assert 'INPUT:\n{"issue_date":"2026-02-27","newsletter_name":"AI Weekly"' in prompt